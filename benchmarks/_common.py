@@ -0,0 +1,36 @@
+# benchmarks\_common.py
+"""Shared helpers for the benchmark scripts (path setup, timing summaries)."""
+
+import os
+import statistics
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# the graph modules import both `logger.logger` and `src.logger.logger`
+for p in (ROOT / "src", ROOT):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (``pct`` in 0‥100)."""
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[idx]
+
+
+def summarize(label: str, samples: list[float], unit: str = "ms", scale: float = 1e3) -> str:
+    """One-line mean / p50 / p95 summary of ``samples`` given in seconds."""
+    return (
+        f"{label:<28} n={len(samples):<6} "
+        f"mean={statistics.fmean(samples) * scale:9.3f}{unit}  "
+        f"p50={percentile(samples, 50) * scale:9.3f}{unit}  "
+        f"p95={percentile(samples, 95) * scale:9.3f}{unit}"
+    )
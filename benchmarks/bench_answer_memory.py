@@ -0,0 +1,116 @@
+# benchmarks\bench_answer_memory.py
+"""
+Human round trips saved by the cross-thread answer memory.
+
+A handful of users each start several threads of ``parent_graph`` (fake
+model; the specialists ``ask_user`` for their value) and every interrupt is
+answered like a client would. Runs once without and once with
+``ANSWER_MEMORY_PATH=:memory:`` – the memory is wired at import time, so each
+mode runs in its own interpreter – and reports the interrupts per thread
+(``BATCH_QUESTIONS=1`` is honoured: the form counts as one interrupt),
+the memory hit rate and the time per thread. Every thread must still end
+with the user's answers.
+
+    python benchmarks/bench_answer_memory.py --users 5 --threads 10
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+import _common  # noqa: F401 – sys.path setup
+
+
+def _answers(user: int) -> dict[str, str]:
+    return {"color": f"colour-{user}", "speed": f"speed-{user}"}
+
+
+def _reply(value, answers: dict[str, str]):
+    from helpers.questions import FORM_TYPE
+
+    if isinstance(value, dict) and value.get("type") == FORM_TYPE:  # BATCH_QUESTIONS=1
+        return {q["key"]: answers[q["key"]] for q in value["questions"]}
+    return answers["speed" if "speed" in str(value) else "color"]
+
+
+def worker(users: int, threads: int) -> dict:
+    from fake_policy import asking_responder
+    from langgraph.checkpoint.memory import InMemorySaver
+    from langgraph.types import Command
+
+    from helpers import answer_memory
+    from helpers.fake_llm import FakeChatModel
+    from helpers.models import DEFAULT_MODEL, register_chat_model
+
+    register_chat_model(DEFAULT_MODEL, FakeChatModel(responder=asking_responder))
+    import graph as parent_module  # imported after the override so every node uses the fake
+
+    # seed 1: `ensure_defaults` leaves both fields empty
+    parent_module.random = defaults = random.Random()
+    graph = parent_module.parent.compile(checkpointer=InMemorySaver())
+
+    interrupts = 0
+    correct = True
+    t0 = time.perf_counter()
+    for thread in range(threads):
+        for user in range(users):
+            defaults.seed(1)
+            answers = _answers(user)
+            config = {"configurable": {"thread_id": f"u{user}-t{thread}", "user_id": f"user-{user}"}}
+            data = {"messages": [{"role": "user", "content": "Describe the car."}]}
+            while True:
+                graph.invoke(data, config)
+                pending = graph.get_state(config).interrupts
+                if not pending:
+                    break
+                interrupts += len(pending)
+                data = Command(resume={item.interrupt_id: _reply(item.value, answers) for item in pending})
+            final = graph.get_state(config).values
+            correct &= all(final[k] == v for k, v in answers.items())
+    elapsed = time.perf_counter() - t0
+
+    runs = users * threads
+    return {
+        "interrupts": interrupts / runs,
+        "hit_rate": answer_memory.hit_rate(),
+        "thread_ms": elapsed / runs * 1e3,
+        "correct": correct,
+    }
+
+
+def bench(users: int, threads: int, memory: bool) -> dict:
+    env = dict(os.environ)
+    env.pop("ANSWER_MEMORY_PATH", None)
+    if memory:
+        env["ANSWER_MEMORY_PATH"] = ":memory:"
+    out = subprocess.run(
+        [sys.executable, __file__, "--worker", "--users", str(users), "--threads", str(threads)],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=10, help="threads per user")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.users, args.threads)))
+        return
+
+    print(f"{'memory':<8} {'interrupts/thread':>18} {'hit rate':>9} {'ms/thread':>10} {'answers ok':>11}")
+    for memory in (False, True):
+        r = bench(args.users, args.threads, memory)
+        print(f"{'on' if memory else 'off':<8} {r['interrupts']:>18.2f} {r['hit_rate']:>9.2f} "
+              f"{r['thread_ms']:>10.2f} {str(r['correct']):>11}")
+
+
+if __name__ == "__main__":
+    main()
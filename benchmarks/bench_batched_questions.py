@@ -0,0 +1,123 @@
+# benchmarks\bench_batched_questions.py
+"""
+Human-in-the-loop cost per run: one interrupt per question vs. one batched form.
+
+Runs ``parent_graph`` with an ``InMemorySaver`` against a fake model whose
+specialists ``ask_user`` for their value, and answers every interrupt the
+way a client would (a resume map per pause, or the combined form), until
+the run finishes. Once with ``BATCH_QUESTIONS=0`` and once with ``=1``; the
+flag is read at import time, so each mode runs in its own interpreter.
+Reports client round trips (pauses), interrupts, checkpoints written,
+model calls and time per run, and checks both fields got the answers.
+
+    python benchmarks/bench_batched_questions.py --runs 20
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+import _common  # noqa: F401 – sys.path setup
+
+ANSWERS = {"color": "teal", "speed": "brisk"}
+
+
+def _answer(value) -> str:
+    # a collector's own question names its field ("What colour …", "What speed …")
+    text = str(value).lower()
+    return ANSWERS["speed" if "speed" in text else "color"]
+
+
+def worker(runs: int) -> dict:
+    from fake_policy import asking_responder
+    from langgraph.checkpoint.memory import InMemorySaver
+    from langgraph.types import Command
+
+    from helpers.fake_llm import FakeChatModel
+    from helpers.models import DEFAULT_MODEL, register_chat_model
+    from helpers.questions import FORM_TYPE
+
+    calls = [0]
+
+    def responder(messages, tools):
+        calls[0] += 1
+        return asking_responder(messages, tools)
+
+    register_chat_model(DEFAULT_MODEL, FakeChatModel(responder=responder))
+    import graph as parent_module  # imported after the override so every node uses the fake
+
+    # same `ensure_defaults` draws in both modes (seed 1: both fields empty)
+    parent_module.random = defaults = random.Random()
+    saver = InMemorySaver()
+    graph = parent_module.parent.compile(checkpointer=saver)
+
+    pauses = interrupts = 0
+    correct = True
+    t0 = time.perf_counter()
+    for run in range(runs):
+        defaults.seed(1)
+        config = {"configurable": {"thread_id": f"run-{run}"}}
+        data = {"messages": [{"role": "user", "content": "Describe the car."}]}
+        while True:
+            graph.invoke(data, config)
+            pending = graph.get_state(config).interrupts
+            if not pending:
+                break
+            pauses += 1
+            interrupts += len(pending)
+            resume = {}
+            for item in pending:
+                if isinstance(item.value, dict) and item.value.get("type") == FORM_TYPE:
+                    resume[item.interrupt_id] = {q["key"]: ANSWERS[q["key"]] for q in item.value["questions"]}
+                else:
+                    resume[item.interrupt_id] = _answer(item.value)
+            data = Command(resume=resume)
+        final = graph.get_state(config).values
+        correct &= all(final[k] == v for k, v in ANSWERS.items())
+    elapsed = (time.perf_counter() - t0) / runs
+
+    checkpoints = sum(len(saved) for ns in saver.storage.values() for saved in ns.values())
+    return {
+        "pauses": pauses / runs,
+        "interrupts": interrupts / runs,
+        "checkpoints": checkpoints / runs,
+        "model_calls": calls[0] / runs,
+        "run_ms": elapsed * 1e3,
+        "correct": correct,
+    }
+
+
+def bench(runs: int, batched: bool) -> dict:
+    env = {**os.environ, "BATCH_QUESTIONS": "1" if batched else "0"}
+    out = subprocess.run(
+        [sys.executable, __file__, "--worker", "--runs", str(runs)],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.runs)))
+        return
+
+    print(f"{'mode':<10} {'pauses':>7} {'interrupts':>11} {'checkpoints':>12} "
+          f"{'model calls':>12} {'run (ms)':>9} {'answers ok':>11}")
+    for batched in (False, True):
+        r = bench(args.runs, batched)
+        print(f"{'batched' if batched else 'per-tool':<10} {r['pauses']:>7.1f} {r['interrupts']:>11.1f} "
+              f"{r['checkpoints']:>12.1f} {r['model_calls']:>12.1f} {r['run_ms']:>9.2f} "
+              f"{str(r['correct']):>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# benchmarks\bench_cassette.py
+"""
+Replay a recorded model cassette through ``graph`` as a regression workload.
+
+Records once – with the real model when ``--cassette`` names a recording made
+via ``LLM_CASSETTE_MODE=record``, otherwise with the fake model at
+``--latency`` as a stand-in – one plain and one ``ask_user`` thread, then
+replays the same threads ``--runs`` times at full speed. Recording and
+replay each run in their own interpreter (the supervisor binds its model at
+import). Reports the recorded and the replayed wall time per workload, the
+calls served from the cassette, and whether replay matched it exactly;
+a last replay with a changed user message must be flagged as a divergence.
+
+    python benchmarks/bench_cassette.py --runs 50
+    python benchmarks/bench_cassette.py --cassette .cache/prod.jsonl.gz --runs 200
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import _common  # noqa: F401 – sys.path setup
+from _common import percentile
+
+ANSWERS = {"color": "teal", "speed": "brisk"}
+# (thread, ask_user?) – the workload that is recorded and replayed
+THREADS = (("plain", False), ("asking", True))
+PROMPT = "Describe the car."
+
+
+def _run_threads(graph, parent_module, seed: int, policy: dict | None = None, prompt: str = PROMPT) -> None:
+    from langgraph.types import Command
+
+    from helpers.questions import FORM_TYPE
+
+    for thread, ask in THREADS:
+        if policy is not None:
+            policy["ask"] = ask
+        parent_module.random.seed(seed)
+        config = {"configurable": {"thread_id": f"{thread}-{time.perf_counter_ns()}"}}
+        data = {"messages": [{"role": "user", "content": prompt}]}
+        while True:
+            graph.invoke(data, config)
+            pending = graph.get_state(config).interrupts
+            if not pending:
+                break
+            resume = {}
+            for item in pending:
+                if isinstance(item.value, dict) and item.value.get("type") == FORM_TYPE:
+                    resume[item.interrupt_id] = {q["key"]: ANSWERS[q["key"]] for q in item.value["questions"]}
+                else:
+                    resume[item.interrupt_id] = ANSWERS["speed" if "speed" in str(item.value) else "color"]
+            data = Command(resume=resume)
+
+
+def _graph():
+    from langgraph.checkpoint.memory import InMemorySaver
+
+    import graph as parent_module  # imported after the override so every node uses it
+
+    parent_module.random = random.Random()
+    return parent_module.parent.compile(checkpointer=InMemorySaver()), parent_module
+
+
+def record(path: str, latency: str, seed: int) -> dict:
+    from fake_policy import car_graph_responder
+
+    from helpers import cassette
+    from helpers.fake_llm import FakeChatModel, Latency
+    from helpers.models import DEFAULT_MODEL, register_chat_model
+
+    policy = {"ask": False}
+    register_chat_model(DEFAULT_MODEL, FakeChatModel(
+        responder=lambda messages, tools: car_graph_responder(messages, tools, ask=policy["ask"]),
+        latency=Latency.parse(latency),
+        seed=seed,
+    ))
+    recorder = cassette.install(path, "record")
+    graph, parent_module = _graph()
+    t0 = time.perf_counter()
+    _run_threads(graph, parent_module, seed, policy)
+    elapsed = time.perf_counter() - t0
+    recorder.close()
+    return {"workload_ms": elapsed * 1e3}
+
+
+def replay(path: str, runs: int, seed: int) -> dict:
+    from helpers import cassette
+
+    model = cassette.install(path, "replay")
+    graph, parent_module = _graph()
+    walls, replayed, exact = [], 0, True
+    for _ in range(runs):
+        model.rewind()
+        t0 = time.perf_counter()
+        _run_threads(graph, parent_module, seed)
+        walls.append(time.perf_counter() - t0)
+        replayed += model.replayed
+        try:
+            model.check()
+        except cassette.CassetteDivergence as err:
+            exact = False
+            print(err, file=sys.stderr)
+
+    model.rewind()
+    try:
+        _run_threads(graph, parent_module, seed, prompt=PROMPT + " Quickly, please.")
+        detected = bool(model.unused())
+    except cassette.CassetteDivergence:
+        detected = True
+
+    return {
+        "calls": model.recorded,
+        "replayed": replayed / runs,
+        "p50_ms": percentile(walls, 50) * 1e3,
+        "p95_ms": percentile(walls, 95) * 1e3,
+        "exact": exact,
+        "divergence_detected": detected,
+    }
+
+
+def _worker(*args: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, __file__, "--worker", *args],
+        env=os.environ, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cassette", help="existing cassette to replay (default: record one with the fake model)")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--latency", default="lognormal:0.05,0.5", help="fake model latency while recording")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--worker", choices=("record", "replay"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker == "record":
+        print(json.dumps(record(args.cassette, args.latency, args.seed)))
+        return
+    if args.worker == "replay":
+        print(json.dumps(replay(args.cassette, args.runs, args.seed)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path, recorded = args.cassette, None
+        if path is None:
+            path = str(Path(tmp) / "bench.jsonl.gz")
+            recorded = _worker("record", "--cassette", path, "--latency", args.latency, "--seed", str(args.seed))
+        r = _worker("replay", "--cassette", path, "--runs", str(args.runs), "--seed", str(args.seed))
+        size = Path(path).stat().st_size
+
+    print(f"cassette: {r['calls']} calls, {size / 1024:.1f} KiB")
+    if recorded:
+        print(f"{'recorded (fake ' + args.latency + ')':<34} workload={recorded['workload_ms']:9.2f}ms")
+    print(f"{'replayed (' + str(args.runs) + ' runs)':<34} p50={r['p50_ms']:9.2f}ms  p95={r['p95_ms']:9.2f}ms  "
+          f"calls/run={r['replayed']:.1f}")
+    print(f"{'exact replay':<34} {r['exact']}")
+    print(f"{'changed prompt flagged':<34} {r['divergence_detected']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmarks\bench_checkpoint_arena.py
+"""
+Checkpoint size per thread with and without the message arena.
+
+Runs ``parent_graph`` for a few threads of several turns each against a fake
+model, once with a plain ``InMemorySaver`` and once with
+``InMemorySaver(serde=ArenaSerializer())``, and reports the bytes the saver
+holds per thread – channel blobs, checkpoints + metadata, pending writes –
+plus the arena itself. Both runs use the same random seed, and the final
+states are checked to be identical.
+
+    python benchmarks/bench_checkpoint_arena.py --threads 5 --turns 5
+"""
+
+import argparse
+import random
+import time
+
+import _common  # noqa: F401 – sys.path setup
+from fake_policy import car_graph_responder
+from langgraph.checkpoint.memory import InMemorySaver
+
+from helpers.fake_llm import FakeChatModel
+from helpers.models import DEFAULT_MODEL, register_chat_model
+from state.arena import ArenaSerializer
+
+
+def _load_parent():
+    register_chat_model(DEFAULT_MODEL, FakeChatModel(responder=car_graph_responder))
+    from graph import parent  # imported after the override so every node uses the fake
+
+    return parent
+
+
+def _saver_bytes(saver: InMemorySaver) -> tuple[int, int, int]:
+    blobs = sum(len(data) for _, data in saver.blobs.values())
+    checkpoints = sum(
+        len(checkpoint[1]) + len(metadata[1])
+        for namespaces in saver.storage.values()
+        for saved in namespaces.values()
+        for checkpoint, metadata, _ in saved.values()
+    )
+    writes = sum(len(write[2][1]) for pending in saver.writes.values() for write in pending.values())
+    return blobs, checkpoints, writes
+
+
+def run(parent, serde, threads: int, turns: int) -> tuple[InMemorySaver, list, float]:
+    random.seed(0)
+    saver = InMemorySaver(serde=serde)
+    graph = parent.compile(checkpointer=saver)
+    finals = []
+    t0 = time.perf_counter()
+    for thread in range(threads):
+        config = {"configurable": {"thread_id": f"t{thread}"}}
+        for turn in range(turns):
+            graph.invoke({"messages": [{"role": "user", "content": f"Describe the car ({turn})."}]}, config)
+        finals.append(graph.get_state(config).values)
+    return saver, finals, time.perf_counter() - t0
+
+
+def _same(a: list, b: list) -> bool:
+    def strip(values: dict) -> dict:
+        # message ids are fresh uuids on every run
+        return {
+            k: [(m.type, m.content) for m in v] if k.startswith("messages") else v
+            for k, v in values.items()
+        }
+
+    return [strip(v) for v in a] == [strip(v) for v in b]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=5)
+    parser.add_argument("--turns", type=int, default=5)
+    args = parser.parse_args()
+
+    parent = _load_parent()
+    plain, plain_finals, plain_time = run(parent, None, args.threads, args.turns)
+    serde = ArenaSerializer()
+    arena, arena_finals, arena_time = run(parent, serde, args.threads, args.turns)
+
+    print(f"{'saver':<8} {'blobs':>9} {'ckpt+meta':>10} {'writes':>9} {'arena':>8} "
+          f"{'KiB/thread':>11} {'run (s)':>8}")
+    for name, saver, extra, elapsed in (
+        ("plain", plain, 0, plain_time),
+        ("arena", arena, serde.arena.nbytes(), arena_time),
+    ):
+        parts = _saver_bytes(saver)
+        total = sum(parts) + extra
+        print(f"{name:<8} {parts[0]:>9} {parts[1]:>10} {parts[2]:>9} {extra:>8} "
+              f"{total / 1024 / args.threads:>11.1f} {elapsed:>8.2f}")
+    print(f"distinct messages in arena: {serde.arena.size()}, "
+          f"final states identical: {_same(plain_finals, arena_finals)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# benchmarks\bench_compaction.py
+"""
+Prompt size of a collector LLM call vs. the length of its clarification loop.
+
+Builds ``messagesColor`` threads with N rounds of ``ask_user`` → vague
+answer, then measures the tokens (``count_tokens_approximately``) and the
+time ``compact_history`` takes for the request ``ask_for_colour`` would
+send, with and without a token budget.
+
+    python benchmarks/bench_compaction.py --budget 2000
+"""
+
+import argparse
+import time
+
+import _common  # noqa: F401 – sys.path setup
+from langchain_core.messages import AIMessage, SystemMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+from helpers import metrics
+from helpers.compaction import compact_history
+from subgraph_color import _SYSTEM_PROMPT
+
+
+def _thread(rounds: int) -> list:
+    messages = []
+    for i in range(rounds):
+        call = {"name": "ask_user_color", "args": {"question": "What colour should the car be?"},
+                "id": f"call_{i}"}
+        messages += [
+            AIMessage(content="", tool_calls=[call]),
+            ToolMessage(content=f"hmm, something like shade number {i}, not sure yet",
+                        name="ask_user_color", tool_call_id=f"call_{i}"),
+        ]
+    return messages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget", type=int, default=2000)
+    args = parser.parse_args()
+
+    prefix = [SystemMessage(content=_SYSTEM_PROMPT)]
+    print(f"{'rounds':>7} {'full tokens':>12} {'compacted':>10} {'saved':>7} {'µs/call':>8}")
+    for rounds in (5, 25, 100, 400):
+        thread = _thread(rounds)
+        full = count_tokens_approximately(prefix + thread)
+        t0 = time.perf_counter()
+        compacted = compact_history(thread, args.budget, prefix=prefix, agent="bench")
+        elapsed = time.perf_counter() - t0
+        tokens = count_tokens_approximately(compacted)
+        print(f"{rounds:>7} {full:>12} {tokens:>10} {full - tokens:>7} {elapsed * 1e6:>8.0f}")
+    print(f"history_tokens_saved_total = {metrics.get('history_tokens_saved_total'):.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+# benchmarks\bench_e2e.py
+"""
+End-to-end benchmark of ``graph`` (``src/graph.py``) against the offline fake model.
+
+Every LLM call of the supervisor, both collectors and the structured
+extraction is answered by ``FakeChatModel`` (``fake_policy``), with a
+configurable latency distribution, so the numbers show the graph's own
+overhead – or, with realistic latencies, how it behaves under them. Runs use
+an ``InMemorySaver``; in the ``asking`` scenario the collectors ``ask_user``
+and every ``interrupt`` is resumed with a scripted answer, the way a client
+would.
+
+Per scenario:
+
+• per node – wall time of every node execution (callbacks; subgraph nodes
+  are qualified by their parents), supersteps and LLM calls / tokens per run;
+• allocations – ``tracemalloc`` peak and retained bytes per run (separate
+  pass, tracing slows everything down);
+• throughput – sequential ``invoke`` and concurrent ``ainvoke`` runs/s,
+  without callbacks.
+
+    python benchmarks/bench_e2e.py --runs 50 --latency 0
+    python benchmarks/bench_e2e.py --scenario asking --latency lognormal:0.05,0.5 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Any
+from uuid import UUID
+
+import _common  # noqa: F401 – sys.path setup
+from _common import summarize
+from fake_policy import car_graph_responder
+from langchain_core.callbacks import BaseCallbackHandler
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.types import Command
+
+from helpers.fake_llm import FakeChatModel, Latency
+from helpers.models import DEFAULT_MODEL, register_chat_model
+
+INPUT = {"messages": [{"role": "user", "content": "Describe the car."}]}
+ANSWERS = {"color": "teal", "speed": "brisk"}
+SCENARIOS = ("auto", "asking")
+
+
+class NodeTimer(BaseCallbackHandler):
+    """Wall time per node execution, supersteps and LLM usage, from LangChain callbacks."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started: dict[UUID, tuple[str, float]] = {}
+        self.nodes: dict[str, list[float]] = defaultdict(list)
+        self.steps: set[tuple[str, int]] = set()
+        self.llm_calls = 0
+        self.tokens = 0
+
+    def on_chain_start(self, serialized, inputs, *, run_id, tags=None, metadata=None, **kwargs) -> None:
+        # node executions are the runs LangGraph tags with their superstep
+        if not any(tag.startswith("graph:step:") for tag in tags or ()):
+            return
+        metadata = metadata or {}
+        path = [seg.partition(":")[0] for seg in metadata.get("langgraph_checkpoint_ns", "").split("|")]
+        with self._lock:
+            self.steps.add(("/".join(path[:-1]), metadata.get("langgraph_step", 0)))
+            self._started[run_id] = ("/".join(path), time.perf_counter())
+
+    def take_steps(self) -> int:
+        """Distinct supersteps (per graph namespace) since the last call."""
+        with self._lock:
+            steps, self.steps = len(self.steps), set()
+        return steps
+
+    def _end(self, run_id: UUID) -> None:
+        with self._lock:
+            started = self._started.pop(run_id, None)
+            if started is not None:
+                self.nodes[started[0]].append(time.perf_counter() - started[1])
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs) -> None:
+        self._end(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs) -> None:
+        # an interrupted node runs again on resume; both executions count
+        self._end(run_id)
+
+    def on_llm_end(self, response, *, run_id, **kwargs) -> None:
+        with self._lock:
+            for generations in response.generations:
+                for generation in generations:
+                    usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                    self.llm_calls += 1
+                    self.tokens += usage.get("total_tokens", 0)
+
+
+def _resume(pending) -> Command:
+    from helpers.questions import FORM_TYPE
+
+    resume = {}
+    for item in pending:
+        if isinstance(item.value, dict) and item.value.get("type") == FORM_TYPE:
+            resume[item.interrupt_id] = {q["key"]: ANSWERS[q["key"]] for q in item.value["questions"]}
+        else:
+            resume[item.interrupt_id] = ANSWERS["speed" if "speed" in str(item.value) else "color"]
+    return Command(resume=resume)
+
+
+def run_once(graph, thread_id: str, callbacks: list | None = None) -> int:
+    """One thread from input to final state; returns the interrupts answered."""
+    config: dict[str, Any] = {"configurable": {"thread_id": thread_id}}
+    if callbacks:
+        config["callbacks"] = callbacks
+    data: Any = INPUT
+    interrupts = 0
+    while True:
+        graph.invoke(data, config)
+        pending = graph.get_state(config).interrupts
+        if not pending:
+            return interrupts
+        interrupts += len(pending)
+        data = _resume(pending)
+
+
+async def arun_once(graph, thread_id: str) -> int:
+    config = {"configurable": {"thread_id": thread_id}}
+    data: Any = INPUT
+    interrupts = 0
+    while True:
+        await graph.ainvoke(data, config)
+        pending = (await graph.aget_state(config)).interrupts
+        if not pending:
+            return interrupts
+        interrupts += len(pending)
+        data = _resume(pending)
+
+
+def bench_nodes(graph, scenario: str, runs: int) -> None:
+    timer = NodeTimer()
+    walls, interrupts, steps = [], 0, 0
+    for i in range(runs):
+        t0 = time.perf_counter()
+        interrupts += run_once(graph, f"{scenario}-nodes-{i}", [timer])
+        walls.append(time.perf_counter() - t0)
+        steps += timer.take_steps()
+
+    print(summarize("run (wall)", walls))
+    print(f"{'per run':<28} supersteps={steps / runs:.1f}  "
+          f"interrupts={interrupts / runs:.1f}  llm calls={timer.llm_calls / runs:.1f}  "
+          f"tokens={timer.tokens / runs:.0f}")
+    for node, samples in sorted(timer.nodes.items(), key=lambda kv: -sum(kv[1])):
+        print(summarize(f"  {node.rsplit('/', 1)[-1]}", samples)
+              + f"  total={sum(samples) / runs * 1e3:8.3f}ms/run  [{node}]")
+
+
+def bench_allocations(graph, scenario: str, runs: int) -> None:
+    run_once(graph, f"{scenario}-alloc-warmup")
+    tracemalloc.start()
+    peaks, retained = [], []
+    for i in range(runs):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        run_once(graph, f"{scenario}-alloc-{i}")
+        after, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+        retained.append(after - before)
+    tracemalloc.stop()
+    print(f"{'allocations':<28} peak={statistics.fmean(peaks) / 1024:9.1f}KiB/run  "
+          f"retained={statistics.fmean(retained) / 1024:9.1f}KiB/run (saver included)")
+
+
+def bench_throughput(graph, scenario: str, runs: int, concurrency: int) -> None:
+    t0 = time.perf_counter()
+    for i in range(runs):
+        run_once(graph, f"{scenario}-sync-{i}")
+    sync_tp = runs / (time.perf_counter() - t0)
+
+    async def _all() -> float:
+        gate = asyncio.Semaphore(concurrency)
+
+        async def _one(i: int) -> None:
+            async with gate:
+                await arun_once(graph, f"{scenario}-async-{i}")
+
+        t1 = time.perf_counter()
+        await asyncio.gather(*(_one(i) for i in range(runs)))
+        return time.perf_counter() - t1
+
+    async_tp = runs / asyncio.run(_all())
+    print(f"{'throughput':<28} sync={sync_tp:8.1f} runs/s  "
+          f"async(concurrency={concurrency})={async_tp:8.1f} runs/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenario", choices=(*SCENARIOS, "all"), default="all")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--alloc-runs", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", default="0",
+                        help='seconds per LLM call, or "uniform:lo,hi", "normal:mean,sd", '
+                             '"lognormal:median,sigma", "empirical:a,b,..."')
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    policy = {"ask": False}
+    register_chat_model(DEFAULT_MODEL, FakeChatModel(
+        responder=lambda messages, tools: car_graph_responder(messages, tools, ask=policy["ask"]),
+        latency=Latency.parse(args.latency),
+        seed=args.seed,
+    ))
+    import graph as parent_module  # imported after the override so every node uses the fake
+
+    parent_module.random = random.Random(args.seed)  # same `ensure_defaults` draws every time
+    graph = parent_module.parent.compile(checkpointer=InMemorySaver())
+
+    for scenario in SCENARIOS if args.scenario == "all" else (args.scenario,):
+        policy["ask"] = scenario == "asking"
+        print(f"\n== {scenario} (latency {args.latency}) ==")
+        bench_nodes(graph, scenario, args.runs)
+        bench_allocations(graph, scenario, args.alloc_runs)
+        bench_throughput(graph, scenario, args.runs, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# benchmarks\bench_fanout.py
+"""
+Fan-out of one supervisor turn to N agents as the shared history grows.
+
+Two measurements:
+
+• payload – the N parallel handoff tool calls of one supervisor turn, i.e.
+  building every ``Send`` payload (the previous behaviour sliced and copied
+  the history once per agent; now every payload shares it).
+• end-to-end – one ``create_supervisor(fan_out=True)`` run with N trivial
+  agents: dispatch, N agent runs, fan-in and the final supervisor turn.
+
+    python benchmarks/bench_fanout.py --agents 20 40 --history 100 2000 8000
+"""
+
+import argparse
+import time
+import uuid
+
+import _common  # noqa: F401 – sys.path setup
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import START, StateGraph
+
+from helpers.fake_llm import FakeChatModel
+from helpers.handoff import create_handoff_tool
+from helpers.models import DEFAULT_MODEL, get_chat_model, register_chat_model
+from helpers.supervisor import create_supervisor
+from state.main_state import SharedState
+
+
+def _trivial_agent(name: str):
+    def work(state: SharedState):
+        return {"messages": [AIMessage(content=f"{name} done", name=name)]}
+
+    builder = StateGraph(SharedState)
+    builder.add_node("work", work)
+    builder.add_edge(START, "work")
+    return builder.compile(name=name)
+
+
+def _responder(messages, tools):
+    # dispatch to every agent at once, summarise once they are back
+    if any(isinstance(m, AIMessage) and str(m.content).endswith(" done") for m in messages[-3:]):
+        return AIMessage(content="all done")
+    return AIMessage(
+        content="",
+        tool_calls=[
+            {"name": t["function"]["name"], "args": {}, "id": f"call_{uuid.uuid4().hex[:8]}"}
+            for t in tools
+        ],
+    )
+
+
+def _history(size: int) -> list:
+    return [HumanMessage(content=f"message {i}", id=f"h{i}") for i in range(size)]
+
+
+def bench_payload(agents: int, history: int, repeat: int = 5) -> float:
+    tools = [create_handoff_tool(agent_name=f"agent_{i}") for i in range(agents)]
+    calls = [{"name": t.name, "args": {}, "id": f"call_{i}"} for i, t in enumerate(tools)]
+    state = SharedState(
+        messages=_history(history) + [AIMessage(content="", name="supervisor", tool_calls=calls)]
+    )
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for tool, call in zip(tools, calls):
+            tool.invoke({"type": "tool_call", "name": tool.name, "id": call["id"],
+                         "args": {"state": state}})
+    return (time.perf_counter() - t0) / repeat
+
+
+def bench_end_to_end(agents: int, history: int, repeat: int = 3) -> float:
+    graph = create_supervisor(
+        agents=[_trivial_agent(f"agent_{i}") for i in range(agents)],
+        model=get_chat_model(DEFAULT_MODEL),
+        fan_out=True,
+        add_handoff_back_messages=True,
+        state_schema=SharedState,
+    ).compile()
+    inputs = {"messages": _history(history), "remaining_steps": 15}
+    graph.invoke(inputs)  # warm-up
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        result = graph.invoke(inputs)
+    assert len(result["messages"]) == history + 2 * agents + 2 + 2 * agents
+    return (time.perf_counter() - t0) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--agents", type=int, nargs="+", default=[20, 40])
+    parser.add_argument("--history", type=int, nargs="+", default=[100, 2000, 8000])
+    args = parser.parse_args()
+
+    register_chat_model(DEFAULT_MODEL, FakeChatModel(responder=_responder))
+    print(f"{'agents':>6} {'history':>8} {'payload (ms)':>13} {'end-to-end (ms)':>16}")
+    for agents in args.agents:
+        for history in args.history:
+            payload = bench_payload(agents, history)
+            end_to_end = bench_end_to_end(agents, history)
+            print(f"{agents:>6} {history:>8} {payload * 1e3:>13.2f} {end_to_end * 1e3:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
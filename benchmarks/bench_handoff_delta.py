@@ -0,0 +1,93 @@
+# benchmarks\bench_handoff_delta.py
+"""
+Cost of one supervisor → agent handoff as the private threads grow.
+
+Calls the real ``transfer_to_color_agent`` tool with a ``SharedState`` whose
+``messagesColor`` / ``messagesSpeed`` hold N messages each, then applies the
+returned update to the parent state the way LangGraph does (``add_messages``
+for the message keys, plain overwrite for the rest). The "full" column
+replays the previous behaviour – ``model_dump`` of the whole state and an
+update that rewrites every field – for comparison.
+
+    python benchmarks/bench_handoff_delta.py --repeat 20
+"""
+
+import argparse
+import time
+
+import _common
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.graph.message import add_messages
+
+from helpers.handoff import create_handoff_tool
+from state.main_state import SharedState
+
+REDUCER_KEYS = ("messages", "messagesColor", "messagesSpeed")
+
+handoff = create_handoff_tool(agent_name="color_agent")
+
+
+def _state(n: int) -> SharedState:
+    def thread(prefix: str) -> list:
+        return [HumanMessage(content=f"{prefix} answer {i}", id=f"{prefix}-{i}") for i in range(n)]
+
+    call = {"name": handoff.name, "args": {}, "id": "call_handoff"}
+    return SharedState(
+        messages=[
+            HumanMessage(content="Describe the car.", id="h0"),
+            AIMessage(content="", name="supervisor", tool_calls=[call], id="a0"),
+        ],
+        messagesColor=thread("c"),
+        messagesSpeed=thread("s"),
+        halfSentence="The car is ",
+    )
+
+
+def _apply(parent: dict, update: dict) -> dict:
+    merged = dict(parent)
+    for key, value in update.items():
+        merged[key] = add_messages(parent[key], value) if key in REDUCER_KEYS else value
+    return merged
+
+
+def _delta_update(state: SharedState) -> dict:
+    command = handoff.invoke(
+        {"type": "tool_call", "name": handoff.name, "id": "call_handoff", "args": {"state": state}}
+    )
+    return command.update
+
+
+def _full_update(state: SharedState) -> dict:
+    # previous behaviour: the same tool call, then a full dump + every field in the update
+    _delta_update(state)
+    data = state.model_dump(exclude={"messages"})
+    data["messages"] = state.messages
+    tool_message = ToolMessage(content="Successfully transferred to color_agent",
+                               tool_call_id="call_handoff")
+    return {**data, "messages": data["messages"] + [tool_message]}
+
+
+def _time(fn, state: SharedState, parent: dict, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        _apply(parent, fn(state))
+    return (time.perf_counter() - t0) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'N':>6} {'delta (ms)':>11} {'full (ms)':>10} {'update keys':>12}")
+    for n in (10, 100, 1000, 5000):
+        state = _state(n)
+        parent = {**dict(state), "messages": state.messages[:1]}
+        delta = _time(_delta_update, state, parent, args.repeat)
+        full = _time(_full_update, state, parent, args.repeat)
+        keys = ",".join(_delta_update(state))
+        print(f"{n:>6} {delta * 1e3:>11.3f} {full * 1e3:>10.3f} {keys:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks\bench_handoff_elision.py
+"""
+Supervisor prompt tokens per run with and without ``compact_handoffs``.
+
+Builds the car supervisor twice – LLM-routed (``fan_out=True``, no plan)
+so the supervisor model sees the finished delegations – once as is and
+once with ``compact_handoffs=True``, runs both against the fake model and
+reports the supervisor's prompt tokens (``count_tokens_approximately``)
+and message count per run.
+
+    python benchmarks/bench_handoff_elision.py --runs 20
+"""
+
+import argparse
+
+import _common  # noqa: F401 – sys.path setup
+from fake_policy import car_graph_responder
+from langchain_core.messages.utils import count_tokens_approximately
+
+from helpers import metrics
+from helpers.fake_llm import FakeChatModel
+from helpers.models import DEFAULT_MODEL, get_chat_model, register_chat_model
+
+INPUT = {
+    "messages": [{"role": "user", "content": "Describe the car."}],
+    "color": "",
+    "speed": "",
+    "remaining_steps": 15,
+}
+
+_prompt_tokens = 0
+_prompt_messages = 0
+
+
+def _counting_responder(messages, tools):
+    global _prompt_tokens, _prompt_messages
+    if any(t["function"]["name"].startswith("transfer_to_") for t in tools):
+        _prompt_tokens += count_tokens_approximately(messages)
+        _prompt_messages += len(messages)
+    return car_graph_responder(messages, tools)
+
+
+def _supervisor(compact: bool):
+    from helpers.supervisor import create_supervisor
+    from state.main_state import SharedState
+    from subgraph_color import color_agent
+    from subgraph_speed import speed_agent
+
+    return create_supervisor(
+        agents=[color_agent, speed_agent],
+        model=get_chat_model(DEFAULT_MODEL),
+        prompt="You manage color_agent and speed_agent. Delegate, then summarise.",
+        include_agent_name="inline",
+        add_handoff_back_messages=True,
+        fan_out=True,
+        compact_handoffs=compact,
+        state_schema=SharedState,
+    ).compile(name="supervisor")
+
+
+def main() -> None:
+    global _prompt_tokens, _prompt_messages
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    register_chat_model(DEFAULT_MODEL, FakeChatModel(responder=_counting_responder))
+    results = {}
+    for compact in (False, True):
+        graph = _supervisor(compact)
+        _prompt_tokens = _prompt_messages = 0
+        metrics.reset()
+        for _ in range(args.runs):
+            graph.invoke(INPUT)
+        results[compact] = _prompt_tokens / args.runs
+        label = "compact" if compact else "full"
+        print(
+            f"{label:<8}: {_prompt_tokens / args.runs:7.1f} prompt tokens/run   "
+            f"{_prompt_messages / args.runs:5.1f} messages/run   "
+            f"handoff_tokens_saved_total/run {metrics.get('handoff_tokens_saved_total') / args.runs:6.1f}"
+        )
+    print(f"saved   : {1 - results[True] / results[False]:.0%} of supervisor prompt tokens")
+
+
+if __name__ == "__main__":
+    main()
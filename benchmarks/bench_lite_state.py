@@ -0,0 +1,122 @@
+# benchmarks\bench_lite_state.py
+"""
+Per-superstep state overhead: Pydantic ``SharedState`` vs. ``SharedStateLite``.
+
+Two parts:
+
+• state build – what LangGraph does on every node entry, ``Schema(**values)``,
+  for a state whose message buffers hold N messages;
+• end to end – ``parent_graph`` against a zero-latency fake model, with N
+  earlier messages in each collector thread (``messagesColor`` /
+  ``messagesSpeed``; compacted before every LLM call, but part of every
+  node's state), once per mode. The mode is fixed at import
+  time (``LITE_STATE``), so each mode runs in its own interpreter. Reports
+  the time per run and per node execution (task).
+
+    python benchmarks/bench_lite_state.py --history 10 1000 5000 --runs 20
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+import _common  # noqa: F401 – sys.path setup
+from langchain_core.messages import AIMessage, HumanMessage
+
+
+def _history(n: int, prefix: str = "h") -> list:
+    return [
+        (HumanMessage if i % 2 else AIMessage)(content=f"earlier message {i}", id=f"{prefix}-{i}")
+        for i in range(n)
+    ]
+
+
+def bench_state_build(history: int, repeat: int) -> tuple[float, float]:
+    from state.main_state import SharedState, SharedStateLite
+
+    messages = _history(history)
+    values = {
+        "messages": messages, "messagesColor": messages, "messagesSpeed": messages,
+        "halfSentence": "The car is ", "color": "red", "speed": "fast", "remaining_steps": 5,
+    }
+    timings = []
+    for schema in (SharedState, SharedStateLite):
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            schema(**values)
+        timings.append((time.perf_counter() - t0) / repeat)
+    return timings[0], timings[1]
+
+
+def worker(history: int, runs: int) -> dict:
+    """One mode, in this interpreter: time per run and per task."""
+    from fake_policy import car_graph_responder
+    from helpers.fake_llm import FakeChatModel
+    from helpers.models import DEFAULT_MODEL, register_chat_model
+
+    register_chat_model(DEFAULT_MODEL, FakeChatModel(responder=car_graph_responder))
+    import graph as parent_module  # imported after the override so every node uses the fake
+
+    graph = parent_module.graph
+    # same `ensure_defaults` draws in both modes (LangGraph's ids also use `random`)
+    parent_module.random = defaults = random.Random()
+
+    def payload() -> dict:
+        return {
+            "messages": [HumanMessage(content="Describe the car.")],
+            "messagesColor": _history(history, "c"),
+            "messagesSpeed": _history(history, "s"),
+        }
+
+    defaults.seed(1)  # both fields empty: both collectors run
+    tasks = sum(1 for _ in graph.stream(payload(), stream_mode="updates", subgraphs=True))
+    payloads = [payload() for _ in range(runs)]
+    t0 = time.perf_counter()
+    for data in payloads:
+        defaults.seed(1)
+        graph.invoke(data)
+    elapsed = (time.perf_counter() - t0) / runs
+    return {"run_ms": elapsed * 1e3, "tasks": tasks, "task_us": elapsed / tasks * 1e6}
+
+
+def bench_end_to_end(history: int, runs: int, lite: bool) -> dict:
+    env = {**os.environ, "LITE_STATE": "1" if lite else "0"}
+    out = subprocess.run(
+        [sys.executable, __file__, "--worker", "--history", str(history), "--runs", str(runs)],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--history", type=int, nargs="+", default=[10, 1000, 5000])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.history[0], args.runs)))
+        return
+
+    print("state build (one node entry)")
+    print(f"{'N':>6} {'pydantic (µs)':>14} {'lite (µs)':>10}")
+    for n in args.history:
+        full, lite = bench_state_build(n, repeat=max(5, args.runs))
+        print(f"{n:>6} {full * 1e6:>14.1f} {lite * 1e6:>10.1f}")
+
+    print("\nend to end (parent_graph, fake model)")
+    print(f"{'N':>6} {'mode':<9} {'tasks':>6} {'run (ms)':>9} {'per task (µs)':>14}")
+    for n in args.history:
+        for lite in (False, True):
+            r = bench_end_to_end(n, args.runs, lite)
+            print(f"{n:>6} {'lite' if lite else 'pydantic':<9} {r['tasks']:>6} "
+                  f"{r['run_ms']:>9.2f} {r['task_us']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# benchmarks\bench_llm_cache.py
+"""
+Model calls and latency of ``parent_graph`` with the LLM response cache.
+
+Every run is an independent thread sending the same opening message, so
+after the first (cold) run every collector and supervisor prompt is a
+repeat that only differs in message and tool-call ids. Runs the graph cold,
+then warm (LRU tier), then again after dropping the LRU tier (SQLite tier).
+
+    python benchmarks/bench_llm_cache.py --runs 50 --latency 0.05
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import _common
+from fake_policy import car_graph_responder
+
+from helpers import metrics
+from helpers.fake_llm import FakeChatModel
+from helpers.models import DEFAULT_MODEL, register_chat_model
+
+INPUT = {"messages": [{"role": "user", "content": "Describe the car."}]}
+
+_calls = 0
+
+
+def _counting_responder(messages, tools):
+    global _calls
+    _calls += 1
+    return car_graph_responder(messages, tools)
+
+
+def _load_graph(latency: float, path: Path):
+    os.environ["LLM_CACHE_PATH"] = str(path)
+    register_chat_model(
+        DEFAULT_MODEL, FakeChatModel(responder=_counting_responder, latency=latency)
+    )
+    from graph import graph  # imported after the override so every node uses the fake
+
+    return graph
+
+
+def _phase(label: str, graph, runs: int) -> None:
+    global _calls
+    _calls = 0
+    metrics.reset()
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        result = graph.invoke(INPUT)
+        samples.append(time.perf_counter() - t0)
+        assert result["fullSentence"]
+    hits = metrics.get("llm_cache_hits_total")
+    lookups = hits + metrics.get("llm_cache_misses_total")
+    print(_common.summarize(label, samples))
+    print(f"{'':>12} model calls {_calls:>5}   hit rate {hits / lookups if lookups else 0:6.1%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per fake LLM call")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        graph = _load_graph(args.latency, Path(tmp) / "llm.sqlite")
+        from helpers import llm_cache
+
+        _phase("cold", graph, 1)
+        _phase("warm (lru)", graph, args.runs)
+        llm_cache.from_env()._memory.clear()
+        _phase("sqlite", graph, args.runs)
+
+
+if __name__ == "__main__":
+    main()
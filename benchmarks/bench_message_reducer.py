@@ -0,0 +1,77 @@
+# benchmarks\bench_message_reducer.py
+"""
+Scaling of the message reducer as a thread grows to 10k messages.
+
+For each history length N, grows a channel one message at a time (what a
+long conversation does) and then times three single merges against the
+N-message value: appending one new message to the newest value (what the
+next turn does; an append to an older value copies it), replacing one
+existing message by id, and the old ``assemble`` pattern of returning the
+whole history plus one message. Runs LangGraph's ``add_messages`` and ``state.messages``'
+indexed ``merge_messages`` side by side.
+
+    python benchmarks/bench_message_reducer.py --sizes 100 1000 5000 10000
+"""
+
+import argparse
+import time
+
+import _common  # noqa: F401 – sys.path setup
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph.message import add_messages
+
+from state.messages import merge_messages
+
+REDUCERS = {"add_messages": add_messages, "merge_messages": merge_messages}
+
+
+def _message(i: int):
+    cls = HumanMessage if i % 2 else AIMessage
+    return cls(content=f"message {i}", id=f"m-{i}")
+
+
+def _grow(reducer, n: int) -> tuple[list, float]:
+    value: list = []
+    t0 = time.perf_counter()
+    for i in range(n):
+        value = reducer(value, [_message(i)])
+    return value, time.perf_counter() - t0
+
+
+def _append(reducer, value, n: int, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for i in range(repeat):
+        value = reducer(value, [_message(n + i)])
+    return (time.perf_counter() - t0) / repeat
+
+
+def _time(fn, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'reducer':<15} {'N':>6} {'grow (ms)':>10} {'append (µs)':>12} "
+          f"{'replace (µs)':>13} {'full resend (µs)':>17}")
+    for n in args.sizes:
+        for name, reducer in REDUCERS.items():
+            value, grow = _grow(reducer, n)
+            append = _append(reducer, value, n, args.repeat)
+            replace = _time(
+                lambda: reducer(value, [AIMessage(content="edited", id=f"m-{n // 2}")]),
+                args.repeat,
+            )
+            resend = _time(lambda: reducer(value, list(value) + [_message(n)]), args.repeat)
+            print(f"{name:<15} {n:>6} {grow * 1e3:>10.1f} {append * 1e6:>12.1f} "
+                  f"{replace * 1e6:>13.1f} {resend * 1e6:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# benchmarks\bench_metrics.py
+"""
+Overhead of the always-on latency metrics (``helpers/instrumentation.py``).
+
+Runs ``graph`` on the zero-latency fake model – the worst case, every
+microsecond the handler adds is visible – in rotation without callbacks,
+with a no-op callback handler (LangChain's own callback plumbing) and with
+``MetricsCallbackHandler``, ``--rounds`` × ``--runs`` threads each, in the
+``auto`` and the ``asking`` scenario. Reports runs/s and the added cost per
+run, and the handler's own cost per recorded node / tool / model call,
+measured by driving its hooks directly. Finally scrapes the ``/metrics``
+endpoint once and prints the recorded call counts and mean latencies per
+agent.
+
+    python benchmarks/bench_metrics.py --runs 50 --rounds 5
+"""
+
+import argparse
+import random
+import time
+import urllib.request
+import uuid
+
+import _common  # noqa: F401 – sys.path setup
+from bench_e2e import run_once
+from fake_policy import car_graph_responder
+from langchain_core.callbacks import BaseCallbackHandler
+from langgraph.checkpoint.memory import InMemorySaver
+
+from helpers import metrics
+from helpers.fake_llm import FakeChatModel
+from helpers.instrumentation import LLM_SECONDS, NODE_SECONDS, TOOL_SECONDS, MetricsCallbackHandler
+from helpers.models import DEFAULT_MODEL, register_chat_model
+
+SCENARIOS = ("auto", "asking")
+
+
+class NoopHandler(BaseCallbackHandler):
+    run_inline = True
+
+
+def _observations() -> int:
+    return sum(metrics.histogram(name)["count"] for name in (NODE_SECONDS, TOOL_SECONDS, LLM_SECONDS))
+
+
+def bench_overhead(graph, scenario: str, runs: int, rounds: int) -> int:
+    """End-to-end runs/s per mode; returns the observations recorded per run."""
+    handler = MetricsCallbackHandler(aliases={"delegate": "supervisor"})
+    modes = (("no callbacks", None), ("no-op callback", [NoopHandler()]), ("metrics", [handler]))
+    run_once(graph, f"{scenario}-warmup", [handler])
+    metrics.reset()
+    walls = dict.fromkeys((mode for mode, _ in modes), 0.0)
+    for r in range(rounds):
+        for mode, callbacks in modes:
+            t0 = time.perf_counter()
+            for i in range(runs):
+                run_once(graph, f"{scenario}-{mode}-{r}-{i}", callbacks)
+            walls[mode] += time.perf_counter() - t0
+
+    total = runs * rounds
+    base = walls["no callbacks"] / total
+    for mode, wall in walls.items():
+        per_run = wall / total
+        print(f"{mode:<28} {1 / per_run:8.1f} runs/s  {per_run * 1e3:8.3f}ms/run  "
+              f"({(per_run - base) / base * 100:+5.1f}%)")
+    return round(_observations() / total)
+
+
+def bench_handler(iterations: int, observations_per_run: int) -> None:
+    """The handler's own work per observation: one start / end hook pair with real metadata."""
+    handler = MetricsCallbackHandler(aliases={"delegate": "supervisor"})
+    metadata = {
+        "langgraph_node": "llm",
+        "langgraph_checkpoint_ns": f"delegate:{uuid.uuid4()}|supervisor_plan_0_color_agent:{uuid.uuid4()}"
+                                   f"|llm:{uuid.uuid4()}",
+    }
+    tags = ["graph:step:3"]
+    run_ids = [uuid.uuid4() for _ in range(iterations)]
+    metrics.reset()
+    t0 = time.perf_counter()
+    for run_id in run_ids:
+        handler.on_chain_start({}, {}, run_id=run_id, tags=tags, metadata=metadata, name="llm")
+        handler.on_chain_end({}, run_id=run_id)
+    per_call = (time.perf_counter() - t0) / iterations
+    print(f"\n{'handler cost':<28} {per_call * 1e6:8.2f}µs per observation  "
+          f"≈ {per_call * observations_per_run * 1e6:6.1f}µs/run ({observations_per_run} observations/run)")
+
+
+def scrape(port: int) -> None:
+    server = metrics.serve(port)
+    try:
+        text = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5).read().decode()
+    finally:
+        server.shutdown()
+    print(f"\n/metrics: {len(text.splitlines())} lines, {len(text) / 1024:.1f} KiB")
+
+    counts: dict[tuple[str, str], float] = {}
+    sums: dict[tuple[str, str], float] = {}
+    for line in text.splitlines():
+        if line.startswith("#") or not line.endswith(tuple("0123456789")):
+            continue
+        series, _, value = line.rpartition(" ")
+        name, _, labels = series.partition("{")
+        for suffix, into in (("_count", counts), ("_sum", sums)):
+            if name.endswith(suffix):
+                into[(name[: -len(suffix)], labels.rstrip("}"))] = float(value)
+    for key in sorted(counts):
+        mean = sums.get(key, 0.0) / counts[key] * 1e3 if counts[key] else 0.0
+        print(f"  {key[0]:<30} {key[1]:<52} n={counts[key]:<6.0f} mean={mean:8.3f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenario", choices=(*SCENARIOS, "all"), default="all")
+    parser.add_argument("--runs", type=int, default=50, help="threads per round and mode")
+    parser.add_argument("--rounds", type=int, default=5, help="rounds of the three modes, in rotation")
+    parser.add_argument("--port", type=int, default=9464, help="port for the one /metrics scrape")
+    args = parser.parse_args()
+
+    policy = {"ask": False}
+    register_chat_model(DEFAULT_MODEL, FakeChatModel(
+        responder=lambda messages, tools: car_graph_responder(messages, tools, ask=policy["ask"]),
+    ))
+    import graph as parent_module  # imported after the override so every node uses the fake
+
+    parent_module.random = random.Random(0)
+    graph = parent_module.parent.compile(checkpointer=InMemorySaver())
+
+    observations = 0
+    for scenario in SCENARIOS if args.scenario == "all" else (args.scenario,):
+        policy["ask"] = scenario == "asking"
+        print(f"\n== {scenario} ==")
+        observations = max(observations, bench_overhead(graph, scenario, args.runs, args.rounds))
+    scrape(args.port)
+    bench_handler(100_000, observations)
+
+
+if __name__ == "__main__":
+    main()
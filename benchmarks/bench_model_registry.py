@@ -0,0 +1,69 @@
+# benchmarks\bench_model_registry.py
+"""
+Per-turn overhead of the LLM nodes: fresh ``ChatOpenAI().bind_tools()`` per
+call (old behaviour) vs. the shared registry in ``helpers.models``.
+
+Both variants talk to the local stub endpoint, so the difference is pure
+client construction / tool conversion / connection set-up cost.
+
+    python benchmarks/bench_model_registry.py --turns 300
+"""
+
+import argparse
+import time
+
+import _common  # noqa: F401 – sys.path setup
+from _common import summarize
+from stub_openai import start_stub_server
+
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_openai import ChatOpenAI
+
+from helpers.models import clear_registry, get_bound_model
+from subgraph_color import _SYSTEM_PROMPT, ask_user_color, get_state_color, set_state_color
+
+TOOLS = [set_state_color, ask_user_color, get_state_color]
+MESSAGES = [SystemMessage(content=_SYSTEM_PROMPT), HumanMessage(content="Describe the car.")]
+
+
+def _fresh_turn(base_url: str) -> None:
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0, base_url=base_url).bind_tools(TOOLS)
+    llm.invoke(MESSAGES)
+
+
+def _registry_turn(base_url: str) -> None:
+    llm = get_bound_model(TOOLS, temperature=0, base_url=base_url)
+    llm.invoke(MESSAGES)
+
+
+def _measure(fn, base_url: str, turns: int) -> list[float]:
+    fn(base_url)                                    # warm-up (imports, first connect)
+    samples = []
+    for _ in range(turns):
+        t0 = time.perf_counter()
+        fn(base_url)
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server()
+    try:
+        clear_registry()
+        before = _measure(_fresh_turn, base_url, args.turns)
+        after = _measure(_registry_turn, base_url, args.turns)
+    finally:
+        server.shutdown()
+
+    print(summarize("fresh ChatOpenAI per turn", before))
+    print(summarize("shared registry", after))
+    saved = (sum(before) - sum(after)) / args.turns
+    print(f"overhead saved per turn: {saved * 1e3:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
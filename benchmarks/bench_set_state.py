@@ -0,0 +1,65 @@
+# benchmarks\bench_set_state.py
+"""
+Cost of one ``set_state`` write, and of writing several fields at once.
+
+• validate – the old per-call path (``get_type_hints`` on the schema +
+  ``model_validate`` of a whole ``SharedState``) vs. the per-field
+  ``TypeAdapter``s ``make_set_state`` now builds once;
+• tool call – ``set_state`` invoked K times vs. ``set_state_batch`` once
+  with K keys (on top of this, each ``set_state`` call is a model round
+  trip in a real agent).
+
+    python benchmarks/bench_set_state.py --repeat 2000
+"""
+
+import argparse
+import time
+from typing import get_type_hints
+
+import _common  # noqa: F401 – sys.path setup
+
+from state.main_state import SharedState
+from tools import make_set_state, make_set_state_batch
+from tools.set_state import _field_validators
+
+FIELDS = {"halfSentence": "The car is ", "color": "red", "speed": "fast", "fullSentence": "The car is red and fast."}
+
+
+def _old_validate(key: str, value: str) -> None:
+    if key not in get_type_hints(SharedState):
+        raise KeyError(key)
+    SharedState.model_validate({key: value})
+
+
+def _time(fn, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def _call(tool, args: dict):
+    return tool.invoke({"type": "tool_call", "name": tool.name, "id": "call-1", "args": args})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    validators = _field_validators(SharedState)
+    old = _time(lambda: _old_validate("color", "red"), args.repeat)
+    new = _time(lambda: validators["color"]("red"), args.repeat)
+    print(f"validate one key:  per call {old * 1e6:8.1f} µs  precompiled {new * 1e6:8.1f} µs")
+
+    single = make_set_state(state_schema=SharedState)
+    batch = make_set_state_batch(state_schema=SharedState)
+    repeat = max(1, args.repeat // 10)
+    singles = _time(lambda: [_call(single, {"key": k, "value": v}) for k, v in FIELDS.items()], repeat)
+    batched = _time(lambda: _call(batch, {"values": FIELDS}), repeat)
+    print(f"write {len(FIELDS)} keys:      {len(FIELDS)} × set_state {singles * 1e6:8.1f} µs  "
+          f"1 × set_state_batch {batched * 1e6:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
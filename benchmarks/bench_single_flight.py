@@ -0,0 +1,89 @@
+# benchmarks\bench_single_flight.py
+"""
+Upstream model calls for a burst of identical new threads with single-flight.
+
+Starts N runs of ``parent_graph`` at the same moment – once from a thread
+pool through the sync path, once with ``asyncio.gather`` – and reports how
+many model requests went upstream and how many were coalesced onto an
+identical in-flight request.
+
+    python benchmarks/bench_single_flight.py --burst 50 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import _common  # noqa: F401 – sys.path setup
+from fake_policy import car_graph_responder
+
+from helpers import metrics
+from helpers.fake_llm import FakeChatModel
+from helpers.models import DEFAULT_MODEL, register_chat_model
+
+INPUT = {"messages": [{"role": "user", "content": "Describe the car."}]}
+
+_calls = 0
+_calls_lock = threading.Lock()
+
+
+def _counting_responder(messages, tools):
+    global _calls
+    with _calls_lock:
+        _calls += 1
+    return car_graph_responder(messages, tools)
+
+
+def _load_graph(latency: float):
+    register_chat_model(
+        DEFAULT_MODEL, FakeChatModel(responder=_counting_responder, latency=latency)
+    )
+    from graph import graph  # imported after the override so every node uses the fake
+
+    return graph
+
+
+def _report(label: str, burst: int, elapsed: float) -> None:
+    global _calls
+    coalesced = metrics.get("llm_requests_coalesced_total")
+    requests = _calls + coalesced
+    print(
+        f"{label:<6}: {burst:>4} runs in {elapsed:6.2f}s   "
+        f"model requests {requests:>5.0f}   upstream {_calls:>5}   "
+        f"coalesced {coalesced:>5.0f} ({coalesced / requests if requests else 0:.0%})"
+    )
+    _calls = 0
+    metrics.reset()
+
+
+def run_sync(graph, burst: int) -> float:
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=burst) as pool:
+        results = list(pool.map(lambda _: graph.invoke(INPUT), range(burst)))
+    assert all(r["fullSentence"] for r in results)
+    return time.perf_counter() - t0
+
+
+async def run_async(graph, burst: int) -> float:
+    t0 = time.perf_counter()
+    results = await asyncio.gather(*(graph.ainvoke(INPUT) for _ in range(burst)))
+    assert all(r["fullSentence"] for r in results)
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--burst", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds per fake LLM call")
+    args = parser.parse_args()
+
+    graph = _load_graph(args.latency)
+    metrics.reset()
+    _report("sync", args.burst, run_sync(graph, args.burst))
+    _report("async", args.burst, asyncio.run(run_async(graph, args.burst)))
+
+
+if __name__ == "__main__":
+    main()
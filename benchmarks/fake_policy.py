@@ -0,0 +1,91 @@
+# benchmarks\fake_policy.py
+"""
+Responder for ``helpers.fake_llm.FakeChatModel`` that plays every role of
+the car graph (supervisor, color_agent, speed_agent) without a real LLM.
+
+Specialists read their field with ``get_state`` and write a fixed value
+with ``set_state`` – they never call ``ask_user``, so runs finish without
+interrupts. ``asking_responder`` plays the same roles, but its specialists
+ask the user and store the reply. The supervisor hands off to every
+specialist still missing in one (parallel) turn, then summarises.
+"""
+
+import json
+import uuid
+
+from langchain_core.messages import AIMessage, BaseMessage, SystemMessage, ToolMessage
+
+ANSWERS = {"color": "blue", "speed": "fast"}
+
+
+def _tool_call(name: str, **args) -> AIMessage:
+    return AIMessage(
+        content="",
+        tool_calls=[{"name": name, "args": args, "id": f"call_{uuid.uuid4().hex[:12]}"}],
+    )
+
+
+def _field_of(messages: list[BaseMessage]) -> str | None:
+    system = next((m for m in messages if isinstance(m, SystemMessage)), None)
+    if system is None:
+        return None
+    for field in ANSWERS:
+        if f'"key": "{field}"' in str(system.content):
+            return field
+    return None
+
+
+def _specialist(field: str, messages: list[BaseMessage], ask: bool = False) -> AIMessage:
+    last = messages[-1]
+    if isinstance(last, ToolMessage) and last.name == "get_state":
+        if str(last.content).strip() not in ("", "null", "None"):
+            return AIMessage(content=f"{field} already set")
+        if ask:
+            return _tool_call("ask_user", prompt=f"What {field} should the car have?")
+        return _tool_call("set_state", key=field, value=ANSWERS[field])
+    if isinstance(last, ToolMessage) and last.name == "ask_user":
+        return _tool_call("set_state", key=field, value=str(last.content))
+    if isinstance(last, ToolMessage) and last.name == "set_state":
+        return AIMessage(content=f"{field} stored")
+    return _tool_call("get_state", key=field)
+
+
+def _supervisor(messages: list[BaseMessage], tool_names: set[str]) -> AIMessage:
+    # hands off to every specialist that has not reported yet, in one turn
+    text = "\n".join(str(m.content) for m in messages)
+    pending = [
+        f"transfer_to_{agent}"
+        for agent in ("color_agent", "speed_agent")
+        if f"{agent} has chosen" not in text
+        and f"{agent} already has" not in text
+        and f"transfer_to_{agent}" in tool_names
+    ]
+    if pending:
+        return AIMessage(
+            content="",
+            tool_calls=[
+                {"name": name, "args": {}, "id": f"call_{uuid.uuid4().hex[:12]}"}
+                for name in pending
+            ],
+        )
+    return AIMessage(content="Both specialists reported back – the car is described.")
+
+
+def car_graph_responder(messages: list[BaseMessage], tools: list[dict], ask: bool = False) -> AIMessage:
+    """``FakeChatModel.responder`` for every LLM call made by ``src/graph.py``."""
+    tool_names = {t["function"]["name"] for t in tools}
+    answer_tools = [name for name in tool_names if name.endswith("Answer")]
+    if answer_tools:
+        # structured extraction: the reply itself is the value
+        return _tool_call(answer_tools[0], value=str(messages[-1].content))
+    if any(name.startswith("transfer_to_") for name in tool_names):
+        return _supervisor(messages, tool_names)
+    field = _field_of(messages)
+    if field is None:
+        return AIMessage(content=json.dumps(ANSWERS))
+    return _specialist(field, messages, ask)
+
+
+def asking_responder(messages: list[BaseMessage], tools: list[dict]) -> AIMessage:
+    """Like ``car_graph_responder``, but specialists ``ask_user`` for their value."""
+    return car_graph_responder(messages, tools, ask=True)
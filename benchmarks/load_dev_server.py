@@ -0,0 +1,203 @@
+# benchmarks\load_dev_server.py
+"""
+Load generator for the ``agent`` graph served by ``langgraph dev``.
+
+Keeps ``--concurrency`` threads busy against the local server until
+``--threads`` threads have finished. Each thread sends the opening message,
+streams the run, answers every ``ask_user`` interrupt (or the batched
+question form) after ``--think`` seconds and resumes, until the graph ends.
+A sampler polls the server queue every ``--sample`` seconds.
+
+Reports throughput, p50 / p95 / p99 of the thread latency (the sum of its
+runs, answer delays excluded) and of each server run, time to first
+interrupt, and the queue depth over time – pending / running runs from the
+server's ``/metrics`` endpoint, or busy threads when it has none.
+
+Run the server against the local stub model, not OpenAI:
+
+    make graph-stub                  # stub endpoint playing the car graph
+    make graph-start-stub            # langgraph dev pointed at the stub
+    make graph-load LOAD_ARGS="--threads 200 --concurrency 20"
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import _common  # noqa: F401 – sys.path setup
+from _common import percentile
+from langgraph_sdk import get_client
+
+ANSWERS = {"color": "teal", "speed": "brisk"}
+PROMPT = "Describe the car."
+
+
+@dataclass
+class Stats:
+    thread_s: list[float] = field(default_factory=list)
+    run_s: list[float] = field(default_factory=list)
+    first_interrupt_s: list[float] = field(default_factory=list)
+    interrupts: int = 0
+    errors: list[str] = field(default_factory=list)
+    # (seconds since start, pending, running)
+    queue: list[tuple[float, int | None, int]] = field(default_factory=list)
+
+
+def _answer(value: Any) -> Any:
+    if isinstance(value, dict) and value.get("type") == "questions":  # BATCH_QUESTIONS=1
+        return {q["key"]: ANSWERS.get(q["key"], "any") for q in value["questions"]}
+    return ANSWERS["speed" if "speed" in str(value).lower() else "color"]
+
+
+def _pending(state: dict) -> list[dict]:
+    """Open interrupts of a thread state (top-level on newer servers, per task on older)."""
+    if state.get("interrupts"):
+        return list(state["interrupts"])
+    return [i for task in state.get("tasks") or () for i in task.get("interrupts") or ()]
+
+
+def _resume(pending: list[dict]) -> dict:
+    ids = [i.get("id") or i.get("interrupt_id") for i in pending]
+    if all(ids):
+        return {"resume": {i: _answer(item["value"]) for i, item in zip(ids, pending)}}
+    return {"resume": _answer(pending[0]["value"])}
+
+
+async def run_thread(client, assistant: str, think: float, stats: Stats) -> None:
+    thread = await client.threads.create()
+    thread_id = thread["thread_id"]
+    payload: dict[str, Any] = {"input": {"messages": [{"role": "user", "content": PROMPT}]}}
+    busy = 0.0
+    t_start = time.perf_counter()
+    first_interrupt = None
+    while True:
+        t_run = time.perf_counter()
+        async for part in client.runs.stream(thread_id, assistant, stream_mode="updates", **payload):
+            if part.event == "error":
+                raise RuntimeError(f"run failed: {part.data}")
+            if (first_interrupt is None and part.event == "updates"
+                    and isinstance(part.data, dict) and "__interrupt__" in part.data):
+                first_interrupt = time.perf_counter() - t_start
+        elapsed = time.perf_counter() - t_run
+        busy += elapsed
+        stats.run_s.append(elapsed)
+
+        pending = _pending(await client.threads.get_state(thread_id))
+        if not pending:
+            break
+        stats.interrupts += len(pending)
+        if first_interrupt is None:  # server did not stream the interrupt
+            first_interrupt = time.perf_counter() - t_start
+        if think:
+            await asyncio.sleep(think)
+        payload = {"command": _resume(pending)}
+
+    stats.thread_s.append(busy)
+    if first_interrupt is not None:
+        stats.first_interrupt_s.append(first_interrupt)
+
+
+async def queue_depth(client) -> tuple[int | None, int]:
+    """``(pending, running)`` runs; ``(None, busy threads)`` if the server has no queue metrics."""
+    try:
+        metrics = await client.http.get("/metrics", params={"format": "json"})
+        queue = metrics["queue"]
+        return int(queue["n_pending"]), int(queue["n_running"])
+    except Exception:  # noqa: BLE001 – older servers / `langgraph dev` without /metrics
+        busy = await client.threads.search(status="busy", limit=1000, select=["thread_id"])
+        return None, len(busy)
+
+
+async def sample_queue(client, interval: float, t0: float, stats: Stats, done: asyncio.Event) -> None:
+    while not done.is_set():
+        try:
+            pending, running = await queue_depth(client)
+            stats.queue.append((time.perf_counter() - t0, pending, running))
+        except Exception as err:  # noqa: BLE001 – sampling must never stop the load
+            stats.errors.append(f"sampler: {err}")
+        try:
+            await asyncio.wait_for(done.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def load(url: str, assistant: str, threads: int, concurrency: int, think: float, interval: float) -> tuple[Stats, float]:
+    client = get_client(url=url)
+    stats = Stats()
+    gate = asyncio.Semaphore(concurrency)
+    done = asyncio.Event()
+
+    async def _one() -> None:
+        async with gate:
+            try:
+                await run_thread(client, assistant, think, stats)
+            except Exception as err:  # noqa: BLE001 – count and keep the load going
+                stats.errors.append(f"{type(err).__name__}: {err}")
+
+    t0 = time.perf_counter()
+    sampler = asyncio.create_task(sample_queue(client, interval, t0, stats, done))
+    await asyncio.gather(*(_one() for _ in range(threads)))
+    wall = time.perf_counter() - t0
+    done.set()
+    await sampler
+    return stats, wall
+
+
+def _line(label: str, samples: list[float]) -> str:
+    if not samples:
+        return f"{label:<24} n=0"
+    return (f"{label:<24} n={len(samples):<6} p50={percentile(samples, 50) * 1e3:9.1f}ms  "
+            f"p95={percentile(samples, 95) * 1e3:9.1f}ms  p99={percentile(samples, 99) * 1e3:9.1f}ms")
+
+
+def report(stats: Stats, wall: float, threads: int, concurrency: int, rows: int) -> None:
+    done = len(stats.thread_s)
+    print(f"threads: {done}/{threads} done, {len(stats.errors)} errors, concurrency {concurrency}, "
+          f"wall {wall:.1f}s")
+    print(f"{'throughput':<24} {done / wall:8.2f} threads/s  {len(stats.run_s) / wall:8.2f} runs/s")
+    print(_line("thread latency", stats.thread_s))
+    print(_line("run latency", stats.run_s))
+    print(_line("time to 1st interrupt", stats.first_interrupt_s))
+    print(f"{'interrupts / thread':<24} {stats.interrupts / max(done, 1):.2f}")
+    for err in stats.errors[:5]:
+        print(f"  error: {err}")
+
+    if not stats.queue:
+        return
+    from_metrics = stats.queue[0][1] is not None
+    print(f"\nqueue depth ({'pending / running runs' if from_metrics else 'busy threads – no /metrics'}):")
+    step = max(1, len(stats.queue) // rows)
+    for t, pending, running in stats.queue[::step]:
+        depth = (pending or 0) + running if from_metrics else running
+        bar = "#" * min(depth, 60)
+        print(f"  t={t:7.1f}s  " + (f"pending={pending:<5} running={running:<5}" if from_metrics
+                                    else f"busy={running:<5}") + f" {bar}")
+    depths = [(p or 0) + r for _, p, r in stats.queue]
+    print(f"  max={max(depths)}  mean={sum(depths) / len(depths):.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:2024")
+    parser.add_argument("--assistant", default="agent", help="graph id from langgraph.json")
+    parser.add_argument("--threads", type=int, default=100, help="threads to run in total")
+    parser.add_argument("--concurrency", type=int, default=10, help="threads in flight at once")
+    parser.add_argument("--think", type=float, default=0.0, help="seconds before answering an interrupt")
+    parser.add_argument("--sample", type=float, default=0.5, help="queue sampling interval (s)")
+    parser.add_argument("--rows", type=int, default=20, help="queue timeline rows to print")
+    parser.add_argument("--json", help="also write the raw samples to this file")
+    args = parser.parse_args()
+
+    stats, wall = asyncio.run(load(args.url, args.assistant, args.threads, args.concurrency,
+                                   args.think, args.sample))
+    report(stats, wall, args.threads, args.concurrency, args.rows)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"wall_s": wall, **stats.__dict__}, f)
+
+
+if __name__ == "__main__":
+    main()
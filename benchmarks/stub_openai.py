@@ -0,0 +1,178 @@
+# benchmarks\stub_openai.py
+"""
+Minimal local stand-in for the OpenAI chat-completions endpoint.
+
+Answers every ``POST .../chat/completions`` with a fixed assistant message
+over HTTP/1.1 keep-alive, so benchmarks measure client-side overhead only.
+With ``--policy car`` / ``asking`` it plays the car graph instead
+(``fake_policy``: tool calls, structured answers), so a whole server such as
+``langgraph dev`` can run against it.
+
+    python benchmarks/stub_openai.py --port 8765
+    # then point ChatOpenAI at base_url="http://127.0.0.1:8765/v1"
+    python benchmarks/stub_openai.py --port 8765 --policy asking --latency 0.05
+    # OPENAI_BASE_URL=http://127.0.0.1:8765/v1 make graph-start
+"""
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+
+# ``FakeChatModel``-style responder: (messages, OpenAI tool dicts) -> AIMessage
+Responder = Callable[[list[BaseMessage], list[dict]], AIMessage]
+
+_COMPLETION = {
+    "id": "chatcmpl-stub",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o-mini",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "stub reply"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+}
+
+
+def _messages(raw: list[dict]) -> list[BaseMessage]:
+    """OpenAI request messages -> LangChain messages (tool results get their tool's name back)."""
+    names: dict[str, str] = {}
+    messages: list[BaseMessage] = []
+    for m in raw:
+        content = m.get("content") or ""
+        if isinstance(content, list):
+            content = "".join(part.get("text", "") for part in content if isinstance(part, dict))
+        role = m.get("role")
+        if role in ("system", "developer"):
+            messages.append(SystemMessage(content=content))
+        elif role == "assistant":
+            calls = []
+            for call in m.get("tool_calls") or ():
+                names[call["id"]] = call["function"]["name"]
+                calls.append({
+                    "name": call["function"]["name"],
+                    "args": json.loads(call["function"].get("arguments") or "{}"),
+                    "id": call["id"],
+                })
+            messages.append(AIMessage(content=content, tool_calls=calls))
+        elif role == "tool":
+            call_id = m.get("tool_call_id", "")
+            messages.append(ToolMessage(content=content, tool_call_id=call_id, name=names.get(call_id)))
+        else:
+            messages.append(HumanMessage(content=content))
+    return messages
+
+
+def _completion(request: dict, responder: Responder) -> dict:
+    tools = list(request.get("tools") or ())
+    # structured output (``response_format``) is answered like a forced tool call
+    schema = (request.get("response_format") or {}).get("json_schema")
+    if schema:
+        tools = [{"type": "function", "function": {"name": schema["name"], "parameters": schema.get("schema", {})}}]
+    reply = responder(_messages(request.get("messages") or []), tools)
+
+    message: dict = {"role": "assistant", "content": reply.text() or None}
+    if schema and reply.tool_calls:
+        message["content"] = json.dumps(reply.tool_calls[0]["args"])
+    elif reply.tool_calls:
+        message["tool_calls"] = [
+            {
+                "id": call.get("id") or f"call_{uuid.uuid4().hex[:12]}",
+                "type": "function",
+                "function": {"name": call["name"], "arguments": json.dumps(call["args"])},
+            }
+            for call in reply.tool_calls
+        ]
+    return {
+        **_COMPLETION,
+        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+        "model": request.get("model", _COMPLETION["model"]),
+        "choices": [{
+            "index": 0,
+            "message": message,
+            "finish_reason": "tool_calls" if "tool_calls" in message else "stop",
+        }],
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"          # keep connections alive
+    disable_nagle_algorithm = True         # headers + body go out as two writes
+    latency: float = 0.0
+    body: bytes = json.dumps(_COMPLETION).encode()
+    responder: Responder | None = None
+
+    def do_POST(self):  # noqa: N802 – http.server naming
+        length = int(self.headers.get("Content-Length", 0))
+        request = self.rfile.read(length)
+        body = self.body
+        if self.responder is not None:
+            body = json.dumps(_completion(json.loads(request), self.responder)).encode()
+        if self.latency:
+            time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):      # silence per-request logging
+        pass
+
+
+def start_stub_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    latency: float = 0.0,
+    completion: dict | None = None,
+    responder: Responder | None = None,
+) -> tuple[ThreadingHTTPServer, str]:
+    """Start the stub in a daemon thread and return ``(server, base_url)``.
+
+    ``responder`` computes every reply from the request; otherwise the
+    fixed ``completion`` is sent.
+    """
+    handler = type(
+        "StubHandler",
+        (_Handler,),
+        {
+            "latency": latency,
+            "body": json.dumps(completion or _COMPLETION).encode(),
+            "responder": staticmethod(responder) if responder else None,
+        },
+    )
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/v1"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per reply")
+    parser.add_argument("--policy", choices=("fixed", "car", "asking"), default="fixed",
+                        help="fixed reply, or play the car graph (asking: specialists ask_user)")
+    args = parser.parse_args()
+
+    responder = None
+    if args.policy != "fixed":
+        from fake_policy import asking_responder, car_graph_responder
+
+        responder = asking_responder if args.policy == "asking" else car_graph_responder
+    server, url = start_stub_server(args.host, args.port, args.latency, responder=responder)
+    print(f"stub OpenAI endpoint listening on {url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,324 @@
+# src\batch.py
+"""
+Batch entry point: run ``graph`` over a JSONL file of inputs.
+
+One record per line:
+
+    {"id": "car-1", "message": "Describe the car.", "answers": {"color": "teal", "speed": "brisk"}}
+    {"id": "car-2", "input": {"messages": [{"role": "user", "content": "Fast, please."}]}, "user_id": "u7"}
+    {"id": "car-3", "message": "Describe the car.", "answers": ["teal", "brisk"]}
+
+``message`` is shorthand for ``input = {"messages": [user message]}``;
+``user_id`` lands in the run's ``configurable`` (answer memory). State
+fields cannot be preset through ``input`` – the graph's ``init`` node resets
+them – so script them as ``answers`` instead.
+``answers`` are the scripted human replies: every ``ask_user`` / collector
+interrupt – and the batched question form – is resumed from them instead of
+waiting for a person. A question is answered by the entry for its exact
+text, else for the field it asks about – the form's key, or the field of the
+specialist that raised the interrupt (the model words ``ask_user`` prompts
+freely, so the text alone is no guide), else a key the question mentions.
+An ``answers`` list holds the fields in declared order (``color``, ``speed``)
+and only answers questions whose field is known – the specialists ask
+concurrently, so arrival order means nothing. A question without an answer
+fails the record.
+
+Records run on ``--processes`` worker processes with ``--threads`` graph
+threads each (``--processes 0`` keeps everything in this process). Results
+are appended to the output file as they complete, one line per record:
+
+    {"id": "car-1", "status": "ok", "output": {"fullSentence": …}, "interrupts": 2, "elapsed_ms": 812.0}
+    {"id": "car-2", "status": "error", "error": "ValueError: …", "interrupts": 0, "elapsed_ms": 93.1}
+
+Restarting with the same output file skips every id that already finished
+``ok`` (``--skip-errors`` skips failed ones, too), so a crashed backfill
+resumes where it stopped.
+
+    python src/batch.py inputs.jsonl -o results.jsonl --processes 4 --threads 8
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterator, Mapping
+
+# `python src/batch.py` only puts src/ on the path, but the tools import `src.logger`
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from logger.logger import getLogger  # noqa: E402
+
+logger = getLogger(__name__)
+
+DEFAULT_FIELDS = ("fullSentence", "color", "speed")
+_STOP = None  # task-queue sentinel, one per worker thread
+# `<supervisor>_plan_<i>_<agent>` nodes run `<agent>` (helpers.supervisor)
+_PLAN_NODE_RE = re.compile(r"^.+_plan_\d+_(.+)$")
+
+
+class Unanswered(LookupError):
+    """An interrupt asked something the record has no scripted answer for."""
+
+
+# Records ------------------------------------------------------------
+def read_records(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Records of a JSONL file, each with a string ``id`` (``line-N`` when missing)."""
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            record["id"] = str(record.get("id", f"line-{lineno}"))
+            yield record
+
+
+def finished_ids(path: str | Path, *, include_errors: bool = False) -> set[str]:
+    """Ids already written to an output file; a torn last line (crash) is ignored."""
+    done: set[str] = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                continue
+            if result.get("status") == "ok" or include_errors:
+                done.add(str(result.get("id")))
+    return done
+
+
+def _open_output(path: str | Path):
+    out = open(path, "a+", encoding="utf-8")
+    # a crash may have left half a line behind – start on a fresh one
+    if out.tell():
+        out.seek(out.tell() - 1)
+        if out.read(1) != "\n":
+            out.write("\n")
+    return out
+
+
+# Answers ------------------------------------------------------------
+class _Script:
+    """Scripted replies of one record."""
+
+    def __init__(self, answers: Any, questions: Mapping[str, str], fields: tuple[str, ...]):
+        self.by_key = dict(answers) if isinstance(answers, Mapping) else {}
+        # list entries go to the fields in declared order, never by arrival
+        self.by_position = dict(zip(fields, answers)) if isinstance(answers, list) else {}
+        self.keys_of = {q: k for k, q in questions.items()}
+
+    def answer(self, question: str, key: str | None = None) -> str:
+        text = str(question)
+        for candidate in (text, key, self.keys_of.get(text)):
+            if candidate is not None and candidate in self.by_key:
+                return str(self.by_key[candidate])
+        folded = text.casefold()
+        for candidate, reply in self.by_key.items():
+            if candidate.casefold() in folded:
+                return str(reply)
+        field = key or self.keys_of.get(text)
+        if field is not None and field in self.by_position:
+            return str(self.by_position[field])
+        raise Unanswered(f"no scripted answer for {text!r}")
+
+    def resume(self, value: Any, form_type: str, key: str | None = None) -> Any:
+        """Reply to one interrupt; ``key`` is the field of the agent that raised it."""
+        if isinstance(value, Mapping) and value.get("type") == form_type:
+            return {q["key"]: self.answer(q["question"], q["key"]) for q in value["questions"]}
+        return self.answer(value, key)
+
+
+# Worker -------------------------------------------------------------
+class Runner:
+    """Compiled graph of one process, shared by its worker threads."""
+
+    def __init__(self, fields: tuple[str, ...] = DEFAULT_FIELDS):
+        from langgraph.checkpoint.memory import InMemorySaver
+
+        import graph as parent_module
+        import subgraph_color
+        import subgraph_speed
+        from helpers import instrumentation
+        from helpers.questions import FORM_TYPE
+
+        self.fields = fields
+        self.form_type = FORM_TYPE
+        self.questions = {**subgraph_color.QUESTIONS, **subgraph_speed.QUESTIONS}
+        # agent (subgraph) name → the field its questions ask for
+        self.agent_keys = {
+            subgraph_color.color_agent.name: subgraph_color.OWNED_FIELDS[0],
+            subgraph_speed.speed_agent.name: subgraph_speed.OWNED_FIELDS[0],
+        }
+        # interrupts need a checkpointer; threads are dropped once a record is done
+        self.saver = InMemorySaver()
+        self.graph = instrumentation.instrument(
+            parent_module.parent.compile(checkpointer=self.saver, name="parent_graph"),
+            aliases={"delegate": parent_module.supervisor.name},
+        )
+
+    def _key_of(self, item: Any) -> str | None:
+        """Field asked for by the agent whose node raised interrupt ``item``."""
+        for segment in reversed(getattr(item, "ns", None) or ()):
+            node = segment.partition(":")[0]
+            match = _PLAN_NODE_RE.match(node)
+            agent = match.group(1) if match else node
+            if agent in self.agent_keys:
+                return self.agent_keys[agent]
+        return None
+
+    def _input(self, record: dict[str, Any]) -> dict[str, Any]:
+        if "input" in record:
+            return record["input"]
+        return {"messages": [{"role": "user", "content": record.get("message", "")}]}
+
+    def run(self, record: dict[str, Any]) -> dict[str, Any]:
+        from langgraph.types import Command
+
+        thread_id = f"batch-{record['id']}-{os.getpid()}-{threading.get_ident()}"
+        config: dict[str, Any] = {"configurable": {"thread_id": thread_id}}
+        if record.get("user_id") is not None:
+            config["configurable"]["user_id"] = record["user_id"]
+        script = _Script(record.get("answers"), self.questions, tuple(self.agent_keys.values()))
+        result: dict[str, Any] = {"id": record["id"], "status": "ok", "interrupts": 0}
+        t0 = time.perf_counter()
+        try:
+            data: Any = self._input(record)
+            while True:
+                self.graph.invoke(data, config)
+                state = self.graph.get_state(config)
+                if not state.interrupts:
+                    break
+                result["interrupts"] += len(state.interrupts)
+                data = Command(resume={
+                    item.interrupt_id: script.resume(item.value, self.form_type, self._key_of(item))
+                    for item in state.interrupts
+                })
+            result["output"] = {k: state.values.get(k) for k in self.fields}
+        except Exception as err:  # noqa: BLE001 – one bad record must not stop the batch
+            logger.warning("[batch] %s failed: %s", record["id"], err)
+            result.update(status="error", error=f"{type(err).__name__}: {err}")
+        finally:
+            self.saver.delete_thread(thread_id)
+        result["elapsed_ms"] = round((time.perf_counter() - t0) * 1e3, 1)
+        return result
+
+
+def _serve(tasks, results, threads: int, fields: tuple[str, ...]) -> None:
+    """Run records from ``tasks`` on ``threads`` threads until each got a stop sentinel."""
+    runner = Runner(fields)
+
+    def _loop() -> None:
+        while (record := tasks.get()) is not _STOP:
+            results.put(runner.run(record))
+
+    workers = [threading.Thread(target=_loop, daemon=True) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+# Driver -------------------------------------------------------------
+def run_batch(
+    input_path: str | Path,
+    output_path: str | Path,
+    *,
+    processes: int = os.cpu_count() or 1,
+    threads: int = 4,
+    fields: tuple[str, ...] = DEFAULT_FIELDS,
+    skip_errors: bool = False,
+) -> dict[str, int]:
+    """Run every unfinished record of ``input_path``; return ``{"ok", "error", "skipped"}`` counts."""
+    done = finished_ids(output_path, include_errors=skip_errors)
+    pending = sum(1 for r in read_records(input_path) if r["id"] not in done)
+    counts = {"ok": 0, "error": 0, "skipped": len(done)}
+    if not pending:
+        logger.info("[batch] nothing to do, %d records already finished", len(done))
+        return counts
+
+    workers = max(processes, 1) * threads
+    if processes:
+        ctx = mp.get_context("spawn")
+        tasks, results = ctx.Queue(maxsize=workers * 4), ctx.Queue()
+        pool = [
+            ctx.Process(target=_serve, args=(tasks, results, threads, fields), daemon=True)
+            for _ in range(processes)
+        ]
+    else:
+        tasks, results = queue.Queue(maxsize=workers * 4), queue.Queue()
+        pool = [threading.Thread(target=_serve, args=(tasks, results, threads, fields), daemon=True)]
+    for worker in pool:
+        worker.start()
+
+    def _feed() -> None:
+        for record in read_records(input_path):
+            if record["id"] not in done:
+                tasks.put(record)
+        for _ in range(workers):
+            tasks.put(_STOP)
+
+    threading.Thread(target=_feed, daemon=True).start()
+    logger.info("[batch] %d records on %d process(es) × %d thread(s), %d already done",
+                pending, max(processes, 1), threads, len(done))
+
+    t0 = time.perf_counter()
+    with _open_output(output_path) as out:
+        for received in range(1, pending + 1):
+            while True:
+                try:
+                    result = results.get(timeout=1.0)
+                    break
+                except queue.Empty:
+                    if not any(worker.is_alive() for worker in pool):
+                        raise RuntimeError(
+                            f"all workers exited with {pending - received + 1} records outstanding"
+                        ) from None
+            out.write(json.dumps(result, ensure_ascii=False, default=str) + "\n")
+            out.flush()
+            counts[result["status"]] += 1
+            if received % 100 == 0 or received == pending:
+                rate = received / (time.perf_counter() - t0)
+                logger.info("[batch] %d/%d (%.1f records/s, %d errors)",
+                            received, pending, rate, counts["error"])
+
+    for worker in pool:
+        worker.join(timeout=5)
+    return counts
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("input", help="JSONL file of records")
+    parser.add_argument("-o", "--output", required=True, help="JSONL results file (appended, resumable)")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1,
+                        help="worker processes; 0 runs in this process")
+    parser.add_argument("--threads", type=int, default=4, help="graph threads per process")
+    parser.add_argument("--fields", default=",".join(DEFAULT_FIELDS),
+                        help="comma-separated state fields to write per record")
+    parser.add_argument("--skip-errors", action="store_true",
+                        help="on restart, also skip records that failed before")
+    args = parser.parse_args(argv)
+
+    counts = run_batch(
+        args.input,
+        args.output,
+        processes=args.processes,
+        threads=args.threads,
+        fields=tuple(f for f in args.fields.split(",") if f),
+        skip_errors=args.skip_errors,
+    )
+    print(json.dumps(counts))
+    return 1 if counts["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,35 +4,56 @@ from dotenv import load_dotenv
 import random
 from typing import Any, Dict
 
+from helpers import answer_memory, cassette, instrumentation, llm_cache
+from helpers.models import get_chat_model
+from helpers.questions import BATCH_QUESTIONS, make_collect_answers
 from helpers.supervisor import create_supervisor
 from langgraph.graph import StateGraph, START
-from langchain_openai import ChatOpenAI
+from langgraph.utils.runnable import RunnableCallable
 from langchain_core.messages import SystemMessage
 
-from state.main_state import SharedState
+from state.lite import LITE_STATE, LiteStateGraph, validate_state
+from state.main_state import SharedState, SharedStateLite
+import subgraph_color
+import subgraph_speed
 from subgraph_color import color_agent
 from subgraph_speed import speed_agent
 
 logger = getLogger(__name__)
 load_dotenv()
 
+# `LLM_CASSETTE=…`: record / replay the model traffic (before any model is built)
+cassette.install_from_env()
+
+# `LITE_STATE=1`: nodes get a plain dataclass, validation only at the edges
+State = SharedStateLite if LITE_STATE else SharedState
+
 # 1️⃣  Supervisor with two workers
 supervisor = create_supervisor(
     agents=[color_agent, speed_agent],
-    model=ChatOpenAI(model="gpt-4o-mini"),
+    model=get_chat_model("gpt-4o-mini", cache=llm_cache.from_env(), single_flight=True),
     prompt=(
         "You manage two specialists:\n"
         "• color_agent – knows the car’s colour\n"
         "• speed_agent – knows the car’s speed\n\n"
-        "No matter what the user says, delegate the task, first delegate with "
-        "`transfer_to_color_agent`, wait, then delegate with "
-        "`transfer_to_speed_agent`, wait, and finally summarise."
+        "No matter what the user says, delegate the task: the two specialists are "
+        "independent, so call `transfer_to_color_agent` and `transfer_to_speed_agent` "
+        "together in the same turn, wait for both, and finally summarise."
         "Your goal is to obtain the color and the speed from the specialists and then combine them."
         "Don't directly answer the user other than the final summary. Instead, use `transfer_to_color_agent` and `transfer_to_speed_agent` until you have both information."
+        "If both specialists have already reported back, only write the summary."
     ),
     include_agent_name="inline",
     add_handoff_back_messages=True,
-    state_schema=SharedState,
+    fan_out=True,
+    # both specialists run up front as graph edges; the LLM only summarises
+    plan=[("color_agent", "speed_agent")],
+    owned_fields={
+        color_agent.name: subgraph_color.OWNED_FIELDS,
+        speed_agent.name: subgraph_speed.OWNED_FIELDS,
+    },
+    compact_handoffs=True,
+    state_schema=State,
 ).compile(name="supervisor")
 
 # 2️⃣  Node functions
@@ -59,6 +80,10 @@ def ensure_defaults(state: SharedState) -> Dict[str, Any]:
         "remaining_steps": remaining_steps,
     }
 
+async def aensure_defaults(state: SharedState) -> Dict[str, Any]:
+    # no I/O – keeps the async path free of sync hops
+    return ensure_defaults(state)
+
 def assemble(state: SharedState):
     logger.debug(f"[assemble] entry state: {state!r}")
     color = (state.color or "").strip()
@@ -75,20 +100,45 @@ def assemble(state: SharedState):
     logger.debug(f"[assemble] built sentence: {sentence!r}")
     return {
         "fullSentence": sentence,
-        "messages": state.messages
-        + [SystemMessage(content=f"combined into '{sentence}'")],
+        # the reducer appends – returning the history too would re-merge all of it
+        "messages": [SystemMessage(content=f"combined into '{sentence}'")],
     }
 
+async def aassemble(state: SharedState):
+    return assemble(state)
+
 # 3️⃣  Parent graph
-parent = StateGraph(SharedState)
-parent.add_node("init", ensure_defaults)
+# lite: unknown input keys still raise, see `state.lite.LiteStateGraph`
+parent = (LiteStateGraph if LITE_STATE else StateGraph)(State)
+parent.add_node("init", RunnableCallable(ensure_defaults, aensure_defaults))
 parent.add_node("delegate", supervisor)
-parent.add_node("assemble", assemble)
+parent.add_node("assemble", RunnableCallable(assemble, aassemble))
 
-parent.add_edge(START, "init")
-parent.add_edge("init", "delegate")
+if BATCH_QUESTIONS:
+    # every specialist question in one interrupt, before anyone is delegated
+    parent.add_node(
+        "collect_answers",
+        make_collect_answers(
+            {**subgraph_color.QUESTIONS, **subgraph_speed.QUESTIONS},
+            memory=answer_memory.from_env(),
+        ),
+    )
+    parent.add_edge("init", "collect_answers")
+    parent.add_edge("collect_answers", "delegate")
+else:
+    parent.add_edge("init", "delegate")
 parent.add_edge("delegate", "assemble")
+if LITE_STATE:
+    parent.add_node("validate_input", validate_state(State, "input"))
+    parent.add_node("validate_output", validate_state(State, "output"))
+    parent.add_edge(START, "validate_input")
+    parent.add_edge("validate_input", "init")
+    parent.add_edge("assemble", "validate_output")
+else:
+    parent.add_edge(START, "init")
 graph = parent.compile(name="parent_graph")
+# `GRAPH_METRICS=1` / `METRICS_PORT` / `METRICS_DUMP_PATH`: latency histograms per node, tool and model call
+graph = instrumentation.instrument(graph, aliases={"delegate": supervisor.name})
 
 # 4️⃣  Demo run
 if __name__ == "__main__":
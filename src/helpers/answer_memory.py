@@ -0,0 +1,154 @@
+# src\helpers\answer_memory.py
+"""
+Long-term memory of the answers a user already gave.
+
+The same user is asked "What colour should the car be?" in thread after
+thread, and every time it is a human round trip. ``AnswerMemory`` keeps the
+replies in a SQLite table keyed on ``(user, question)``: a collector that
+finds a fresh entry uses it and skips the interrupt; otherwise it asks and
+remembers the reply.
+
+• scope – the ``user_id`` in the run's ``configurable``; runs without one
+  neither read nor write the memory;
+• question – the ``answer_key`` a tool or form was built with (the field
+  it fills), else the normalised question text;
+• freshness – entries expire after ``ttl`` seconds, and the table keeps at
+  most ``max_entries`` rows (oldest writes go first).
+
+Callers count each question once it is settled – a hit when the memory
+answered it, a miss when a human had to – in ``answer_memory_hits_total`` /
+``answer_memory_misses_total`` (label ``key``); ``hit_rate()`` combines
+them. Counting at lookup time would count a miss twice, because an
+interrupted node runs again on resume; for the same reason the memory is
+only read before interrupting (``resuming``).
+
+    from helpers.answer_memory import AnswerMemory
+    memory = AnswerMemory(".cache/answers.sqlite", ttl=30 * 24 * 3600)
+    ask_user = make_ask_user("messagesColor", answer_key="color", memory=memory)
+"""
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Mapping
+
+from langgraph.constants import CONFIG_KEY_SCRATCHPAD
+
+from . import metrics
+from .sqlite_store import SQLiteTTLStore
+from logger.logger import getLogger
+
+logger = getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def question_key(question: str) -> str:
+    """Normalised question text, for questions without an explicit key."""
+    return _WHITESPACE_RE.sub(" ", question.strip()).casefold()
+
+
+def user_of(config: Mapping[str, Any] | None) -> str | None:
+    """The ``user_id`` of a run config, or None."""
+    user = ((config or {}).get("configurable") or {}).get("user_id")
+    return str(user) if user not in (None, "") else None
+
+
+def resuming(config: Mapping[str, Any] | None) -> bool:
+    """Whether the running node is being resumed with the reply to its interrupt.
+
+    LangGraph runs an interrupted node again from the top; the memory must
+    not be consulted then, or an answer stored since the question was asked
+    would win over the reply the human just gave.
+    """
+    scratchpad = ((config or {}).get("configurable") or {}).get(CONFIG_KEY_SCRATCHPAD)
+    if scratchpad is None:
+        return False
+    return bool(scratchpad.resume) or scratchpad.get_null_resume(False) is not None
+
+
+class AnswerMemory:
+    """Per-user ``question -> answer`` store with expiry and a size cap.
+
+    Args:
+        path: SQLite file, or ``":memory:"`` for a process-local memory.
+        ttl: Seconds an answer stays fresh; ``None`` keeps it until evicted.
+        max_entries: Rows kept across all users; ``None`` means unbounded.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = ":memory:",
+        *,
+        ttl: float | None = None,
+        max_entries: int | None = 10_000,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._store = SQLiteTTLStore(path, table="answer_memory", ttl=ttl)
+
+    @staticmethod
+    def _key(user: str, key: str) -> str:
+        return f"{user}\x1f{key}"
+
+    def get(self, user: str | None, key: str) -> str | None:
+        """Fresh answer of `user` to `key`, or None."""
+        if user is None:
+            return None
+        return self._store.get(self._key(user, key))
+
+    def put(self, user: str | None, key: str, answer: str) -> None:
+        """Remember `answer`; blank answers and runs without a user are ignored."""
+        if user is None or not answer.strip():
+            return
+        self._store.set(self._key(user, key), answer)
+        if self.max_entries is not None:
+            self._store.trim(self.max_entries)
+
+    def forget(self, user: str, key: str) -> None:
+        self._store.delete(self._key(user, key))
+
+    def purge_expired(self) -> int:
+        return self._store.purge_expired()
+
+    def size(self) -> int:
+        return len(self._store)
+
+
+def record(key: str, hit: bool) -> None:
+    """Count one settled question: answered from memory (`hit`) or by a human."""
+    metrics.inc("answer_memory_hits_total" if hit else "answer_memory_misses_total", key=key)
+
+
+def hit_rate(**labels: str) -> float:
+    """``hits / (hits + misses)`` so far, optionally for one ``key``; NaN before the first question."""
+    hits = metrics.get("answer_memory_hits_total", **labels)
+    total = hits + metrics.get("answer_memory_misses_total", **labels)
+    return hits / total if total else float("nan")
+
+
+_env_memory: AnswerMemory | None = None
+_env_lock = threading.Lock()
+
+
+def from_env() -> AnswerMemory | None:
+    """Process-wide memory configured by ``ANSWER_MEMORY_PATH`` / ``_TTL`` / ``_MAX_ENTRIES``.
+
+    Returns ``None`` (memory off) unless ``ANSWER_MEMORY_PATH`` is set.
+    """
+    global _env_memory
+    path = os.getenv("ANSWER_MEMORY_PATH")
+    if not path:
+        return None
+    with _env_lock:
+        if _env_memory is None:
+            ttl = os.getenv("ANSWER_MEMORY_TTL")
+            max_entries = os.getenv("ANSWER_MEMORY_MAX_ENTRIES")
+            _env_memory = AnswerMemory(
+                path,
+                ttl=float(ttl) if ttl else None,
+                max_entries=int(max_entries) if max_entries else 10_000,
+            )
+            logger.info("[answer_memory] enabled at %s (ttl=%s)", path, ttl or "∞")
+        return _env_memory
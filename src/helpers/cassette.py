@@ -0,0 +1,440 @@
+# src\helpers\cassette.py
+"""
+Record / replay cassettes for chat-model traffic.
+
+A synthetic fake model is fine for overhead numbers, but real traffic has
+real prompt lengths, tool calls and clarification loops. ``CassetteRecorder``
+wraps the real model once and writes every request / response pair of the
+supervisor, the collectors and the extractor to a cassette;
+``CassetteReplayModel`` serves the recorded responses back at full speed,
+without a network, so the same workload can run on every commit.
+
+Format – gzip JSONL, one header line and then one line per model call:
+
+    {"cassette": 1, "model": "gpt-4o-mini"}
+    {"agent": "delegate/supervisor_plan_0_color_agent/llm", "key": "…", "n": 3,
+     "last": "What colour …", "tools": ["ask_user", …], "ms": 812.4, "response": …}
+
+``key`` is the canonical prompt hash of ``helpers.llm_cache`` (message and
+tool-call ids don't matter) plus the bound tool schemas; requests are only
+summarised (``n`` messages, the ``last`` one clipped), the response is the
+serialised generation. A background thread writes the entries, each batch
+as its own gzip member, flushed right away – model calls never wait on the
+disk, and a killed recorder leaves a cassette that still loads.
+
+Replay looks every request up by key – fan-out makes the global order
+non-deterministic, the set of requests is not. A request that was never
+recorded is a divergence: it is logged, counted in
+``cassette_divergences_total`` and raises ``CassetteDivergence`` (or goes to
+``fallback`` when one is given). ``check()`` also reports recorded calls that
+were never requested. Set ``LLM_CASSETTE`` / ``LLM_CASSETTE_MODE`` to wire it
+into ``graph`` without code changes:
+
+    LLM_CASSETTE=.cache/run.jsonl.gz LLM_CASSETTE_MODE=record make graph-start
+    LLM_CASSETTE=.cache/run.jsonl.gz LLM_CASSETTE_MODE=replay python benchmarks/bench_cassette.py
+"""
+
+import asyncio
+import atexit
+import gzip
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+import zlib
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from langchain_core._api import suppress_langchain_beta_warning
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel, LangSmithParams
+from langchain_core.load import dumps, loads
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult
+from langchain_core.runnables import Runnable
+from langchain_core.runnables.config import var_child_runnable_config
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import ConfigDict, PrivateAttr
+
+from . import metrics
+from .llm_cache import _fresh_ids, canonical_prompt
+from .models import DEFAULT_MODEL, get_chat_model, register_chat_model
+from logger.logger import getLogger
+
+logger = getLogger(__name__)
+
+VERSION = 1
+_PREVIEW_CHARS = 120
+
+
+class CassetteDivergence(RuntimeError):
+    """A replayed run sent a request that is not on the cassette."""
+
+
+# Keys ---------------------------------------------------------------
+def request_key(messages: list[BaseMessage], tools: Sequence[dict] | None) -> str:
+    digest = hashlib.sha256()
+    digest.update(canonical_prompt(dumps(messages)).encode())
+    digest.update(b"\x00")
+    digest.update(json.dumps(list(tools or ()), sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def _agent(run_manager: Any) -> str:
+    """Node path of the calling run, e.g. ``delegate/supervisor_plan_0_color_agent/llm``."""
+    # wrappers (single-flight) call ``_generate`` without a run manager; the
+    # run config of the model call is still in the context
+    metadata = {
+        **((var_child_runnable_config.get() or {}).get("metadata") or {}),
+        **(getattr(run_manager, "inheritable_metadata", None) or {}),
+    }
+    ns = metadata.get("langgraph_checkpoint_ns") or metadata.get("langgraph_node") or ""
+    return "/".join(seg.partition(":")[0] for seg in ns.split("|"))
+
+
+def _summary(messages: list[BaseMessage], tools: Sequence[dict] | None) -> dict[str, Any]:
+    last = messages[-1].text() if messages else ""
+    return {
+        "n": len(messages),
+        "last": last[:_PREVIEW_CHARS],
+        "tools": [t.get("function", {}).get("name", "?") for t in tools or ()],
+    }
+
+
+# Recording ----------------------------------------------------------
+_CLOSE = None  # writer-queue sentinel
+
+
+class _Sink:
+    """Cassette writer thread of a recorder and its copies."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.lines: queue.SimpleQueue = queue.SimpleQueue()
+        self.thread: threading.Thread | None = None
+
+    def start(self, path: str, header: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.thread = threading.Thread(target=self._run, args=(path, header), name="cassette-writer", daemon=True)
+        self.thread.start()
+
+    def _run(self, path: str, header: str) -> None:
+        with open(path, "wb") as f:
+            f.write(gzip.compress(header.encode()))
+            f.flush()
+            while True:
+                batch = [self.lines.get()]
+                while True:
+                    try:
+                        batch.append(self.lines.get_nowait())
+                    except queue.Empty:
+                        break
+                lines = [line for line in batch if line is not _CLOSE]
+                if lines:
+                    f.write(gzip.compress("".join(lines).encode()))
+                    f.flush()
+                if len(lines) < len(batch):
+                    return
+
+
+class CassetteRecorder(BaseChatModel):
+    """Chat model that forwards to ``inner`` and appends every call to a cassette.
+
+    Structured output goes through ``bind_tools`` (function calling) while
+    recording, so replay sees the same tool-call shaped responses.
+    """
+
+    inner: BaseChatModel
+    path: str
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    # shared with the registry's copies (``model_copy`` keeps private values)
+    _sink: _Sink = PrivateAttr(default_factory=_Sink)
+
+    @property
+    def _llm_type(self) -> str:
+        return f"cassette-recorder-{self.inner._llm_type}"
+
+    def _get_llm_string(self, stop: Optional[list[str]] = None, **kwargs: Any) -> str:
+        return self.inner._get_llm_string(stop=stop, **kwargs)
+
+    def _get_ls_params(self, stop: Optional[list[str]] = None, **kwargs: Any) -> LangSmithParams:
+        return self.inner._get_ls_params(stop=stop, **kwargs)
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> Runnable:
+        binding = self.inner.bind_tools(tools, **kwargs)
+        return self.bind(**getattr(binding, "kwargs", {}))
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        sink = self._sink
+        with sink.lock:
+            if sink.thread is None:
+                model = getattr(self.inner, "model_name", None) or self.inner._llm_type
+                sink.start(self.path, json.dumps({"cassette": VERSION, "model": model}) + "\n")
+            sink.lines.put(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def _record(
+        self,
+        messages: list[BaseMessage],
+        kwargs: dict[str, Any],
+        run_manager: Any,
+        result: ChatResult,
+        elapsed: float,
+    ) -> None:
+        tools = kwargs.get("tools")
+        self._write({
+            "agent": _agent(run_manager),
+            "key": request_key(messages, tools),
+            **_summary(messages, tools),
+            "ms": round(elapsed * 1e3, 1),
+            "response": json.loads(dumps(list(result.generations))),
+        })
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        t0 = time.perf_counter()
+        result = self.inner._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        self._record(messages, kwargs, run_manager, result, time.perf_counter() - t0)
+        return result
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        t0 = time.perf_counter()
+        result = await self.inner._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        self._record(messages, kwargs, run_manager, result, time.perf_counter() - t0)
+        return result
+
+    def close(self) -> None:
+        """Write out every queued call and stop the writer; safe to call more than once."""
+        sink = self._sink
+        with sink.lock:
+            if sink.thread is not None:
+                sink.lines.put(_CLOSE)
+                sink.thread.join()
+                sink.thread = None
+                logger.info("[cassette] recorded %s", self.path)
+
+
+# Replay -------------------------------------------------------------
+class _Tape:
+    """Calls left to replay, shared by a replay model and its copies."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.by_key: dict[str, deque] = {}
+        self.replayed = 0
+        self.divergences: list[dict[str, Any]] = []
+
+
+def load_entries(path: str | Path) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Header and call entries of a cassette file; a torn tail (killed recorder) is dropped."""
+    entries = []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("cassette") != VERSION:
+            raise ValueError(f"{path}: unsupported cassette version {header.get('cassette')!r}.")
+        try:
+            for line in f:
+                if line.strip():
+                    entries.append(json.loads(line))
+        except (EOFError, gzip.BadGzipFile, zlib.error, ValueError) as err:
+            logger.warning("[cassette] %s is truncated after %d calls: %s", path, len(entries), err)
+    return header, entries
+
+
+class CassetteReplayModel(BaseChatModel):
+    """Chat model that answers from a recorded cassette.
+
+    Args:
+        path: Cassette written by ``CassetteRecorder``.
+        pace: Sleep ``pace`` × the recorded upstream time per call;
+            ``0`` replays at full speed.
+        fallback: Model for requests that are not on the cassette;
+            ``None`` raises ``CassetteDivergence``.
+        temperature: Accepted so callers can ask for ``temperature=0``;
+            the recording already fixed the replies.
+    """
+
+    path: str
+    pace: float = 0.0
+    fallback: Optional[BaseChatModel] = None
+    temperature: Optional[float] = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _entries: list[dict[str, Any]] = PrivateAttr(default_factory=list)
+    _tape: _Tape = PrivateAttr(default_factory=_Tape)
+
+    def model_post_init(self, context: Any) -> None:
+        _, self._entries = load_entries(self.path)
+        self.rewind()
+
+    @property
+    def _llm_type(self) -> str:
+        return "cassette-replay"
+
+    def bind_tools(
+        self,
+        tools: Sequence[Any],
+        *,
+        tool_choice: Optional[str] = None,
+        parallel_tool_calls: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Runnable:
+        return self.bind(tools=[convert_to_openai_tool(t) for t in tools], **kwargs)
+
+    def rewind(self) -> None:
+        """Make every recorded call available again and forget past divergences."""
+        by_key: dict[str, deque] = defaultdict(deque)
+        for entry in self._entries:
+            by_key[entry["key"]].append(entry)
+        tape = self._tape
+        with tape.lock:
+            tape.by_key = dict(by_key)
+            tape.replayed = 0
+            tape.divergences.clear()
+
+    def _take(
+        self,
+        messages: list[BaseMessage],
+        tools: Sequence[dict] | None,
+        run_manager: Any,
+    ) -> dict[str, Any] | None:
+        key = request_key(messages, tools)
+        tape = self._tape
+        with tape.lock:
+            queue = tape.by_key.get(key)
+            if queue:
+                tape.replayed += 1
+                return queue.popleft()
+            agent = _agent(run_manager)
+            got = _summary(messages, tools)
+            expected = next(
+                (
+                    {k: e[k] for k in ("n", "last", "tools")}
+                    for q in tape.by_key.values() for e in q if e["agent"] == agent
+                ),
+                None,
+            )
+            tape.divergences.append({"agent": agent, "key": key, "got": got, "expected": expected})
+
+        metrics.inc("cassette_divergences_total", agent=agent)
+        logger.warning("[cassette] divergence in %s: got %s, next recorded %s", agent, got, expected)
+        if self.fallback is None:
+            raise CassetteDivergence(f"{agent}: request {key[:12]} is not on the cassette {self.path}.")
+        return None
+
+    @staticmethod
+    def _result(entry: dict[str, Any]) -> ChatResult:
+        with suppress_langchain_beta_warning():
+            generations = loads(json.dumps(entry["response"]))
+        _fresh_ids(generations)
+        return ChatResult(generations=generations)
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        tools: list[dict] | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        entry = self._take(messages, tools, run_manager)
+        if entry is None:
+            return self.fallback._generate(messages, stop=stop, run_manager=run_manager, tools=tools, **kwargs)
+        if self.pace:
+            time.sleep(entry.get("ms", 0) / 1e3 * self.pace)
+        return self._result(entry)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        tools: list[dict] | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        entry = self._take(messages, tools, run_manager)
+        if entry is None:
+            return await self.fallback._agenerate(
+                messages, stop=stop, run_manager=run_manager, tools=tools, **kwargs
+            )
+        if self.pace:
+            await asyncio.sleep(entry.get("ms", 0) / 1e3 * self.pace)
+        return self._result(entry)
+
+    # Reporting
+    @property
+    def recorded(self) -> int:
+        return len(self._entries)
+
+    @property
+    def replayed(self) -> int:
+        return self._tape.replayed
+
+    @property
+    def divergences(self) -> list[dict[str, Any]]:
+        with self._tape.lock:
+            return list(self._tape.divergences)
+
+    def unused(self) -> list[dict[str, Any]]:
+        """Recorded calls nobody asked for (yet)."""
+        with self._tape.lock:
+            return [
+                {k: e[k] for k in ("agent", "key", "n", "last")}
+                for q in self._tape.by_key.values() for e in q
+            ]
+
+    def check(self) -> None:
+        """Raise ``CassetteDivergence`` unless the run matched the cassette exactly."""
+        divergences, unused = self.divergences, self.unused()
+        if divergences or unused:
+            raise CassetteDivergence(
+                f"{self.path}: {len(divergences)} unrecorded request(s), "
+                f"{len(unused)} recorded call(s) never requested; "
+                f"first: {(divergences or unused)[0]}"
+            )
+
+
+# Wiring -------------------------------------------------------------
+def install(path: str | Path, mode: str, model: str = DEFAULT_MODEL, **kwargs: Any) -> BaseChatModel:
+    """Serve ``model`` through a recorder or a replay of ``path`` (``mode``: record / replay).
+
+    Call before anything asks the registry for ``model``; ``kwargs`` go to
+    the replay model (``pace``, ``fallback``).
+    """
+    if mode == "record":
+        instance: BaseChatModel = CassetteRecorder(inner=get_chat_model(model), path=str(path))
+        atexit.register(instance.close)
+    elif mode == "replay":
+        instance = CassetteReplayModel(path=str(path), **kwargs)
+    else:
+        raise ValueError(f"Unknown cassette mode '{mode}', expected 'record' or 'replay'.")
+    register_chat_model(model, instance)
+    logger.info("[cassette] %s %s as %s", mode, path, model)
+    return instance
+
+
+def install_from_env() -> BaseChatModel | None:
+    """``install(LLM_CASSETTE, LLM_CASSETTE_MODE or "replay")``; ``None`` unless ``LLM_CASSETTE`` is set."""
+    path = os.getenv("LLM_CASSETTE")
+    if not path:
+        return None
+    return install(path, os.getenv("LLM_CASSETTE_MODE", "replay"))
@@ -0,0 +1,212 @@
+# src\helpers\collector.py
+"""
+Building blocks shared by the field-collector subgraphs (color / speed).
+"""
+
+import asyncio
+import uuid
+from typing import Any, Type
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolCall
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool
+from langgraph.types import interrupt
+from langgraph.utils.runnable import RunnableCallable
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, create_model
+
+from helpers import answer_memory
+from helpers.answer_memory import AnswerMemory
+from helpers.models import get_structured_model
+from logger.logger import getLogger
+
+logger = getLogger(__name__)
+
+
+def make_scripted_preamble(
+    get_state_tool: BaseTool,
+    key: str,
+    messages_key: str,
+    agent_name: str,
+) -> RunnableCallable:
+    """Node that plays a collector's first, fully predictable turn without the LLM.
+
+    Every collector prompt starts with "call `get_state` with {"key": <key>}", so
+    instead of paying a model round trip for that decision the node appends the
+    tool call and the real tool result to ``messages_key``. The LLM then starts
+    from the point where it already knows the stored value.
+    """
+
+    def _tool_call() -> ToolCall:
+        return ToolCall(
+            name=get_state_tool.name,
+            args={"key": key},
+            id=f"call_preamble_{uuid.uuid4().hex[:16]}",
+        )
+
+    def _update(tool_call: ToolCall, result: Any) -> dict:
+        logger.debug("[%s.preamble] %s(%r) → %r", agent_name, tool_call["name"], key, result.content)
+        ai = AIMessage(content="", name=agent_name, tool_calls=[tool_call])
+        return {messages_key: [ai, result]}
+
+    def preamble(state: Any) -> dict:
+        tool_call = _tool_call()
+        # a ToolCall input makes the tool return a ready ToolMessage
+        result = get_state_tool.invoke(
+            {**tool_call, "args": {**tool_call["args"], "state": state}, "type": "tool_call"}
+        )
+        return _update(tool_call, result)
+
+    async def apreamble(state: Any) -> dict:
+        tool_call = _tool_call()
+        result = await get_state_tool.ainvoke(
+            {**tool_call, "args": {**tool_call["args"], "state": state}, "type": "tool_call"}
+        )
+        return _update(tool_call, result)
+
+    return RunnableCallable(preamble, apreamble)
+
+
+def make_structured_extractor(
+    field: str,
+    question: str,
+    messages_key: str,
+    agent_name: str,
+    state_schema: Type[BaseModel],
+    answer_key: str | None = None,
+    memory: AnswerMemory | None = None,
+    **model_kwargs: Any,
+) -> RunnableCallable:
+    """Node that collects ``field`` with one interrupt and one structured LLM call.
+
+    The node asks ``question`` directly, has the model extract the answer with
+    ``with_structured_output`` and validates it against the type of
+    ``state_schema.<field>``. On success the value is written to the state; on
+    failure only the question / reply pair is added to ``messages_key`` and the
+    caller routes to the regular tool loop (see ``route_after_extract``).
+    Returns ``{}`` when the field is already filled in.
+
+    With ``answer_key``, a reply already waiting in ``state.pending_answers``
+    (see ``helpers.questions``) is used – and removed – instead of interrupting.
+    With ``memory``, a fresh answer the same user gave in an earlier thread is
+    used instead of interrupting (see ``helpers.answer_memory``); replies that
+    validate are remembered.
+    """
+    if field not in state_schema.model_fields:
+        raise ValueError(f"'{field}' is not a field of {state_schema.__name__}.")
+
+    field_adapter = TypeAdapter(state_schema.model_fields[field].annotation)
+    answer_schema = create_model(
+        f"{field.title()}Answer",
+        value=(str, Field(description=f"The {field} given in the user's reply, as a single value.")),
+    )
+    system = SystemMessage(
+        content=(
+            f"Extract the {field} from the user's reply to the question "
+            f"{question!r}. Return only the value, without extra words."
+        )
+    )
+
+    memory_key = answer_key or field
+
+    def _from_state(state: Any) -> tuple[str | None, str] | None:
+        """``(None, "state")`` when the field is set, a batched answer, or ``None``."""
+        if getattr(state, field, None):
+            return None, "state"
+        if answer_key is not None:
+            answer = (getattr(state, "pending_answers", None) or {}).get(answer_key)
+            if answer is not None:
+                logger.info("[%s.extract] batched answer for %r", agent_name, question)
+                return answer, "state"
+        return None
+
+    def _recalled_or_asked(remembered: str | None) -> tuple[str, str]:
+        if remembered is not None:
+            logger.info("[%s.extract] remembered answer for %r", agent_name, question)
+            return remembered, "memory"
+        logger.info("[%s.extract] asking %r", agent_name, question)
+        return interrupt(question), "human"
+
+    def _ask(state: Any, user: str | None, config: RunnableConfig) -> tuple[str | None, str]:
+        """The reply, and where it came from: "state", "memory" or "human"."""
+        if (found := _from_state(state)) is not None:
+            return found
+        recall = user is not None and not answer_memory.resuming(config)
+        return _recalled_or_asked(memory.get(user, memory_key) if recall else None)
+
+    async def _aask(state: Any, user: str | None, config: RunnableConfig) -> tuple[str | None, str]:
+        if (found := _from_state(state)) is not None:
+            return found
+        # the store may be SQLite – keep its reads off the event loop
+        recall = user is not None and not answer_memory.resuming(config)
+        remembered = await asyncio.to_thread(memory.get, user, memory_key) if recall else None
+        return _recalled_or_asked(remembered)
+
+    def _user(config: RunnableConfig) -> str | None:
+        return answer_memory.user_of(config) if memory is not None else None
+
+    def _remember(user: str | None, source: str, value: Any | None) -> bool:
+        """Count the answer; ``True`` if it is a new reply to store."""
+        if user is None or source == "state":
+            return False
+        answer_memory.record(memory_key, hit=source == "memory")
+        return source == "human" and value is not None
+
+    def _validated(answer: Any) -> Any:
+        value = field_adapter.validate_python(answer.value.strip())
+        if not value:
+            raise ValueError("empty answer")
+        return value
+
+    def _update(reply: str, value: Any | None) -> dict:
+        thread = [AIMessage(content=question, name="assistant"), HumanMessage(content=reply)]
+        update = {messages_key: thread}
+        if answer_key is not None:
+            update["pending_answers"] = {answer_key: None}
+        if value is None:
+            return update
+        logger.info("[%s.extract] %s ← %r", agent_name, field, value)
+        return {field: value, **update}
+
+    def extract(state: Any, config: RunnableConfig) -> dict:
+        user = _user(config)
+        reply, source = _ask(state, user, config)
+        if reply is None:
+            return {}
+        llm = get_structured_model(answer_schema, **model_kwargs)
+        try:
+            value = _validated(llm.invoke([system, HumanMessage(content=reply)]))
+        except (ValidationError, ValueError, AttributeError) as err:
+            logger.warning("[%s.extract] falling back to tool loop: %s", agent_name, err)
+            value = None
+        if _remember(user, source, value):
+            memory.put(user, memory_key, reply)
+        return _update(reply, value)
+
+    async def aextract(state: Any, config: RunnableConfig) -> dict:
+        user = _user(config)
+        reply, source = await _aask(state, user, config)
+        if reply is None:
+            return {}
+        llm = get_structured_model(answer_schema, **model_kwargs)
+        try:
+            value = _validated(await llm.ainvoke([system, HumanMessage(content=reply)]))
+        except (ValidationError, ValueError, AttributeError) as err:
+            logger.warning("[%s.extract] falling back to tool loop: %s", agent_name, err)
+            value = None
+        if _remember(user, source, value):
+            await asyncio.to_thread(memory.put, user, memory_key, reply)
+        return _update(reply, value)
+
+    return RunnableCallable(extract, aextract)
+
+
+def route_after_extract(field: str, done: str, fallback: str) -> RunnableCallable:
+    """Go to ``done`` once ``field`` is set, otherwise to the ``fallback`` tool loop."""
+
+    def route(state: Any) -> str:
+        return done if getattr(state, field, None) else fallback
+
+    async def aroute(state: Any) -> str:
+        return route(state)
+
+    return RunnableCallable(route, aroute)
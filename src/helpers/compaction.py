@@ -0,0 +1,143 @@
+# src\helpers\compaction.py
+"""
+Token-budgeted compaction of a private agent thread before an LLM call.
+
+``messagesColor`` / ``messagesSpeed`` only ever grow, and every turn of a
+collector's clarification loop sends the whole thread back to the model.
+``compact_history`` keeps the system prompt, the latest turn and as many
+recent turns as fit in ``budget`` tokens, and replaces everything older
+with one short, deterministic summary message. Tool exchanges (an
+``AIMessage`` with ``tool_calls`` plus its ``ToolMessage`` results) are
+kept or dropped as a whole so the request stays valid.
+
+Only the model input is compacted – the state keeps the full thread.
+Tokens saved are counted in ``history_tokens_saved_total``.
+"""
+
+from typing import Callable, Sequence
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langchain_core.messages.utils import count_tokens_approximately
+
+from . import metrics
+from logger.logger import getLogger
+
+logger = getLogger(__name__)
+
+TokenCounter = Callable[[Sequence[BaseMessage]], int]
+
+# the summary shows at most this many entries, each clipped to this many characters
+_SUMMARY_ENTRIES = 12
+_SUMMARY_CHARS = 80
+
+
+def _turns(messages: Sequence[BaseMessage]) -> list[list[BaseMessage]]:
+    """Split a thread into turns; tool results stay with the call that made them."""
+    turns: list[list[BaseMessage]] = []
+    for message in messages:
+        if (
+            isinstance(message, ToolMessage)
+            and turns
+            and isinstance(turns[-1][0], AIMessage)
+            and turns[-1][0].tool_calls
+        ):
+            turns[-1].append(message)
+        else:
+            turns.append([message])
+    return turns
+
+
+def _clip(text: object) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= _SUMMARY_CHARS else text[: _SUMMARY_CHARS - 1] + "…"
+
+
+def _entries(message: BaseMessage) -> list[str]:
+    if isinstance(message, AIMessage) and message.tool_calls:
+        return [f"called {c['name']}({_clip(c['args'])})" for c in message.tool_calls]
+    if isinstance(message, ToolMessage):
+        return [f"{message.name or 'tool'} returned {_clip(message.content)}"]
+    if isinstance(message, HumanMessage):
+        return [f"user said {_clip(message.content)}"]
+    if message.content:
+        return [f"{message.type} said {_clip(message.content)}"]
+    return []
+
+
+def _summarize(dropped: Sequence[BaseMessage]) -> SystemMessage:
+    # newest entries win; only walk as far back as the summary can show
+    entries: list[str] = []
+    shown = 0
+    for message in reversed(dropped):
+        if len(entries) >= _SUMMARY_ENTRIES:
+            break
+        entries[:0] = _entries(message)
+        shown += 1
+    if shown < len(dropped):
+        entries.insert(0, f"({len(dropped) - shown} older messages omitted)")
+    return SystemMessage(
+        content=f"Summary of {len(dropped)} earlier messages: " + "; ".join(entries) + "."
+    )
+
+
+def compact_history(
+    messages: Sequence[BaseMessage],
+    budget: int | None,
+    *,
+    prefix: Sequence[BaseMessage] = (),
+    agent: str = "",
+    counter: TokenCounter = count_tokens_approximately,
+) -> list[BaseMessage]:
+    """Return ``[*prefix, *messages]``, compacted to roughly ``budget`` tokens.
+
+    Args:
+        messages: The agent's private thread.
+        budget: Token budget for the whole request; ``None`` disables compaction.
+        prefix: Messages that are always kept in front (the system prompt).
+        agent: Label for the metrics.
+        counter: Token counter, ``count_tokens_approximately`` by default.
+
+    The latest turn is always kept, even if it alone exceeds the budget.
+    """
+    full = [*prefix, *messages]
+    if budget is None or not messages:
+        return full
+    turns = _turns(messages)
+    costs = [counter(turn) for turn in turns]
+    fixed = counter(prefix) if prefix else 0
+    total = fixed + sum(costs)
+    if total <= budget:
+        return full
+
+    # newest first: the latest turn always stays, older ones while they fit
+    keep_from = len(turns) - 1
+    used = fixed + costs[keep_from]
+    while keep_from > 0 and used + costs[keep_from - 1] <= budget:
+        keep_from -= 1
+        used += costs[keep_from]
+    if keep_from == 0:
+        return full
+
+    # the summary itself costs tokens – give up more turns until it fits
+    while True:
+        summary = _summarize([m for turn in turns[:keep_from] for m in turn])
+        if keep_from == len(turns) - 1 or used + counter([summary]) <= budget:
+            break
+        used -= costs[keep_from]
+        keep_from += 1
+
+    compacted = [*prefix, summary, *(m for turn in turns[keep_from:] for m in turn)]
+    saved = total - counter(compacted)
+    metrics.inc("history_compactions_total", agent=agent)
+    metrics.inc("history_tokens_saved_total", max(saved, 0), agent=agent)
+    logger.debug(
+        "[compaction] %s: %d → %d messages, %d tokens saved",
+        agent, len(full), len(compacted), saved,
+    )
+    return compacted
@@ -0,0 +1,256 @@
+# src\helpers\fake_llm.py
+"""
+Offline chat model for load tests and benchmarks.
+
+``FakeChatModel`` never touches the network: every call is answered by a
+``responder`` callable and optionally delayed by a ``latency`` – a fixed
+number of seconds or a ``Latency`` distribution, ``time.sleep`` on the sync
+path, ``asyncio.sleep`` on the async path – so it behaves like a slow
+remote model without a real endpoint. Replies carry approximate
+``usage_metadata`` token counts, like a real provider's.
+
+Register it to replace the real model everywhere (supervisor, both
+collectors, structured extraction), or under its own name for one builder:
+
+    from helpers.fake_llm import FakeChatModel, Latency, scripted
+    from helpers.models import DEFAULT_MODEL, register_chat_model
+
+    register_chat_model(DEFAULT_MODEL, FakeChatModel(
+        responder=scripted([AIMessage(content="hi")], fallback=my_policy),
+        latency=Latency.lognormal(median=0.8, sigma=0.4),
+        seed=0,
+    ))
+"""
+
+import asyncio
+import math
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence, Union
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import PrivateAttr
+
+Responder = Callable[[list[BaseMessage], list[dict]], AIMessage]
+"""``(messages, bound_tool_schemas) -> AIMessage``"""
+
+
+def _echo(messages: list[BaseMessage], tools: list[dict]) -> AIMessage:
+    return AIMessage(content=str(messages[-1].content) if messages else "")
+
+
+# Latency ------------------------------------------------------------
+@dataclass(frozen=True)
+class Latency:
+    """Per-call delay distribution in seconds; samples are clipped at 0.
+
+    Build one with the constructors: ``fixed``, ``uniform``, ``normal``,
+    ``lognormal`` (heavy right tail, like real completions) or
+    ``empirical`` (replay measured latencies).
+    """
+
+    kind: str
+    params: tuple[float, ...]
+
+    @classmethod
+    def fixed(cls, seconds: float) -> "Latency":
+        return cls("fixed", (seconds,))
+
+    @classmethod
+    def uniform(cls, low: float, high: float) -> "Latency":
+        return cls("uniform", (low, high))
+
+    @classmethod
+    def normal(cls, mean: float, stddev: float) -> "Latency":
+        return cls("normal", (mean, stddev))
+
+    @classmethod
+    def lognormal(cls, median: float, sigma: float) -> "Latency":
+        return cls("lognormal", (median, sigma))
+
+    @classmethod
+    def empirical(cls, samples: Iterable[float]) -> "Latency":
+        samples = tuple(samples)
+        if not samples:
+            raise ValueError("Latency.empirical needs at least one sample.")
+        return cls("empirical", samples)
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        """``"0.05"``, ``"uniform:0.01,0.1"``, ``"lognormal:0.8,0.4"``, ... (CLI flags)."""
+        kind, _, args = spec.partition(":")
+        if not args:
+            return cls.fixed(float(kind))
+        values = [float(v) for v in args.split(",")]
+        if kind == "empirical":
+            return cls.empirical(values)
+        if kind not in ("fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"Unknown latency distribution '{kind}'.")
+        return getattr(cls, kind)(*values)
+
+    def sample(self, rng: random.Random) -> float:
+        p = self.params
+        if self.kind == "fixed":
+            value = p[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(p[0], p[1])
+        elif self.kind == "normal":
+            value = rng.gauss(p[0], p[1])
+        elif self.kind == "lognormal":
+            value = rng.lognormvariate(math.log(p[0]), p[1]) if p[0] > 0 else 0.0
+        else:
+            value = rng.choice(p)
+        return max(0.0, value)
+
+
+# Scripts ------------------------------------------------------------
+Reply = Union[AIMessage, str, Mapping[str, Any]]
+"""An ``AIMessage``, its text, or ``{"content": ..., "tool_calls": [{"name", "args"}]}``."""
+
+
+def _as_message(reply: Reply) -> AIMessage:
+    if isinstance(reply, AIMessage):
+        # each call hands out its own copy – replies end up in state
+        return reply.model_copy(deep=True)
+    if isinstance(reply, str):
+        return AIMessage(content=reply)
+    tool_calls = [
+        {"name": call["name"], "args": call.get("args", {}),
+         "id": call.get("id") or f"call_{uuid.uuid4().hex[:12]}"}
+        for call in reply.get("tool_calls", ())
+    ]
+    return AIMessage(content=reply.get("content", ""), tool_calls=tool_calls)
+
+
+def scripted(
+    replies: Iterable[Reply] | Mapping[str, Iterable[Reply]],
+    fallback: Responder | None = None,
+) -> Responder:
+    """Responder that plays ``replies`` in order, then defers to ``fallback``.
+
+    ``replies`` may also map a marker to its own script: a call takes the
+    next reply of the first marker found in its system prompt (e.g. one
+    script per agent). Without a fallback, running out of replies raises
+    ``IndexError`` – a script that is too short is a broken test.
+    """
+    if isinstance(replies, Mapping):
+        queues = {marker: deque(script) for marker, script in replies.items()}
+    else:
+        queues = {"": deque(replies)}
+    lock = threading.Lock()
+
+    def _queue(messages: list[BaseMessage]) -> deque | None:
+        system = "\n".join(str(m.content) for m in messages if m.type == "system")
+        return next((q for marker, q in queues.items() if marker in system), None)
+
+    def respond(messages: list[BaseMessage], tools: list[dict]) -> AIMessage:
+        with lock:
+            queue = _queue(messages)
+            reply = queue.popleft() if queue else None
+        if reply is not None:
+            return _as_message(reply)
+        if fallback is None:
+            raise IndexError("Fake model script exhausted.")
+        return fallback(messages, tools)
+
+    return respond
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model whose replies come from ``responder`` after ``latency`` seconds.
+
+    Args:
+        responder: ``(messages, tools) -> AIMessage``; see ``scripted``.
+        latency: Seconds per call, or a ``Latency`` distribution.
+        seed: Seed for the latency samples, for repeatable runs.
+        usage: Attach approximate ``usage_metadata`` token counts to replies
+            that do not carry their own.
+        model_name: Reported as ``ls_model_name`` (tracing, metrics labels).
+        temperature: Accepted so callers can ask for ``temperature=0``;
+            replies do not depend on it.
+    """
+
+    model_name: str = "fake-chat-model"
+    temperature: Optional[float] = None
+    responder: Responder = _echo
+    latency: Union[float, Latency] = 0.0
+    seed: Optional[int] = None
+    usage: bool = True
+
+    _rng: random.Random = PrivateAttr(default_factory=random.Random)
+
+    def model_post_init(self, context: Any) -> None:
+        super().model_post_init(context)
+        if self.seed is not None:
+            self._rng.seed(self.seed)
+
+    def _delay(self) -> float:
+        if isinstance(self.latency, Latency):
+            return self.latency.sample(self._rng)
+        return self.latency
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat-model"
+
+    def bind_tools(
+        self,
+        tools: Sequence[Any],
+        *,
+        tool_choice: Optional[str] = None,
+        parallel_tool_calls: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Runnable:
+        return self.bind(tools=[convert_to_openai_tool(t) for t in tools], **kwargs)
+
+    def _respond(self, messages: list[BaseMessage], tools: list[dict] | None) -> ChatResult:
+        message = self.responder(messages, tools or [])
+        if message.id is None:
+            message.id = f"fake-{uuid.uuid4()}"
+        if self.usage and message.usage_metadata is None:
+            # the bound tool schemas are part of a real prompt, too
+            prompt = count_tokens_approximately(messages) + sum(len(str(t)) for t in tools or ()) // 4
+            completion = count_tokens_approximately([message])
+            message.usage_metadata = {
+                "input_tokens": prompt,
+                "output_tokens": completion,
+                "total_tokens": prompt + completion,
+            }
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        tools: list[dict] | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if delay := self._delay():
+            time.sleep(delay)
+        return self._respond(messages, tools)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        tools: list[dict] | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if delay := self._delay():
+            await asyncio.sleep(delay)
+        return self._respond(messages, tools)
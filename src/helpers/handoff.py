@@ -1,40 +1,79 @@
 # src\helpers\handoff.py
 
+import dataclasses
 import re
 import uuid
-from typing import TypeGuard, cast, Any, Mapping
-from pydantic import BaseModel
+from typing import TypeGuard, cast, Any, Mapping, Sequence
+from pydantic import BaseModel, PlainSerializer
 
-from langchain_core.messages import AIMessage, ToolCall, ToolMessage
+from langchain_core.messages import AIMessage, BaseMessage, ToolCall, ToolMessage
 from langchain_core.tools import BaseTool, InjectedToolCallId, tool
 from langgraph.prebuilt import InjectedState
 from langgraph.types import Command, Send
 from typing_extensions import Annotated
 
 from logger.logger import getLogger
+from state.lite import as_dict
+from state.messages import MessageView
 
 
 logger = getLogger(__name__)
 
 WHITESPACE_RE = re.compile(r"\s+")
+
+# LangChain's argument parsing `model_dump`s the validated tool args just to
+# read back their keys, which would serialise the whole injected state on
+# every call. The tool receives the original object either way.
+SKIP_DUMP = PlainSerializer(lambda _: None)
 METADATA_KEY_HANDOFF_DESTINATION = "__handoff_destination"
 METADATA_KEY_IS_HANDOFF_BACK = "__is_handoff_back"
+METADATA_KEY_HANDOFF_INDEX = "__handoff_index"
 
 # Helper -------------------------------------------------------------
 def _state_as_dict(state: Any) -> dict:
     """
-    Return a plain dict copy of the state **but keep the original
-    message objects** so they still have `.tool_calls`, `.name`, etc.
+    Return a shallow dict view of the state: same field values, same
+    message objects (so they still have `.tool_calls`, `.name`, etc.).
+    No `model_dump` – nothing is copied or converted.
     """
     if isinstance(state, BaseModel):
-        data = state.model_dump(exclude={"messages"})  # all other keys
-        data["messages"] = state.messages              # keep objects
-        return data
+        return dict(state)  # field name → value, including extras
     elif isinstance(state, Mapping):
         return dict(state)  # shallow copy, keep messages untouched
+    elif dataclasses.is_dataclass(state):
+        return as_dict(state)  # lite state, see `state.lite`
     else:  # shouldn't happen
         raise TypeError(f"Unexpected state type: {type(state)}")
 
+
+def _supervisor_run_messages(messages: list[BaseMessage]) -> list[BaseMessage]:
+    """Trailing messages the supervisor added during its current run.
+
+    Everything before them is already in the parent graph's state, so a
+    handoff only has to send these. Walks back from the handoff tool call
+    over the supervisor's own AI messages and plain tool results, and stops
+    at the first message that came from elsewhere (user, agent, earlier
+    handoff). Sending a message the parent already has is harmless – the
+    reducer matches it by id – so stopping late is safe, stopping early is not.
+    """
+    supervisor_name = messages[-1].name
+    start = len(messages) - 1
+    while start > 0:
+        previous = messages[start - 1]
+        metadata = previous.response_metadata
+        if metadata.get(METADATA_KEY_IS_HANDOFF_BACK) or metadata.get(
+            METADATA_KEY_HANDOFF_DESTINATION
+        ):
+            break
+        if isinstance(previous, ToolMessage) or (
+            isinstance(previous, AIMessage) and previous.name == supervisor_name
+        ):
+            start -= 1
+            continue
+        break
+    return messages[start:]
+
+
 def _normalize_agent_name(agent_name: str) -> str:
     """Normalize an agent name to be used inside the tool name."""
     return WHITESPACE_RE.sub("_", agent_name.strip()).lower()
@@ -106,7 +145,7 @@ def create_handoff_tool(
     @tool(name, description=description)
     def handoff_to_agent(
         # accept either a mapping **or** a Pydantic model
-        state: Annotated[Any, InjectedState],
+        state: Annotated[Any, InjectedState, SKIP_DUMP],
         tool_call_id: Annotated[str, InjectedToolCallId],
     ) -> Command:
         # Normalise to a plain dict, which the rest of this function expects
@@ -120,13 +159,20 @@ def create_handoff_tool(
         last_ai_message = cast(AIMessage, state["messages"][-1])
         # Handle parallel handoffs
         if len(last_ai_message.tool_calls) > 1:
-            handoff_messages = state["messages"][:-1]
+            # every destination shares the supervisor's history instead of
+            # getting its own copy – building N payloads is O(N), not O(N × history)
+            handoff_messages = MessageView.of(state["messages"], -1)
             if add_handoff_messages:
-                handoff_messages.extend(
-                    (
-                        _remove_non_handoff_tool_calls(last_ai_message, tool_call_id),
-                        tool_message,
-                    )
+                # position of this call in the supervisor turn, so fan-in can
+                # restore the original tool-call order deterministically
+                tool_message.response_metadata[METADATA_KEY_HANDOFF_INDEX] = next(
+                    i
+                    for i, tool_call in enumerate(last_ai_message.tool_calls)
+                    if tool_call["id"] == tool_call_id
+                )
+                handoff_messages += (
+                    _remove_non_handoff_tool_calls(last_ai_message, tool_call_id),
+                    tool_message,
                 )
             return Command(
                 graph=Command.PARENT,
@@ -140,20 +186,56 @@ def create_handoff_tool(
                 "[handoff] %s called – handing control to %s (tool_call_id=%s)",
                 name, agent_name, tool_call_id,
             )
+            # only what the supervisor added in this run – the parent already
+            # has every other message and every other field unchanged
+            new_messages = _supervisor_run_messages(state["messages"])
             if add_handoff_messages:
-                handoff_messages = state["messages"] + [tool_message]
+                new_messages = new_messages + [tool_message]
             else:
-                handoff_messages = state["messages"][:-1]
+                new_messages = new_messages[:-1]
             return Command(
                 goto=agent_name,
                 graph=Command.PARENT,
-                update={**state, "messages": handoff_messages},
+                update={"messages": new_messages},
             )
 
     handoff_to_agent.metadata = {METADATA_KEY_HANDOFF_DESTINATION: agent_name}
     return handoff_to_agent
 
 
+def create_handoff_messages(
+    agent_name: str,
+    supervisor_name: str,
+    tool_name: str | None = None,
+    index: int | None = None,
+) -> tuple[AIMessage, ToolMessage]:
+    """Create the (AIMessage, ToolMessage) pair a handoff tool call would have produced.
+
+    Used when a delegation is driven by the graph itself (e.g. a supervisor plan)
+    rather than by the supervisor LLM, so the history still reads like a handoff.
+    Pass `index` for handoffs that run in parallel, mirroring the parallel branch
+    of `create_handoff_tool`.
+    """
+    tool_call_id = str(uuid.uuid4())
+    tool_name = tool_name or f"transfer_to_{_normalize_agent_name(agent_name)}"
+    response_metadata: dict[str, Any] = {METADATA_KEY_HANDOFF_DESTINATION: agent_name}
+    if index is not None:
+        response_metadata[METADATA_KEY_HANDOFF_INDEX] = index
+    return (
+        AIMessage(
+            content="",
+            tool_calls=[ToolCall(name=tool_name, args={}, id=tool_call_id)],
+            name=supervisor_name,
+        ),
+        ToolMessage(
+            content=f"Successfully transferred to {agent_name}",
+            name=tool_name,
+            tool_call_id=tool_call_id,
+            response_metadata=response_metadata,
+        ),
+    )
+
+
 def create_handoff_back_messages(
     agent_name: str, supervisor_name: str
 ) -> tuple[AIMessage, ToolMessage]:
@@ -177,6 +259,53 @@ def create_handoff_back_messages(
     )
 
 
+def compact_handoff_messages(messages: Sequence[BaseMessage]) -> list[BaseMessage]:
+    """Collapse every completed delegation into its handoff tool call + result.
+
+    A delegation normally costs four extra messages in the supervisor's
+    history: the transfer tool call and its "Successfully transferred"
+    result, then the agent's transfer-back tool call and result. This keeps
+    the supervisor's transfer tool call, puts the agent's reply into that
+    call's ``ToolMessage`` (so every tool call still has exactly one result)
+    and drops the agent's reply and the handoff-back pair. Messages an agent
+    produced with tool calls of its own (``output_mode="full_history"``)
+    are left in place.
+    """
+    compacted: list[BaseMessage] = []
+    # agent name → position of its handoff ToolMessage in `compacted`
+    open_handoffs: dict[str, int] = {}
+    answered: set[int] = set()
+
+    for message in messages:
+        if message.response_metadata.get(METADATA_KEY_IS_HANDOFF_BACK):
+            continue
+        if isinstance(message, ToolMessage):
+            destination = message.response_metadata.get(METADATA_KEY_HANDOFF_DESTINATION)
+            if destination:
+                open_handoffs[destination] = len(compacted)
+            compacted.append(message)
+            continue
+        position = open_handoffs.get(message.name or "")
+        if (
+            position is not None
+            and isinstance(message, AIMessage)
+            and not message.tool_calls
+            and message.content
+        ):
+            handoff = compacted[position]
+            text = message.text()
+            if position in answered:
+                text = f"{handoff.content}\n{text}"
+            compacted[position] = handoff.model_copy(update={"content": text})
+            answered.add(position)
+            continue
+        if isinstance(message, AIMessage) and message.name not in open_handoffs:
+            # the supervisor speaks again – earlier delegations are closed
+            open_handoffs.clear()
+        compacted.append(message)
+    return compacted
+
+
 def create_forward_message_tool(supervisor_name: str = "supervisor") -> BaseTool:
     """Create a tool the supervisor can use to forward a worker message by name.
 
@@ -199,7 +328,7 @@ def create_forward_message_tool(supervisor_name: str = "supervisor") -> BaseTool
     @tool(tool_name, description=desc)
     def forward_message(
         from_agent: str,
-        state: Annotated[Any, InjectedState],
+        state: Annotated[Any, InjectedState, SKIP_DUMP],
     ) -> str | Command:
         state = _state_as_dict(state)
         target_message = next(
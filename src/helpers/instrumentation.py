@@ -0,0 +1,221 @@
+# src\helpers\instrumentation.py
+"""
+Where the time goes inside ``parent_graph``: latency histograms per node,
+tool and model call, from LangChain callbacks.
+
+``MetricsCallbackHandler`` records into ``helpers.metrics``:
+
+• ``graph_node_duration_seconds{agent, node}`` – every node execution
+  (``init`` / ``delegate`` / ``assemble``, the supervisor's nodes, each
+  subgraph's ``llm`` / ``tools`` / ``returnMsg`` …);
+• ``graph_tool_duration_seconds{agent, tool}`` – every tool call;
+• ``llm_call_duration_seconds{agent, model}`` and
+  ``llm_tokens_total{agent, model, kind="input"|"output"}``;
+• ``*_errors_total`` with the same labels, and
+  ``graph_interrupts_total{agent, node}`` – interrupts are not errors.
+
+Call counts are the histograms' ``_count``. ``agent`` is the graph a run
+belongs to: the agent a subgraph node runs for (supervisor plan prefixes
+stripped), ``aliases`` renames graph nodes (``delegate`` → ``supervisor``),
+and top-level nodes get ``root``.
+
+The handler does a dict insert / pop and one histogram update per run and
+ignores every run that is not a node, tool or model call, so it is meant to
+stay on. ``instrument(graph)`` attaches it when the environment asks for it:
+
+    GRAPH_METRICS=1                   # record only (read via metrics.render())
+    METRICS_PORT=9464                 # … and serve http://127.0.0.1:9464/metrics
+    METRICS_DUMP_PATH=.cache/graph.prom   # … and/or dump the text format to a file
+    METRICS_DUMP_INTERVAL=15          # seconds between dumps (and once at exit)
+"""
+
+import atexit
+import os
+import re
+import threading
+import time
+from typing import Any, Mapping
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langgraph.errors import GraphBubbleUp, GraphInterrupt
+
+from . import metrics
+from logger.logger import getLogger
+
+logger = getLogger(__name__)
+
+NODE_SECONDS = "graph_node_duration_seconds"
+TOOL_SECONDS = "graph_tool_duration_seconds"
+LLM_SECONDS = "llm_call_duration_seconds"
+
+# `<supervisor>_plan_<i>_<agent>` nodes run `<agent>` (helpers.supervisor)
+_PLAN_NODE_RE = re.compile(r"^.+_plan_\d+_(.+)$")
+_STEP_TAG = "graph:step:"
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """Latency, call, token and error metrics per node, tool and model call.
+
+    Args:
+        root: ``agent`` label of the top-level graph's own nodes.
+        aliases: Graph node name → ``agent`` label, for subgraphs added
+            under another name.
+    """
+
+    run_inline = True  # no executor hop on the async path
+    ignore_retriever = True
+    ignore_custom_event = True
+    ignore_retry = True
+
+    def __init__(self, root: str = "parent_graph", aliases: Mapping[str, str] | None = None):
+        self.root = root
+        self.aliases = dict(aliases or {})
+        # run id → (histogram, labels, start); plain dict ops are atomic
+        self._started: dict[UUID, tuple[str, dict[str, str], float]] = {}
+        # node run id → its checkpoint namespace, to tell where an interrupt was raised
+        self._namespaces: dict[UUID, str] = {}
+
+    def _agent(self, metadata: Mapping[str, Any]) -> str:
+        segments = (metadata.get("langgraph_checkpoint_ns") or "").rsplit("|", 2)
+        if len(segments) < 2:
+            return self.root
+        parent = segments[-2].partition(":")[0]
+        match = _PLAN_NODE_RE.match(parent)
+        return self.aliases.get(parent, match.group(1) if match else parent)
+
+    def _finish(self, run_id: UUID) -> tuple[str, dict[str, str]] | None:
+        started = self._started.pop(run_id, None)
+        if started is None:
+            return None
+        name, labels, t0 = started
+        metrics.observe(name, time.perf_counter() - t0, **labels)
+        return name, labels
+
+    def _fail(self, run_id: UUID, error: BaseException, errors_total: str) -> None:
+        started = self._started.pop(run_id, None)
+        if started is None:
+            return
+        name, labels, t0 = started
+        namespace = self._namespaces.pop(run_id, None)
+        if isinstance(error, GraphInterrupt):
+            # counted by the node that called `interrupt()`, not by every graph it bubbles through
+            for item in error.args[0] if error.args else ():
+                if namespace is not None and "|".join(getattr(item, "ns", None) or ()) == namespace:
+                    metrics.inc("graph_interrupts_total", **labels)
+        elif isinstance(error, GraphBubbleUp):
+            # handoffs (`Command(graph=PARENT)`) end a node normally
+            metrics.observe(name, time.perf_counter() - t0, **labels)
+        else:
+            metrics.inc(errors_total, **labels)
+
+    # nodes
+    def on_chain_start(self, serialized, inputs, *, run_id, tags=None, metadata=None, **kwargs) -> None:
+        if not metadata or metadata.get("langgraph_node") != kwargs.get("name"):
+            return
+        if not any(tag.startswith(_STEP_TAG) for tag in tags or ()):
+            return
+        labels = {"agent": self._agent(metadata), "node": kwargs["name"]}
+        self._namespaces[run_id] = metadata.get("langgraph_checkpoint_ns", "")
+        self._started[run_id] = (NODE_SECONDS, labels, time.perf_counter())
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs) -> None:
+        if run_id in self._started:
+            self._namespaces.pop(run_id, None)
+            self._finish(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs) -> None:
+        if run_id in self._started:
+            self._fail(run_id, error, "graph_node_errors_total")
+
+    # tools
+    def on_tool_start(self, serialized, input_str, *, run_id, metadata=None, **kwargs) -> None:
+        tool = (serialized or {}).get("name") or kwargs.get("name") or "unknown"
+        labels = {"agent": self._agent(metadata or {}), "tool": tool}
+        self._started[run_id] = (TOOL_SECONDS, labels, time.perf_counter())
+
+    def on_tool_end(self, output, *, run_id, **kwargs) -> None:
+        self._finish(run_id)
+
+    def on_tool_error(self, error, *, run_id, **kwargs) -> None:
+        self._fail(run_id, error, "graph_tool_errors_total")
+
+    # model calls
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, **kwargs) -> None:
+        metadata = metadata or {}
+        params = kwargs.get("invocation_params") or {}
+        model = metadata.get("ls_model_name") or params.get("model") or params.get("model_name") or "unknown"
+        labels = {"agent": self._agent(metadata), "model": model}
+        self._started[run_id] = (LLM_SECONDS, labels, time.perf_counter())
+
+    def on_llm_start(self, serialized, prompts, *, run_id, metadata=None, **kwargs) -> None:
+        self.on_chat_model_start(serialized, prompts, run_id=run_id, metadata=metadata, **kwargs)
+
+    def on_llm_end(self, response, *, run_id, **kwargs) -> None:
+        finished = self._finish(run_id)
+        if finished is None:
+            return
+        labels = finished[1]
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    metrics.inc("llm_tokens_total", usage.get("input_tokens", 0), kind="input", **labels)
+                    metrics.inc("llm_tokens_total", usage.get("output_tokens", 0), kind="output", **labels)
+
+    def on_llm_error(self, error, *, run_id, **kwargs) -> None:
+        self._fail(run_id, error, "llm_call_errors_total")
+
+
+# Wiring -------------------------------------------------------------
+_exporters_started = False
+_exporters_lock = threading.Lock()
+
+
+def _dump_periodically(path: str, interval: float) -> None:
+    def _loop() -> None:
+        while True:
+            time.sleep(interval)
+            try:
+                metrics.dump(path)
+            except OSError as err:
+                logger.warning("[metrics] dump to %s failed: %s", path, err)
+
+    threading.Thread(target=_loop, name="metrics-dump", daemon=True).start()
+    atexit.register(metrics.dump, path)
+
+
+def start_exporters_from_env() -> None:
+    """Start the ``METRICS_PORT`` endpoint and ``METRICS_DUMP_PATH`` dumps, once per process."""
+    global _exporters_started
+    with _exporters_lock:
+        if _exporters_started:
+            return
+        _exporters_started = True
+    if port := os.getenv("METRICS_PORT"):
+        host = os.getenv("METRICS_HOST", "127.0.0.1")
+        try:
+            metrics.serve(int(port), host)
+            logger.info("[metrics] serving http://%s:%s/metrics", host, port)
+        except OSError as err:  # e.g. a reloader's second process
+            logger.warning("[metrics] cannot listen on %s:%s: %s", host, port, err)
+    if path := os.getenv("METRICS_DUMP_PATH"):
+        _dump_periodically(path, float(os.getenv("METRICS_DUMP_INTERVAL", "15")))
+        logger.info("[metrics] dumping to %s", path)
+
+
+def enabled() -> bool:
+    return (
+        os.getenv("GRAPH_METRICS", "0") == "1"
+        or bool(os.getenv("METRICS_PORT"))
+        or bool(os.getenv("METRICS_DUMP_PATH"))
+    )
+
+
+def instrument(graph: Any, *, root: str | None = None, aliases: Mapping[str, str] | None = None) -> Any:
+    """``graph`` with a ``MetricsCallbackHandler`` attached, if ``enabled()``; else ``graph`` itself."""
+    if not enabled():
+        return graph
+    start_exporters_from_env()
+    handler = MetricsCallbackHandler(root=root or getattr(graph, "name", None) or "graph", aliases=aliases)
+    return graph.with_config(callbacks=[handler])
@@ -0,0 +1,251 @@
+# src\helpers\llm_cache.py
+"""
+Response cache for the chat models (``BaseChatModel.cache``).
+
+Many threads send byte-identical prompts – same system prompt, same opening
+user message, same ``get_state`` result – and only differ in message ids and
+the random ids of tool calls. ``LLMResponseCache`` keys on a canonical form
+of the message history (ids dropped, tool-call ids renamed by position,
+provider metadata removed) plus LangChain's ``llm_string``, which already
+covers the model parameters and the bound tool schemas.
+
+Two tiers: an in-process LRU in front of an optional SQLite file. Both honour
+the same TTL; the SQLite tier is purged of expired rows and trimmed to
+``max_entries`` every ``MAINTENANCE_EVERY`` writes. Caching is opt-in per model instance, so only nodes built with
+``get_chat_model(..., cache=cache)`` / ``get_bound_model(..., cache=cache)``
+use it and non-deterministic calls simply don't pass one:
+
+    from helpers.llm_cache import LLMResponseCache
+    cache = LLMResponseCache(path=".cache/llm.sqlite", ttl=24 * 3600)
+    llm = get_bound_model(tools, temperature=0, cache=cache)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from langchain_core._api import suppress_langchain_beta_warning
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+from langchain_core.messages import AIMessage
+from langchain_core.messages.ai import _LC_ID_PREFIX
+
+from . import metrics
+from .sqlite_store import SQLiteTTLStore
+from logger.logger import getLogger
+
+logger = getLogger(__name__)
+
+# SQLite tier: purge expired rows and trim to ``max_entries`` every N writes
+MAINTENANCE_EVERY = 100
+
+# message fields that never change what the model answers
+_VOLATILE_KWARGS = ("id", "response_metadata", "usage_metadata")
+
+
+# Canonical prompt ---------------------------------------------------
+def _tool_call_ids(messages: list[dict]) -> dict[str, str]:
+    """Map every tool-call id to a positional alias (``tc0``, ``tc1``, ...)."""
+    aliases: dict[str, str] = {}
+
+    def _alias(call_id: Any) -> None:
+        if isinstance(call_id, str) and call_id not in aliases:
+            aliases[call_id] = f"tc{len(aliases)}"
+
+    for message in messages:
+        kwargs = message.get("kwargs", {}) if isinstance(message, dict) else {}
+        for call in kwargs.get("tool_calls") or ():
+            _alias(call.get("id"))
+        for call in (kwargs.get("additional_kwargs") or {}).get("tool_calls") or ():
+            _alias(call.get("id"))
+        _alias(kwargs.get("tool_call_id"))
+    return aliases
+
+
+def _rename(value: Any, aliases: dict[str, str]) -> Any:
+    if isinstance(value, str):
+        return aliases.get(value, value)
+    if isinstance(value, dict):
+        return {k: _rename(v, aliases) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_rename(v, aliases) for v in value]
+    return value
+
+
+def canonical_prompt(prompt: str) -> str:
+    """Normalise a ``dumps(messages)`` prompt so equivalent histories compare equal."""
+    try:
+        messages = json.loads(prompt)
+    except ValueError:
+        return prompt
+    if not isinstance(messages, list):
+        return prompt
+
+    aliases = _tool_call_ids(messages)
+    canonical = []
+    for message in messages:
+        if isinstance(message, dict) and isinstance(message.get("kwargs"), dict):
+            kwargs = {k: v for k, v in message["kwargs"].items() if k not in _VOLATILE_KWARGS}
+            message = {**message, "kwargs": kwargs}
+        canonical.append(_rename(message, aliases))
+    return json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+
+
+def cache_key(prompt: str, llm_string: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(canonical_prompt(prompt).encode())
+    digest.update(b"\x00")
+    digest.update(llm_string.encode())
+    return digest.hexdigest()
+
+
+# Cache --------------------------------------------------------------
+def _fresh_ids(generations: Sequence[Any]) -> None:
+    """Give cached messages new ids so they never collide inside a thread."""
+    for idx, generation in enumerate(generations):
+        message = getattr(generation, "message", None)
+        if message is None:
+            continue
+        message.id = f"{_LC_ID_PREFIX}-{uuid.uuid4()}-{idx}"
+        if isinstance(message, AIMessage) and message.tool_calls:
+            for call in message.tool_calls:
+                call["id"] = f"call_{uuid.uuid4().hex[:24]}"
+            raw_calls = message.additional_kwargs.get("tool_calls") or ()
+            for raw, call in zip(raw_calls, message.tool_calls):
+                raw["id"] = call["id"]
+
+
+class LLMResponseCache(BaseCache):
+    """LRU + SQLite cache of chat generations, keyed on the canonical prompt.
+
+    Args:
+        path: SQLite file for the persistent tier; ``None`` keeps the cache in memory only.
+        maxsize: Entries kept in the in-memory LRU tier.
+        ttl: Seconds an entry stays valid in both tiers; ``None`` means forever.
+        max_entries: Rows kept in the SQLite tier (oldest written go first);
+            ``None`` means unbounded.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        max_entries: int | None = 100_000,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._memory: OrderedDict[str, tuple[float | None, str]] = OrderedDict()
+        self._store = SQLiteTTLStore(path, table="llm_cache", ttl=ttl) if path else None
+
+    # memory tier
+    def _memory_get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return payload
+
+    def _memory_set(self, key: str, payload: str) -> None:
+        expires_at = None if self.ttl is None else time.time() + self.ttl
+        with self._lock:
+            self._memory[key] = (expires_at, payload)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+
+    # BaseCache
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        key = cache_key(prompt, llm_string)
+        tier = "memory"
+        payload = self._memory_get(key)
+        if payload is None and self._store is not None:
+            tier = "sqlite"
+            payload = self._store.get(key)
+            if payload is not None:
+                self._memory_set(key, payload)
+        if payload is None:
+            metrics.inc("llm_cache_misses_total")
+            return None
+
+        metrics.inc("llm_cache_hits_total", tier=tier)
+        logger.debug("[llm_cache] %s hit %s", tier, key[:12])
+        with suppress_langchain_beta_warning():
+            generations = loads(payload)
+        _fresh_ids(generations)
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = cache_key(prompt, llm_string)
+        payload = dumps(list(return_val))
+        self._memory_set(key, payload)
+        if self._store is None:
+            return
+        self._store.set(key, payload)
+        with self._lock:
+            self._writes += 1
+            due = self._writes % MAINTENANCE_EVERY == 0
+        if due:
+            self._maintain()
+
+    def _maintain(self) -> None:
+        purged = self._store.purge_expired()
+        trimmed = self._store.trim(self.max_entries) if self.max_entries is not None else 0
+        if purged or trimmed:
+            logger.debug("[llm_cache] dropped %d expired and %d surplus entries", purged, trimmed)
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self._store is not None:
+            self._store.clear()
+
+    def size(self) -> int:
+        """Entries in the persistent tier, or in the LRU when there is none.
+
+        Deliberately not ``__len__``: LangChain checks ``bool(model.cache)``
+        and an empty cache must still count as configured.
+        """
+        return len(self._store) if self._store is not None else len(self._memory)
+
+
+_env_cache: LLMResponseCache | None = None
+_env_lock = threading.Lock()
+
+
+def from_env() -> LLMResponseCache | None:
+    """Process-wide cache configured by ``LLM_CACHE_PATH`` / ``_TTL`` / ``_MAX_ENTRIES``.
+
+    Returns ``None`` (caching off) unless ``LLM_CACHE_PATH`` is set;
+    ``LLM_CACHE_PATH=:memory:`` enables the LRU tier only.
+    """
+    global _env_cache
+    path = os.getenv("LLM_CACHE_PATH")
+    if not path:
+        return None
+    with _env_lock:
+        if _env_cache is None:
+            ttl = os.getenv("LLM_CACHE_TTL")
+            max_entries = os.getenv("LLM_CACHE_MAX_ENTRIES")
+            _env_cache = LLMResponseCache(
+                path=None if path == ":memory:" else path,
+                ttl=float(ttl) if ttl else None,
+                max_entries=int(max_entries) if max_entries else 100_000,
+            )
+            logger.info("[llm_cache] enabled at %s (ttl=%s)", path, ttl or "∞")
+        return _env_cache
@@ -0,0 +1,192 @@
+# src\helpers\metrics.py
+"""
+Process-wide, label-aware counters and histograms.
+
+Cheap enough to call from any node or tool:
+
+    from helpers import metrics
+    metrics.inc("delegations_skipped_total", agent="color_agent")
+    metrics.get("delegations_skipped_total", agent="color_agent")  # → 1.0
+    metrics.observe("graph_node_duration_seconds", 0.012, agent="color_agent", node="llm")
+
+Everything can be exported in the Prometheus text format – ``render()``,
+``dump(path)`` for a file, ``serve(port)`` for a local ``/metrics``
+endpoint.
+"""
+
+import bisect
+import os
+import tempfile
+import threading
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Sequence
+
+LabelSet = tuple[tuple[str, str], ...]
+
+# seconds – from a cached tool call to a slow model turn
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_lock = threading.Lock()
+_counters: dict[str, dict[LabelSet, float]] = defaultdict(lambda: defaultdict(float))
+_histograms: dict[str, dict[LabelSet, "_Histogram"]] = defaultdict(dict)
+_buckets: dict[str, tuple[float, ...]] = {}
+
+
+def _labels(labels: dict[str, str]) -> LabelSet:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * (size + 1)  # last slot: above the largest bound
+        self.sum = 0.0
+        self.count = 0
+
+
+# Counters -----------------------------------------------------------
+def inc(name: str, value: float = 1.0, **labels: str) -> None:
+    """Add ``value`` to counter ``name`` for the given label set."""
+    key = _labels(labels)
+    with _lock:
+        _counters[name][key] += value
+
+
+def get(name: str, **labels: str) -> float:
+    """Current value of counter ``name``; with no labels, the sum over all label sets."""
+    with _lock:
+        series = _counters.get(name, {})
+        if labels:
+            return series.get(_labels(labels), 0.0)
+        return sum(series.values())
+
+
+def snapshot() -> dict[str, dict[LabelSet, float]]:
+    """Copy of every counter, ``{name: {labels: value}}``."""
+    with _lock:
+        return {name: dict(series) for name, series in _counters.items()}
+
+
+# Histograms ---------------------------------------------------------
+def observe(name: str, value: float, *, buckets: Sequence[float] = DEFAULT_BUCKETS, **labels: str) -> None:
+    """Record ``value`` in histogram ``name``; ``buckets`` (upper bounds) are fixed by the first call."""
+    key = _labels(labels)
+    with _lock:
+        bounds = _buckets.get(name)
+        if bounds is None:
+            bounds = _buckets[name] = tuple(sorted(buckets))
+        hist = _histograms[name].get(key)
+        if hist is None:
+            hist = _histograms[name][key] = _Histogram(len(bounds))
+        hist.counts[bisect.bisect_left(bounds, value)] += 1
+        hist.sum += value
+        hist.count += 1
+
+
+def histogram(name: str, **labels: str) -> dict:
+    """``{"count", "sum", "buckets": [(le, cumulative count), ...]}`` of ``name``.
+
+    With no labels, every label set is merged.
+    """
+    with _lock:
+        bounds = _buckets.get(name, ())
+        series = _histograms.get(name, {})
+        if labels:
+            selected = [h for h in (series.get(_labels(labels)),) if h is not None]
+        else:
+            selected = list(series.values())
+        counts = [sum(h.counts[i] for h in selected) for i in range(len(bounds) + 1)]
+        total = sum(h.count for h in selected)
+        value_sum = sum(h.sum for h in selected)
+    cumulative, running = [], 0
+    for bound, n in zip((*bounds, float("inf")), counts):
+        running += n
+        cumulative.append((bound, running))
+    return {"count": total, "sum": value_sum, "buckets": cumulative}
+
+
+def reset() -> None:
+    """Drop every counter and histogram (benchmarks, tests)."""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+        _buckets.clear()
+
+
+# Export -------------------------------------------------------------
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: LabelSet, extra: tuple[str, str] | None = None) -> str:
+    pairs = [*labels, extra] if extra else list(labels)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def render() -> str:
+    """Every counter and histogram in the Prometheus text exposition format."""
+    with _lock:
+        counters = {name: dict(series) for name, series in _counters.items()}
+        histograms = {
+            name: {key: (list(h.counts), h.sum, h.count) for key, h in series.items()}
+            for name, series in _histograms.items()
+        }
+        bounds = dict(_buckets)
+
+    lines = []
+    for name in sorted(counters):
+        lines.append(f"# TYPE {name} counter")
+        for key, value in sorted(counters[name].items()):
+            lines.append(f"{name}{_format_labels(key)} {value:g}")
+    for name in sorted(histograms):
+        lines.append(f"# TYPE {name} histogram")
+        for key, (counts, value_sum, count) in sorted(histograms[name].items()):
+            running = 0
+            for bound, n in zip((*bounds[name], float("inf")), counts):
+                running += n
+                lines.append(f"{name}_bucket{_format_labels(key, ('le', _format_bound(bound)))} {running}")
+            lines.append(f"{name}_sum{_format_labels(key)} {value_sum:.6g}")
+            lines.append(f"{name}_count{_format_labels(key)} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def dump(path: str) -> None:
+    """Write ``render()`` to ``path`` atomically (node-exporter textfile style)."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(render())
+    os.replace(tmp, path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802 – http.server naming
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # scrapes are not worth a log line
+        pass
+
+
+def serve(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve ``render()`` on ``http://host:port/metrics`` from a daemon thread."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
@@ -0,0 +1,272 @@
+# src\helpers\models.py
+"""
+Process-wide registry of chat models and their tool-bound variants.
+
+The LLM nodes used to build a new ``ChatOpenAI`` and call ``.bind_tools``
+on every turn, which meant a new OpenAI client, a new connection pool and
+a fresh tool-schema conversion per call. The registry builds every
+``(model, kwargs)`` pair and every ``(model, tool set)`` binding exactly
+once and hands back the same runnable afterwards. All OpenAI models share
+one keep-alive ``httpx`` pool per process – and, on the async path, one per
+event loop, since an asyncio connection pool cannot outlive its loop.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Hashable, Sequence
+
+import httpx
+from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool
+from langchain_openai import ChatOpenAI
+
+from .single_flight import SingleFlightChatModel
+from logger.logger import getLogger
+
+logger = getLogger(__name__)
+
+DEFAULT_MODEL = "gpt-4o-mini"
+
+# keep-alive pool shared by every model the registry creates
+_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+
+class _PerLoopTransport(httpx.AsyncBaseTransport):
+    """Async transport with one keep-alive pool per running event loop.
+
+    A pool's connections belong to the loop that opened them; reusing them from
+    the next ``asyncio.run`` fails with "Event loop is closed". Pools of
+    closed loops are dropped along with the loop.
+    """
+
+    def __init__(self, limits: httpx.Limits):
+        self._limits = limits
+        self._pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._pools_lock = threading.Lock()
+
+    def _pool(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._pools_lock:
+            pool = self._pools.get(loop)
+            if pool is None:
+                pool = self._pools[loop] = httpx.AsyncHTTPTransport(limits=self._limits)
+            return pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.aclose()
+
+
+# built by ChatOpenAI from its other fields
+_OPENAI_CLIENTS = ("client", "async_client", "root_client", "root_async_client")
+
+_lock = threading.RLock()
+_http_client: httpx.Client | None = None
+_http_async_client: httpx.AsyncClient | None = None
+_models: dict[Hashable, BaseChatModel] = {}
+_bound: dict[Hashable, tuple[Runnable, tuple]] = {}
+_overrides: dict[str, BaseChatModel] = {}
+
+
+# Helpers ------------------------------------------------------------
+def _freeze(value: Any) -> Hashable:
+    """Turn (nested) kwargs into something usable as a dict key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return ("__id__", id(value))
+    return value
+
+
+def _drop_default_cache(kwargs: dict[str, Any]) -> None:
+    """``cache=None`` is the ChatOpenAI default – don't build a second instance for it."""
+    if "cache" in kwargs and kwargs["cache"] is None:
+        del kwargs["cache"]
+
+
+def _configured(instance: BaseChatModel, model: str, kwargs: dict[str, Any]) -> BaseChatModel:
+    """A copy of the override ``instance`` with the constructor ``kwargs`` applied.
+
+    Declared fields (by name or alias) are set on the copy; a wrapper – a
+    model with an ``inner`` model, like the cassette recorder – hands the
+    rest on to ``inner``. Anything else raises: silently dropping, say,
+    ``temperature`` would record or serve another model than the one asked for.
+    A ``ChatOpenAI`` is rebuilt instead of copied, since its clients are
+    made from the fields (``base_url``, ``timeout``, ...) at construction.
+    """
+    fields = type(instance).model_fields
+    names = {field.alias: name for name, field in fields.items() if field.alias}
+    update = {names.get(k, k): v for k, v in kwargs.items() if k in fields or k in names}
+    rest = {k: v for k, v in kwargs.items() if k not in fields and k not in names}
+    if rest:
+        inner = getattr(instance, "inner", None)
+        if not isinstance(inner, BaseChatModel):
+            raise TypeError(
+                f"Override for '{model}' ({type(instance).__name__}) does not accept {sorted(rest)}."
+            )
+        update["inner"] = _configured(inner, model, rest)
+    if not update:
+        return instance
+    if isinstance(instance, ChatOpenAI):
+        kept = {k: getattr(instance, k) for k in instance.model_fields_set if k not in _OPENAI_CLIENTS}
+        return ChatOpenAI(**{**kept, **update})
+    return instance.model_copy(update=update)
+
+
+def _shared_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    global _http_client, _http_async_client
+    with _lock:
+        if _http_client is None:
+            _http_client = httpx.Client(limits=_POOL_LIMITS)
+            _http_async_client = httpx.AsyncClient(transport=_PerLoopTransport(_POOL_LIMITS))
+        return _http_client, _http_async_client
+
+
+# Public API ---------------------------------------------------------
+def get_chat_model(model: str = DEFAULT_MODEL, **kwargs: Any) -> BaseChatModel:
+    """Return the shared chat model for ``model`` + ``kwargs``.
+
+    Args:
+        model: Model name passed to ``ChatOpenAI``.
+        **kwargs: Any other ``ChatOpenAI`` constructor argument
+            (``temperature``, ``base_url``, ...). Each distinct combination
+            is built once. Two arguments are handled by the registry:
+
+            - ``cache``: a ``BaseCache`` (see ``helpers.llm_cache``).
+            - ``single_flight``: wrap the model in a
+              ``SingleFlightChatModel`` so identical concurrent requests
+              share one upstream call.
+
+            For a registered override the rest is applied to a copy of it,
+            see ``register_chat_model``.
+    """
+    _drop_default_cache(kwargs)
+    key = (model, _freeze(kwargs))
+    try:
+        return _models[key]
+    except KeyError:
+        pass
+    if model in _overrides and not kwargs:
+        return _overrides[model]
+
+    with _lock:
+        if key not in _models:
+            _models[key] = _build(model, dict(kwargs))
+            logger.debug("[models] built %s %r", model, key[1])
+        return _models[key]
+
+
+def _build(model: str, kwargs: dict[str, Any]) -> BaseChatModel:
+    if kwargs.pop("single_flight", False):
+        cache = kwargs.pop("cache", None)
+        # the cache sits in front of the coalescing, so hits never wait
+        return SingleFlightChatModel(inner=get_chat_model(model, **kwargs), cache=cache)
+    if model in _overrides:
+        return _configured(_overrides[model], model, kwargs)
+
+    http_client, http_async_client = _shared_http_clients()
+    kwargs.setdefault("http_client", http_client)
+    kwargs.setdefault("http_async_client", http_async_client)
+    return ChatOpenAI(model=model, **kwargs)
+
+
+def get_bound_model(
+    tools: Sequence[BaseTool],
+    model: str = DEFAULT_MODEL,
+    *,
+    bind_kwargs: dict[str, Any] | None = None,
+    **kwargs: Any,
+) -> Runnable:
+    """Return ``get_chat_model(model, **kwargs).bind_tools(tools)``, built once.
+
+    Tools are keyed by identity, so pass the same (module-level) tool objects
+    on every call to hit the cache.
+
+    Args:
+        tools: Tools to bind.
+        model: Model name, see ``get_chat_model``.
+        bind_kwargs: Extra keyword arguments for ``bind_tools``
+            (e.g. ``parallel_tool_calls``).
+        **kwargs: Model constructor arguments, see ``get_chat_model``.
+    """
+    _drop_default_cache(kwargs)
+    key = (model, _freeze(kwargs), tuple(id(t) for t in tools), _freeze(bind_kwargs or {}))
+    try:
+        return _bound[key][0]
+    except KeyError:
+        pass
+
+    with _lock:
+        if key not in _bound:
+            chat_model = get_chat_model(model, **kwargs)
+            bound = chat_model.bind_tools(list(tools), **(bind_kwargs or {}))
+            # keep the tools alive so their ids stay unique while cached
+            _bound[key] = (bound, tuple(tools))
+            logger.debug(
+                "[models] bound %s to %s", model, [t.name for t in tools]
+            )
+        return _bound[key][0]
+
+
+def get_structured_model(
+    schema: type,
+    model: str = DEFAULT_MODEL,
+    **kwargs: Any,
+) -> Runnable:
+    """Return ``get_chat_model(model, **kwargs).with_structured_output(schema)``, built once.
+
+    Like tools, ``schema`` is keyed by identity.
+    """
+    _drop_default_cache(kwargs)
+    key = (model, _freeze(kwargs), ("__structured__", id(schema)))
+    try:
+        return _bound[key][0]
+    except KeyError:
+        pass
+
+    with _lock:
+        if key not in _bound:
+            structured = get_chat_model(model, **kwargs).with_structured_output(schema)
+            _bound[key] = (structured, (schema,))
+            logger.debug("[models] structured %s → %s", model, schema.__name__)
+        return _bound[key][0]
+
+
+def register_chat_model(model: str, instance: BaseChatModel) -> None:
+    """Serve ``instance`` whenever ``model`` is requested (fakes, replays, ...).
+
+    Requests with constructor kwargs get a copy of ``instance`` with them
+    applied (``temperature=0`` sets ``instance.temperature``, or that of its
+    ``inner`` model); kwargs neither declares raise ``TypeError``. Clears
+    every cached binding so the next call re-binds against the override.
+    """
+    with _lock:
+        _overrides[model] = instance
+        # cached copies of the previous override / real model are stale now
+        for key in [k for k in _models if k[0] == model]:
+            del _models[key]
+        _bound.clear()
+
+
+def clear_registry() -> None:
+    """Drop every cached model, binding and override."""
+    with _lock:
+        _models.clear()
+        _bound.clear()
+        _overrides.clear()
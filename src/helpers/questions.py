@@ -0,0 +1,141 @@
+# src\helpers\questions.py
+"""
+One interrupt for every question of a run.
+
+Each collector would otherwise pause the graph on its own – one
+checkpoint write, one client round trip and one re-run of the interrupted
+node per question. Instead, the specialists register their questions
+(``QUESTIONS`` next to ``OWNED_FIELDS`` in each subgraph module) and the
+`collect_answers` node asks every one that is still open in a single
+interrupt, as a form:
+
+    {"type": "questions",
+     "questions": [{"key": "color", "question": "What colour should the car be?"},
+                   {"key": "speed", "question": "What speed should the car be?"}]}
+
+The client resumes with ``Command(resume={"color": "red", "speed": "fast"})``.
+The replies go to `pending_answers`; each specialist's ``ask_user`` tool (or
+structured extractor) takes its answer from there instead of interrupting,
+and adds the question / reply to its own thread as before. Questions left
+unanswered fall back to the specialist's own interrupt.
+
+Enabled in `graph.py` with `BATCH_QUESTIONS=1`.
+"""
+
+import asyncio
+import os
+from typing import Any, Mapping
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.types import interrupt
+from langgraph.utils.runnable import RunnableCallable
+
+from helpers import answer_memory, metrics
+from helpers.answer_memory import AnswerMemory
+from logger.logger import getLogger
+
+logger = getLogger(__name__)
+
+BATCH_QUESTIONS = os.environ.get("BATCH_QUESTIONS", "").strip().lower() in ("1", "true", "yes")
+
+ANSWERS_KEY = "pending_answers"
+FORM_TYPE = "questions"
+
+
+def _open(state: Any, key: str) -> bool:
+    value = getattr(state, key, None)
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _parse_reply(reply: Any, keys: list[str]) -> dict[str, str]:
+    """``key → answer`` from a resume value; a bare string answers a one-question form."""
+    if isinstance(reply, str) and len(keys) == 1:
+        reply = {keys[0]: reply}
+    if not isinstance(reply, Mapping):
+        logger.warning("[collect_answers] expected a mapping of answers, got %r", reply)
+        return {}
+    answers = {}
+    for key in keys:
+        value = reply.get(key)
+        if isinstance(value, str) and value.strip():
+            answers[key] = value.strip()
+    if missing := [k for k in keys if k not in answers]:
+        logger.info("[collect_answers] unanswered: %s – the specialists will ask", missing)
+    return answers
+
+
+def make_collect_answers(
+    questions: Mapping[str, str],
+    memory: AnswerMemory | None = None,
+) -> RunnableCallable:
+    """Node that asks every open question of `questions` through one interrupt.
+
+    `questions` maps a state field to the question that fills it; a question
+    is open while its field is empty. Leftover answers from an earlier run
+    are dropped, so a specialist only ever sees answers to this run's form.
+    With `memory`, questions the same user answered in an earlier thread are
+    filled from there and left off the form; new replies are remembered. On
+    resume the reply is matched against every open question, so answers
+    stored meanwhile never replace it.
+    Returns ``{}`` without interrupting when nothing is open.
+    """
+    questions = dict(questions)
+
+    def _stale(state: Any) -> dict[str, None]:
+        return {key: None for key in getattr(state, ANSWERS_KEY, None) or {}}
+
+    def _recall(user: str, keys: list[str]) -> dict[str, str]:
+        return {k: a for k in keys if (a := memory.get(user, k)) is not None}
+
+    def _store(user: str, answers: dict[str, str]) -> None:
+        for key, answer in answers.items():
+            memory.put(user, key, answer)
+
+    def _ask(
+        state: Any, keys: list[str], user: str | None, remembered: dict[str, str]
+    ) -> tuple[dict, dict[str, str]]:
+        """The node's update and the new replies (to remember)."""
+        keys = [key for key in keys if key not in remembered]
+        if not keys and not remembered:
+            stale = _stale(state)
+            return ({ANSWERS_KEY: stale} if stale else {}), {}
+
+        answers = {}
+        if keys:
+            logger.info("[collect_answers] asking %s in one interrupt", keys)
+            reply = interrupt({
+                "type": FORM_TYPE,
+                "questions": [{"key": key, "question": questions[key]} for key in keys],
+            })
+            answers = _parse_reply(reply, keys)
+            metrics.inc("questions_batched_total", len(keys))
+        # counted only once the form is settled – the node re-runs on resume
+        for key in remembered:
+            answer_memory.record(key, hit=True)
+        if user is not None:
+            for key in answers:
+                answer_memory.record(key, hit=False)
+        return {ANSWERS_KEY: {**_stale(state), **remembered, **answers}}, answers
+
+    def collect(state: Any, config: RunnableConfig) -> dict:
+        keys = [key for key in questions if _open(state, key)]
+        user = answer_memory.user_of(config) if memory is not None else None
+        recall = bool(keys) and user is not None and not answer_memory.resuming(config)
+        remembered = _recall(user, keys) if recall else {}
+        update, answers = _ask(state, keys, user, remembered)
+        if user is not None and answers:
+            _store(user, answers)
+        return update
+
+    async def acollect(state: Any, config: RunnableConfig) -> dict:
+        # the store may be SQLite – keep its reads and writes off the event loop
+        keys = [key for key in questions if _open(state, key)]
+        user = answer_memory.user_of(config) if memory is not None else None
+        recall = bool(keys) and user is not None and not answer_memory.resuming(config)
+        remembered = await asyncio.to_thread(_recall, user, keys) if recall else {}
+        update, answers = _ask(state, keys, user, remembered)
+        if user is not None and answers:
+            await asyncio.to_thread(_store, user, answers)
+        return update
+
+    return RunnableCallable(collect, acollect, name="collect_answers")
@@ -0,0 +1,147 @@
+# src\helpers\single_flight.py
+"""
+Single-flight coalescing of identical, concurrent chat-model requests.
+
+A burst of new threads sends the same first supervisor and collector prompts
+within milliseconds of each other. ``SingleFlightChatModel`` wraps a chat
+model so that while one request for a given (messages, model params, bound
+tools) key is in flight, every identical request waits for it instead of
+going upstream, and then gets its own copy of the result.
+
+Sync callers wait on a ``concurrent.futures.Future``; on the async path the
+upstream call runs as its own task on the caller's event loop and every
+caller – the first one included – awaits it through ``asyncio.shield``, so
+one caller being cancelled never aborts the call the others wait for. The
+two paths never block each other. Requests are only coalesced while in
+flight – nothing is kept afterwards (that is what ``helpers.llm_cache`` is
+for). Coalesced requests are counted in ``llm_requests_coalesced_total``.
+
+Built by the registry: ``get_chat_model(..., single_flight=True)``.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Optional, Sequence
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel, LangSmithParams
+from langchain_core.load import dumps
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult
+from langchain_core.runnables import Runnable
+from pydantic import ConfigDict, PrivateAttr
+
+from . import metrics
+from .llm_cache import cache_key
+from logger.logger import getLogger
+
+logger = getLogger(__name__)
+
+
+def _copy(result: ChatResult) -> ChatResult:
+    """Private copy for one waiter; ``id=None`` lets LangChain stamp its own run id."""
+    copy = result.model_copy(deep=True)
+    for generation in copy.generations:
+        generation.message.id = None
+    return copy
+
+
+class SingleFlightChatModel(BaseChatModel):
+    """Chat model that forwards to ``inner``, coalescing identical in-flight calls."""
+
+    inner: BaseChatModel
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _inflight: dict[str, Future] = PrivateAttr(default_factory=dict)
+    _ainflight: dict[tuple[int, str], asyncio.Task] = PrivateAttr(default_factory=dict)
+
+    @property
+    def _llm_type(self) -> str:
+        return f"single-flight-{self.inner._llm_type}"
+
+    def _get_llm_string(self, stop: Optional[list[str]] = None, **kwargs: Any) -> str:
+        # same cache keys as the wrapped model
+        return self.inner._get_llm_string(stop=stop, **kwargs)
+
+    def _get_ls_params(self, stop: Optional[list[str]] = None, **kwargs: Any) -> LangSmithParams:
+        # provider / model name for tracing and metrics
+        return self.inner._get_ls_params(stop=stop, **kwargs)
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> Runnable:
+        # let the wrapped model format the tools, then bind them to the wrapper
+        binding = self.inner.bind_tools(tools, **kwargs)
+        return self.bind(**getattr(binding, "kwargs", {}))
+
+    def _key(self, messages: list[BaseMessage], stop: Optional[list[str]], kwargs: dict) -> str:
+        return cache_key(dumps(messages), self._get_llm_string(stop=stop, **kwargs))
+
+    def _coalesced(self) -> None:
+        metrics.inc("llm_requests_coalesced_total", model=self.inner._llm_type)
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        key = self._key(messages, stop, kwargs)
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            self._coalesced()
+            logger.debug("[single_flight] waiting on %s", key[:12])
+            return _copy(future.result())
+
+        try:
+            # the leader's run gets the streamed tokens; followers only the result
+            result = self.inner._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        else:
+            future.set_result(result)
+            return _copy(result)
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        loop = asyncio.get_running_loop()
+        key = (id(loop), self._key(messages, stop, kwargs))
+        # everything below runs on one loop, so no lock is needed
+        task = self._ainflight.get(key)
+        if task is not None:
+            self._coalesced()
+            logger.debug("[single_flight] awaiting %s", key[1][:12])
+        else:
+            # the upstream call belongs to no single caller: cancelling one only stops its
+            # wait; its run (the leader's) still gets the streamed tokens
+            task = self._ainflight[key] = loop.create_task(
+                self.inner._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            )
+            task.add_done_callback(lambda done: self._settled(key, done))
+        return _copy(await asyncio.shield(task))
+
+    def _settled(self, key: tuple[int, str], task: asyncio.Task) -> None:
+        if self._ainflight.get(key) is task:
+            del self._ainflight[key]
+        # every waiter may have been cancelled – don't warn about an unretrieved exception
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,111 @@
+# src\helpers\sqlite_store.py
+"""
+Small SQLite key/value table with per-entry expiry.
+
+Shared by the persistent caches so they don't each grow their own schema
+and purge logic. One connection per store, guarded by a lock, so a store
+can be used from graph worker threads and from the event loop alike.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from logger.logger import getLogger
+
+logger = getLogger(__name__)
+
+
+class SQLiteTTLStore:
+    """``key -> text`` table where every row may carry an expiry timestamp.
+
+    Args:
+        path: Database file (created on first use) or ``":memory:"``.
+        table: Table name, so several stores can share one file.
+        ttl: Default time-to-live in seconds; ``None`` keeps rows forever.
+    """
+
+    def __init__(self, path: str | Path, *, table: str = "kv", ttl: float | None = None):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name '{table}'.")
+        self.path = str(path)
+        self.table = table
+        self.ttl = ttl
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL)"
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_expires ON {table}(expires_at)")
+
+    def _expiry(self, ttl: float | None) -> float | None:
+        ttl = self.ttl if ttl is None else ttl
+        return None if ttl is None else time.time() + ttl
+
+    def get(self, key: str) -> str | None:
+        """Value stored under ``key``, or ``None`` if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                return None
+            return value
+
+    def set(self, key: str, value: str, *, ttl: float | None = None) -> None:
+        """Store ``value``; ``ttl`` overrides the store default for this row."""
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, self._expiry(ttl)),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        """Drop every expired row and return how many went away."""
+        with self._lock:
+            cur = self._conn.execute(
+                f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+        if cur.rowcount:
+            logger.debug("[sqlite_store] purged %d rows from %s", cur.rowcount, self.table)
+        return cur.rowcount
+
+    def trim(self, max_rows: int) -> int:
+        """Drop the oldest-written rows beyond ``max_rows``; return how many went away."""
+        with self._lock:
+            cur = self._conn.execute(
+                f"DELETE FROM {self.table} WHERE rowid IN ("
+                f" SELECT rowid FROM {self.table} ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+                (max_rows,),
+            )
+        if cur.rowcount:
+            logger.debug("[sqlite_store] evicted %d rows from %s", cur.rowcount, self.table)
+        return cur.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,11 +1,29 @@
 # src\helpers\supervisor.py
+import dataclasses
 import inspect
-from typing import Any, Callable, Literal, Optional, Sequence, Type, Union, cast, get_args
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypedDict,
+    Union,
+    cast,
+    get_args,
+)
 from uuid import UUID, uuid5
 
 from langchain_core.language_models import BaseChatModel, LanguageModelLike
-from langchain_core.runnables import RunnableConfig
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_core.prompt_values import PromptValue
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langchain_core.tools import BaseTool
+from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.graph import END, START, StateGraph
 from langgraph.prebuilt import ToolNode
 from langgraph.prebuilt.chat_agent_executor import (
@@ -23,14 +41,23 @@ from langgraph.utils.config import patch_configurable
 from langgraph.utils.runnable import RunnableCallable, RunnableLike
 
 from langgraph_supervisor.agent_name import AgentNameMode, with_agent_name
+from pydantic import BaseModel
 from .handoff import (
     METADATA_KEY_HANDOFF_DESTINATION,
+    METADATA_KEY_HANDOFF_INDEX,
+    METADATA_KEY_IS_HANDOFF_BACK,
     _normalize_agent_name,
+    compact_handoff_messages,
     create_handoff_back_messages,
+    create_handoff_messages,
     create_handoff_tool,
 )
 
-from logger.logger import dump_tools
+from logger.logger import dump_tools, getLogger
+from state.messages import MessageList
+from . import metrics
+
+logger = getLogger(__name__)
 
 OutputMode = Literal["full_history", "last_message"]
 """Mode for adding agent outputs to the message history in the multi-agent workflow
@@ -40,8 +67,65 @@ OutputMode = Literal["full_history", "last_message"]
 """
 
 
+PlanStep = Union[str, Sequence[str]]
+"""One step of a supervisor plan: an agent name, or several agent names that run concurrently."""
+
+
 MODELS_NO_PARALLEL_TOOL_CALLS = {"o3-mini", "o3", "o4-mini"}
 
+FANOUT_RESULTS_KEY = "fanout_results"
+"""Private channel where fanned-out agents park their results until fan-in."""
+
+# message buffers as they come out of a subgraph (reducer results) or a state model
+_LISTS = (list, MessageList)
+
+
+def _merge_fanout_results(left: list[dict] | None, right: list[dict] | None) -> list[dict]:
+    """Accumulate the agent results of one fan-out step; ``None`` clears the buffer."""
+    if right is None:
+        return []
+    return (left or []) + right
+
+
+class _FanInState(TypedDict):
+    # Optional[...] is not instantiable, so the channel stays empty until the
+    # first agent writes to it and never leaks into input validation
+    fanout_results: Annotated[Optional[list[dict]], _merge_fanout_results]
+
+
+def _state_value(state: Any, key: str, default: Any = None) -> Any:
+    """Read ``key`` from a dict-like (``Send`` payload) or attribute-style state."""
+    if isinstance(state, Mapping):
+        return state.get(key, default)
+    return getattr(state, key, default)
+
+
+def _owned_fields_populated(state: Any, fields: Sequence[str]) -> bool:
+    """True when every field an agent owns already holds a usable value."""
+    for field in fields:
+        value = _state_value(state, field)
+        if value is None or (isinstance(value, str) and not value.strip()):
+            return False
+    return bool(fields)
+
+
+def _dict_delta(before: Mapping, after: Mapping) -> dict:
+    """Write that turns ``before`` into ``after`` under a dict reducer (``None`` deletes)."""
+    delta = {key: value for key, value in after.items() if key not in before or before[key] != value}
+    delta.update((key, None) for key in before if key not in after)
+    return delta
+
+
+def _with_messages(state: Any, messages: list) -> Any:
+    """Return a shallow copy of ``state`` with ``messages`` replaced."""
+    if isinstance(state, Mapping):
+        return {**state, "messages": messages}
+    if isinstance(state, BaseModel):
+        return state.model_copy(update={"messages": messages})
+    if dataclasses.is_dataclass(state):
+        return dataclasses.replace(state, messages=messages)
+    raise TypeError(f"Unexpected state type: {type(state)}")
+
 
 def _supports_disable_parallel_tool_calls(model: LanguageModelLike) -> bool:
     if not isinstance(model, BaseChatModel):
@@ -64,13 +148,16 @@ def _make_call_agent(
     output_mode: OutputMode,
     add_handoff_back_messages: bool,
     supervisor_name: str,
+    fan_out: bool = False,
+    reducer_keys: frozenset[str] = frozenset(),
+    owned_fields: Sequence[str] = (),
 ) -> Callable[[dict], dict] | RunnableCallable:
     if output_mode not in get_args(OutputMode):
         raise ValueError(
             f"Invalid agent output mode: {output_mode}. Needs to be one of {get_args(OutputMode)}"
         )
 
-    def _process_output(output: dict) -> dict:
+    def _process_output(state: Any, output: dict) -> dict:
         messages = output["messages"]
         if output_mode == "full_history":
             pass
@@ -86,38 +173,226 @@ def _make_call_agent(
         if add_handoff_back_messages:
             messages.extend(create_handoff_back_messages(agent.name, supervisor_name))
 
+        # the full value of a dict reducer channel cannot delete keys
+        deltas = {
+            key: _dict_delta(_state_value(state, key) or {}, value)
+            for key, value in output.items()
+            if key in reducer_keys and isinstance(value, dict)
+        }
         return {
             **output,
+            **deltas,
             "messages": messages,
         }
 
-    def call_agent(state: dict, config: RunnableConfig) -> dict:
+    def _fan_out_result(state: Any, output: dict) -> dict:
+        # Park only what this agent added; fan-in merges all agents of the step.
+        in_messages = _state_value(state, "messages") or []
+        messages = output["messages"][len(in_messages):]
+        if output_mode == "last_message":
+            messages = messages[-1:]
+        if add_handoff_back_messages:
+            messages = [*messages, *create_handoff_back_messages(agent.name, supervisor_name)]
+
+        # parallel handoffs never reached the parent state – carry them along
+        handoff = None
+        if (
+            len(in_messages) >= 2
+            and isinstance(in_messages[-1], ToolMessage)
+            and METADATA_KEY_HANDOFF_INDEX in in_messages[-1].response_metadata
+        ):
+            handoff = (in_messages[-2], in_messages[-1])
+
+        update = {}
+        for key, value in output.items():
+            if key == "messages":
+                continue
+            before = _state_value(state, key)
+            if key in reducer_keys and isinstance(value, _LISTS) and isinstance(before, _LISTS):
+                if len(value) > len(before):
+                    update[key] = value[len(before):]
+            elif key in reducer_keys and isinstance(value, dict) and isinstance(before, dict):
+                if delta := _dict_delta(before, value):
+                    update[key] = delta
+            elif value != before:
+                update[key] = value
+
+        return {
+            FANOUT_RESULTS_KEY: [
+                {"agent": agent.name, "handoff": handoff, "messages": messages, "update": update}
+            ]
+        }
+
+    def _agent_config(config: RunnableConfig) -> RunnableConfig:
+        # remote agents get their own thread, derived from the parent thread id
+        if not isinstance(agent, RemoteGraph):
+            return config
         thread_id = config["configurable"].get("thread_id")
-        output = agent.invoke(
-            state,
-            patch_configurable(
-                config,
-                {"thread_id": str(uuid5(UUID(str(thread_id)), agent.name)) if thread_id else None},
-            )
-            if isinstance(agent, RemoteGraph)
-            else config,
+        return patch_configurable(
+            config,
+            {"thread_id": str(uuid5(UUID(str(thread_id)), agent.name)) if thread_id else None},
+        )
+
+    def _skipped_output(state: Any) -> dict | None:
+        # The agent would only find out it has nothing to do – answer for it.
+        if not _owned_fields_populated(state, owned_fields):
+            return None
+        values = ", ".join(f"{f}={_state_value(state, f)!r}" for f in owned_fields)
+        logger.info("[supervisor] skipping %s – owned fields already set (%s)", agent.name, values)
+        metrics.inc("delegations_skipped_total", agent=agent.name)
+        report = AIMessage(
+            content=f"{agent.name} already has {values}; nothing to do.",
+            name=agent.name,
         )
-        return _process_output(output)
+        return {"messages": [*(_state_value(state, "messages") or []), report]}
+
+    def call_agent(state: dict, config: RunnableConfig) -> dict:
+        output = _skipped_output(state) or agent.invoke(state, _agent_config(config))
+        return _fan_out_result(state, output) if fan_out else _process_output(state, output)
 
     async def acall_agent(state: dict, config: RunnableConfig) -> dict:
-        thread_id = config["configurable"].get("thread_id")
-        output = await agent.ainvoke(
-            state,
-            patch_configurable(
-                config,
-                {"thread_id": str(uuid5(UUID(str(thread_id)), agent.name)) if thread_id else None},
+        # native async path: the subgraph's nodes are awaited on the caller's loop
+        output = _skipped_output(state) or await agent.ainvoke(state, _agent_config(config))
+        return _fan_out_result(state, output) if fan_out else _process_output(state, output)
+
+    return RunnableCallable(call_agent, acall_agent)
+
+
+def _make_fan_in(
+    agent_order: Sequence[str],
+    reducer_keys: frozenset[str],
+) -> RunnableCallable:
+    """Build the node that merges the results of concurrently dispatched agents.
+
+    Results are ordered by the supervisor's original tool-call order (then by
+    agent declaration order), so the merged history is identical no matter
+    which agent finished first:
+
+    1. one `AIMessage` carrying every parallel handoff tool call,
+    2. the matching `ToolMessage`s,
+    3. each agent's output (plus its handoff-back pair).
+
+    Non-message updates are applied in the same order; reducer channels are
+    concatenated (dict channels merged), plain channels keep the last agent's value.
+    """
+    rank = {name: i for i, name in enumerate(agent_order)}
+
+    def _sort_key(result: dict) -> tuple[int, int]:
+        handoff = result["handoff"]
+        index = handoff[1].response_metadata[METADATA_KEY_HANDOFF_INDEX] if handoff else -1
+        return index, rank.get(result["agent"], len(rank))
+
+    def fan_in(state: _FanInState) -> dict:
+        results = sorted(state[FANOUT_RESULTS_KEY], key=_sort_key)
+
+        messages = []
+        handoffs = [result["handoff"] for result in results if result["handoff"]]
+        if handoffs:
+            first_ai = handoffs[0][0]
+            messages.append(
+                AIMessage(
+                    content=first_ai.content,
+                    name=first_ai.name,
+                    tool_calls=[ai.tool_calls[0] for ai, _ in handoffs],
+                    id=first_ai.id,
+                )
             )
-            if isinstance(agent, RemoteGraph)
-            else config,
+            messages.extend(tool_message for _, tool_message in handoffs)
+
+        update: dict[str, Any] = {}
+        for result in results:
+            messages.extend(result["messages"])
+            for key, value in result["update"].items():
+                if key in reducer_keys and key in update and isinstance(value, dict):
+                    update[key] = {**update[key], **value}
+                elif key in reducer_keys and key in update:
+                    update[key] = update[key] + value
+                else:
+                    update[key] = value
+
+        return {**update, "messages": messages, FANOUT_RESULTS_KEY: None}
+
+    async def afan_in(state: _FanInState) -> dict:
+        return fan_in(state)
+
+    return RunnableCallable(fan_in, afan_in)
+
+
+def _make_plan_step(
+    call_agent: RunnableCallable,
+    agent_name: str,
+    supervisor_name: str,
+    handoff_tool_name: str | None,
+    add_handoff_messages: bool,
+    index: int | None,
+) -> RunnableCallable:
+    """Wrap `call_agent` so a plan step reads like a regular handoff in the history.
+
+    `index` is the agent's position inside a concurrent plan step (None for a
+    single-agent step); concurrent steps leave the handoff pair to the fan-in node.
+    """
+
+    def _prepare(state: Any) -> tuple[Any, tuple]:
+        if not add_handoff_messages:
+            return state, ()
+        pair = create_handoff_messages(agent_name, supervisor_name, handoff_tool_name, index)
+        messages = _state_value(state, "messages") or []
+        return _with_messages(state, [*messages, *pair]), pair
+
+    def _finish(update: dict, pair: tuple) -> dict:
+        if index is None and pair:
+            update = {**update, "messages": [*pair, *update["messages"]]}
+        return update
+
+    def plan_step(state: Any, config: RunnableConfig) -> dict:
+        state, pair = _prepare(state)
+        return _finish(call_agent.invoke(state, config), pair)
+
+    async def aplan_step(state: Any, config: RunnableConfig) -> dict:
+        state, pair = _prepare(state)
+        return _finish(await call_agent.ainvoke(state, config), pair)
+
+    return RunnableCallable(plan_step, aplan_step)
+
+
+def _plan_step_succeeded(state: Any, agent_names: Sequence[str]) -> bool:
+    """Check that every agent of a plan step reported back with a final answer.
+
+    Looks at the messages added since the step's handoff: each agent must have
+    left a non-empty AIMessage without pending tool calls.
+    """
+    reported = set()
+    for message in reversed(_state_value(state, "messages") or []):
+        if message.response_metadata.get(METADATA_KEY_IS_HANDOFF_BACK):
+            continue
+        if METADATA_KEY_HANDOFF_DESTINATION in message.response_metadata:
+            break
+        if isinstance(message, AIMessage) and message.content and not message.tool_calls:
+            reported.add(message.name)
+    return set(agent_names) <= reported
+
+
+def _make_plan_router(
+    agent_names: Sequence[str],
+    next_nodes: list[str],
+    supervisor_name: str,
+) -> RunnableCallable:
+    """Continue the plan after a successful step, otherwise hand control to the supervisor LLM."""
+
+    def route(state: Any) -> list[str] | str:
+        if _plan_step_succeeded(state, agent_names):
+            return next_nodes
+        logger.info(
+            "[supervisor.plan] unexpected result from %s – falling back to %s",
+            list(agent_names),
+            supervisor_name,
         )
-        return _process_output(output)
+        return supervisor_name
 
-    return RunnableCallable(call_agent, acall_agent)
+    async def aroute(state: Any) -> list[str] | str:
+        return route(state)
+
+    return RunnableCallable(route, aroute)
 
 
 def _get_handoff_destinations(tools: Sequence[BaseTool | Callable]) -> list[str]:
@@ -140,7 +415,7 @@ def _prepare_tool_node(
     tools: list[BaseTool | Callable] | ToolNode | None,
     handoff_tool_prefix: Optional[str],
     add_handoff_messages: bool,
-    agent_names: set[str],
+    agent_names: list[str],
 ) -> ToolNode:
     """Prepare the ToolNode to use in supervisor agent."""
     if isinstance(tools, ToolNode):
@@ -195,6 +470,119 @@ def _prepare_tool_node(
     return tool_node
 
 
+def _plan_start(state: Any) -> dict:
+    return {}
+
+
+async def _aplan_start(state: Any) -> dict:
+    return {}
+
+
+def _add_plan(
+    builder: StateGraph,
+    plan: Sequence[PlanStep],
+    agents: list[Pregel],
+    tools: list[BaseTool],
+    *,
+    supervisor_name: str,
+    output_mode: OutputMode,
+    add_handoff_messages: bool,
+    add_handoff_back_messages: bool,
+    reducer_keys: frozenset[str],
+    owned_fields: Mapping[str, Sequence[str]],
+) -> None:
+    """Add the nodes and edges that execute `plan` ahead of the supervisor LLM."""
+    steps = [(step,) if isinstance(step, str) else tuple(step) for step in plan]
+    agents_by_name = {agent.name: agent for agent in agents}
+    if any(not step for step in steps):
+        raise ValueError("Every plan step must name at least one agent.")
+    if unknown := {name for step in steps for name in step} - set(agents_by_name):
+        raise ValueError(f"Plan references unknown agents: {unknown}.")
+
+    handoff_tool_names = {
+        tool.metadata[METADATA_KEY_HANDOFF_DESTINATION]: tool.name
+        for tool in tools
+        if tool.metadata and METADATA_KEY_HANDOFF_DESTINATION in tool.metadata
+    }
+
+    entries: list[list[str]] = []
+    exits: list[str] = []
+    for i, step in enumerate(steps):
+        concurrent = len(step) > 1
+        nodes = []
+        for j, name in enumerate(step):
+            node = f"{supervisor_name}_plan_{i}_{name}"
+            call_agent = _make_call_agent(
+                agents_by_name[name],
+                output_mode,
+                add_handoff_back_messages=add_handoff_back_messages,
+                supervisor_name=supervisor_name,
+                fan_out=concurrent,
+                reducer_keys=reducer_keys,
+                owned_fields=owned_fields.get(name, ()),
+            )
+            builder.add_node(
+                node,
+                _make_plan_step(
+                    call_agent,
+                    name,
+                    supervisor_name,
+                    handoff_tool_names.get(name),
+                    add_handoff_messages,
+                    index=j if concurrent else None,
+                ),
+            )
+            nodes.append(node)
+
+        if concurrent:
+            exit_node = f"{supervisor_name}_plan_{i}_fan_in"
+            builder.add_node(exit_node, _make_fan_in(step, reducer_keys), input=_FanInState)
+            for node in nodes:
+                builder.add_edge(node, exit_node)
+        else:
+            exit_node = nodes[0]
+        entries.append(nodes)
+        exits.append(exit_node)
+
+    # Pydantic input is validated against *all* non-empty channels after the
+    # first step, so the fan-in channel must not be written before step two.
+    start_node = f"{supervisor_name}_plan"
+    builder.add_node(start_node, RunnableCallable(_plan_start, _aplan_start))
+    builder.add_edge(START, start_node)
+    for node in entries[0]:
+        builder.add_edge(start_node, node)
+    for i, step in enumerate(steps):
+        following = entries[i + 1] if i + 1 < len(steps) else [supervisor_name]
+        builder.add_conditional_edges(
+            exits[i],
+            _make_plan_router(step, following, supervisor_name),
+            list(dict.fromkeys([*following, supervisor_name])),
+        )
+
+
+def _compact_handoffs_input(supervisor_name: str) -> RunnableLambda:
+    """Runnable placed in front of the supervisor model, see `compact_handoffs`."""
+
+    def compact(model_input: Any) -> Any:
+        messages = model_input.to_messages() if isinstance(model_input, PromptValue) else model_input
+        if not isinstance(messages, _LISTS):
+            return model_input
+        compacted: list[BaseMessage] = compact_handoff_messages(messages)
+        if len(compacted) < len(messages):
+            saved = count_tokens_approximately(messages) - count_tokens_approximately(compacted)
+            metrics.inc("handoff_tokens_saved_total", saved, agent=supervisor_name)
+            logger.debug(
+                "[%s] compacted handoffs: %d → %d messages, %d tokens saved",
+                supervisor_name, len(messages), len(compacted), saved,
+            )
+        return compacted
+
+    async def acompact(model_input: Any) -> Any:
+        return compact(model_input)
+
+    return RunnableLambda(compact, afunc=acompact, name="compact_handoffs")
+
+
 def create_supervisor(
     agents: list[Pregel],
     *,
@@ -215,6 +603,10 @@ def create_supervisor(
     add_handoff_back_messages: Optional[bool] = None,
     supervisor_name: str = "supervisor",
     include_agent_name: AgentNameMode | None = None,
+    fan_out: bool = False,
+    plan: Sequence[PlanStep] | None = None,
+    owned_fields: Mapping[str, Sequence[str]] | None = None,
+    compact_handoffs: bool = False,
 ) -> StateGraph:
     """Create a multi-agent supervisor.
 
@@ -314,6 +706,26 @@ def create_supervisor(
             - None: Relies on the LLM provider using the name attribute on the AI message. Currently, only OpenAI supports this.
             - `"inline"`: Add the agent name directly into the content field of the AI message using XML-style tags.
                 Example: `"How can I help you"` -> `"<name>agent_name</name><content>How can I help you?</content>"`
+        fan_out: Dispatch independent agents at the same time.
+            Enables parallel tool calls for the supervisor; every handoff of one supervisor turn is sent
+            to its agent via `Send` and the agents run concurrently in a single step. A fan-in node then
+            merges their results in the supervisor's tool-call order before control returns to the
+            supervisor LLM, so the resulting history does not depend on which agent finished first.
+        plan: Optional fixed delegation sequence that runs as plain graph edges, without asking the
+            supervisor LLM to route. Each step is an agent name, or a list of agent names that run
+            concurrently (merged like `fan_out`). Steps get the same handoff / handoff-back messages
+            as LLM-driven handoffs. After the last step the supervisor LLM runs once, e.g. to write
+            the final summary. If a step does not end with a final answer from every agent in it,
+            the rest of the plan is skipped and the supervisor LLM takes over routing.
+        owned_fields: Optional mapping of agent name to the state fields that agent is responsible for.
+            When every owned field already holds a non-empty value, a handoff to that agent (LLM-driven
+            or planned) is answered directly with a short report and the agent is not invoked.
+            Each skip increments the `delegations_skipped_total` metric (label `agent`).
+        compact_handoffs: Shrink the supervisor LLM's input by collapsing each completed delegation into
+            the transfer tool call plus one tool result carrying the agent's reply; the agent's own message
+            and the handoff-back pair are left out. Only the model input changes, the graph state keeps
+            every message. Prompt tokens saved are added to the `handoff_tokens_saved_total` metric
+            (label `agent`).
 
     Example:
         ```python
@@ -365,6 +777,11 @@ def create_supervisor(
     if add_handoff_back_messages is None:
         add_handoff_back_messages = add_handoff_messages
 
+    owned_fields = owned_fields or {}
+
+    if fan_out:
+        parallel_tool_calls = True
+
     if state_schema is None:
         state_schema = (
             AgentStateWithStructuredResponse if response_format is not None else AgentState
@@ -389,7 +806,9 @@ def create_supervisor(
         tools,
         handoff_tool_prefix,
         add_handoff_messages,
-        agent_names,
+        # declaration order, not set order: the bound tool list is part of every
+        # prompt and must not change with the interpreter's hash seed
+        [agent.name for agent in agents],
     )
     all_tools = list(tool_node.tools_by_name.values())
 
@@ -406,6 +825,9 @@ def create_supervisor(
     if include_agent_name:
         model = with_agent_name(model, include_agent_name)
 
+    if compact_handoffs:
+        model = _compact_handoffs_input(supervisor_name) | model
+
     supervisor_agent = create_react_agent(
         name=supervisor_name,
         model=model,
@@ -415,11 +837,44 @@ def create_supervisor(
         response_format=response_format,
         pre_model_hook=pre_model_hook,
         post_model_hook=post_model_hook,
+        # v2 runs each tool call as its own task, so parallel handoffs would
+        # raise competing ParentCommands; v1 lets one ToolNode combine the Sends
+        version="v1" if fan_out else "v2",
     )
 
     builder = StateGraph(state_schema, config_schema=config_schema)
     builder.add_node(supervisor_agent, destinations=tuple(agent_names) + (END,))
-    builder.add_edge(START, supervisor_agent.name)
+
+    reducer_keys = frozenset(
+        key
+        for key, channel in builder.channels.items()
+        if isinstance(channel, BinaryOperatorAggregate)
+    )
+
+    if plan:
+        _add_plan(
+            builder,
+            plan,
+            agents,
+            all_tools,
+            supervisor_name=supervisor_agent.name,
+            output_mode=output_mode,
+            add_handoff_messages=add_handoff_messages,
+            add_handoff_back_messages=add_handoff_back_messages,
+            reducer_keys=reducer_keys,
+            owned_fields=owned_fields,
+        )
+    else:
+        builder.add_edge(START, supervisor_agent.name)
+    fan_in_name = f"{supervisor_name}_fan_in"
+    if fan_out:
+        builder.add_node(
+            fan_in_name,
+            _make_fan_in([agent.name for agent in agents], reducer_keys),
+            input=_FanInState,
+        )
+        builder.add_edge(fan_in_name, supervisor_agent.name)
+
     for agent in agents:
         builder.add_node(
             agent.name,
@@ -428,8 +883,11 @@ def create_supervisor(
                 output_mode,
                 add_handoff_back_messages=add_handoff_back_messages,
                 supervisor_name=supervisor_name,
+                fan_out=fan_out,
+                reducer_keys=reducer_keys,
+                owned_fields=owned_fields.get(agent.name, ()),
             ),
         )
-        builder.add_edge(agent.name, supervisor_agent.name)
+        builder.add_edge(agent.name, fan_in_name if fan_out else supervisor_agent.name)
 
     return builder
\ No newline at end of file
@@ -0,0 +1,25 @@
+# src\state\answers.py
+
+"""
+Reducer for answers collected ahead of time by one batched interrupt.
+
+`pending_answers` maps a question key (the field it fills, e.g. ``"color"``)
+to the user's reply. The `collect_answers` node (see `helpers.questions`)
+writes the replies of a combined form; each specialist takes its own
+answer instead of interrupting and deletes it by writing ``{key: None}``.
+"""
+
+from __future__ import annotations
+
+from typing import Mapping
+
+
+def merge_answers(left: Mapping[str, str] | None, right: Mapping[str, str | None] | None) -> dict[str, str]:
+    """`left` updated with `right`; a ``None`` value removes the key."""
+    merged = dict(left or {})
+    for key, value in (right or {}).items():
+        if value is None:
+            merged.pop(key, None)
+        else:
+            merged[key] = value
+    return merged
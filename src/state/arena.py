@@ -0,0 +1,318 @@
+# src\state\arena.py
+
+"""
+Message arena for checkpoints: every message body is stored once.
+
+The same message object usually lives in several channels at once –
+`return_msg` appends its summary to `messages` *and* to `messagesColor` /
+`messagesSpeed`, handoffs copy messages between buffers – and every
+checkpoint used to serialise each buffer in full, duplicates included,
+again for every superstep that touched it.
+
+• `MessageArena` – content-addressed store: digest → serialised message,
+  in memory, or in SQLite behind a bounded LRU for durable savers.
+• `ArenaSerializer` – wraps a checkpointer's serde. Message lists (channel
+  values and pending writes) are written as a list of digests; messages
+  nested in anything else (checkpoint metadata carries each step's writes,
+  pending `Send`s carry agent inputs) become `MessageRef`s. The bodies go
+  to the arena once.
+
+Nodes are unaffected: channel values stay plain message lists and are
+rebuilt from the arena when a checkpoint is loaded.
+
+    from langgraph.checkpoint.memory import InMemorySaver
+    from state.arena import ArenaSerializer
+
+    graph = parent.compile(checkpointer=InMemorySaver(serde=ArenaSerializer()))
+
+Messages are treated as immutable once they are in a channel (as the
+reducer does); a message's digest is memoised per object.
+"""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import hashlib
+import importlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from langchain_core.messages import BaseMessage
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.types import Send
+from pydantic import BaseModel
+
+from helpers import metrics
+from helpers.sqlite_store import SQLiteTTLStore
+from logger.logger import getLogger
+from state.messages import MessageList, MessageView, _is_message_type
+
+logger = getLogger(__name__)
+
+ARENA_TYPE = "arena"
+
+# SQLite writes between two expiry / size-cap passes of a durable arena
+MAINTENANCE_EVERY = 100
+# with a ttl or cap, a body referenced again is re-written (pushing its expiry
+# out and making it the newest row) at most this often
+REFRESH_AFTER = 60.0
+
+
+# NamedTuples rather than dataclasses: JsonPlus encodes those without its
+# (slow) protocol checks, and there is one ref per message per checkpoint
+class MessageRef(NamedTuple):
+    """Placeholder for an interned message inside a serialised object."""
+
+    digest: str
+
+
+class ModelRef(NamedTuple):
+    """A pydantic model or dataclass (e.g. a state input) whose fields hold `MessageRef`s."""
+
+    module: str
+    name: str
+    fields: dict[str, Any]
+
+
+_SCALARS = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+class MessageArena:
+    """`digest -> (type, bytes)` store for serialised messages.
+
+    Without a path every body lives in memory. With one, SQLite holds the
+    bodies and memory only keeps the `cache_size` most recently used, so a
+    long-running server does not accumulate every message it ever saw.
+
+    A SQLite arena keeps every body unless `ttl` or `max_entries` is set;
+    then every `MAINTENANCE_EVERY` writes it drops bodies not referenced by
+    a checkpoint for `ttl` seconds and the least recently referenced ones
+    beyond `max_entries`. Both must cover the checkpointer's own retention –
+    loading a checkpoint whose bodies were dropped raises `KeyError`.
+
+    Args:
+        path: Optional SQLite file that keeps the bodies across restarts;
+            needed whenever the checkpointer itself is durable.
+        cache_size: Bodies kept in memory in front of the SQLite file.
+        ttl: Seconds a stored body outlives its last reference; ``None``
+            keeps it.
+        max_entries: Bodies kept in the SQLite file; ``None`` means unbounded.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        cache_size: int = 4096,
+        ttl: float | None = None,
+        max_entries: int | None = None,
+    ):
+        self._bodies: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._store = SQLiteTTLStore(path, table="message_arena", ttl=ttl) if path else None
+        self.cache_size = cache_size
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._retained = self._store is not None and (ttl is not None or max_entries is not None)
+        self._refresh_after = min(REFRESH_AFTER, ttl / 2) if ttl is not None else REFRESH_AFTER
+        # digest -> time of its last SQLite write, for the bodies in `_bodies`
+        self._written: dict[str, float] = {}
+        self._writes = 0
+
+    def _cache(self, digest: str, body: tuple[str, bytes]) -> None:
+        # caller holds the lock
+        self._bodies[digest] = body
+        if self._store is not None:
+            self._bodies.move_to_end(digest)
+            while len(self._bodies) > self.cache_size:
+                evicted, _ = self._bodies.popitem(last=False)
+                self._written.pop(evicted, None)
+
+    def _stale(self, digest: str) -> bool:
+        # caller holds the lock
+        return self._retained and time.monotonic() - self._written.get(digest, 0.0) >= self._refresh_after
+
+    def _stored(self, digest: str) -> tuple[str, bytes] | None:
+        stored = self._store.get(digest) if self._store is not None else None
+        if stored is None:
+            return None
+        type_, _, data = stored.partition(":")
+        return type_, base64.b64decode(data)
+
+    def _write(self, digest: str, body: tuple[str, bytes]) -> None:
+        self._store.set(digest, f"{body[0]}:{base64.b64encode(body[1]).decode()}")
+        with self._lock:
+            self._written[digest] = time.monotonic()
+            self._writes += 1
+            due = self._retained and self._writes % MAINTENANCE_EVERY == 0
+        if due:
+            self._maintain()
+
+    def _maintain(self) -> None:
+        purged = self._store.purge_expired()
+        trimmed = self._store.trim(self.max_entries) if self.max_entries is not None else 0
+        if purged or trimmed:
+            logger.debug("[arena] dropped %d expired and %d surplus bodies", purged, trimmed)
+
+    def put(self, digest: str, body: tuple[str, bytes]) -> bool:
+        """Store `body` under `digest`; False if it was already there."""
+        with self._lock:
+            cached = digest in self._bodies
+            if cached and self._store is not None:
+                self._bodies.move_to_end(digest)
+            if cached and not self._stale(digest):
+                return False
+        if self._store is None:
+            with self._lock:
+                self._cache(digest, body)
+            return True
+        known = cached or self._store.get(digest) is not None
+        if not known or self._retained:
+            # known bodies too: a fresh reference pushes their expiry out
+            self._write(digest, body)
+        with self._lock:
+            self._cache(digest, body)
+        return not known
+
+    def get(self, digest: str) -> tuple[str, bytes]:
+        with self._lock:
+            body = self._bodies.get(digest)
+            if body is not None and self._store is not None:
+                self._bodies.move_to_end(digest)
+        if body is None:
+            body = self._stored(digest)
+            if body is None:
+                raise KeyError(f"Message {digest} is missing from the arena.")
+            with self._lock:
+                self._cache(digest, body)
+        return body
+
+    def size(self) -> int:
+        """Number of distinct messages held in memory."""
+        return len(self._bodies)
+
+    def nbytes(self) -> int:
+        """Serialised size of the bodies held in memory."""
+        with self._lock:
+            return sum(len(data) for _, data in self._bodies.values())
+
+
+class ArenaSerializer(SerializerProtocol):
+    """Checkpoint serde that interns messages in a `MessageArena`.
+
+    Args:
+        inner: Serializer for everything that is not a message list, and
+            for the message bodies themselves. `JsonPlusSerializer` by default.
+        arena: Where the bodies go; a fresh in-memory arena by default.
+    """
+
+    def __init__(self, inner: SerializerProtocol | None = None, arena: MessageArena | None = None):
+        self.inner = inner or JsonPlusSerializer()
+        self.arena = arena or MessageArena()
+        # id(message) -> (weakref, message id, digest)
+        self._digests: dict[int, tuple[weakref.ref, str | None, str]] = {}
+        self._lock = threading.Lock()
+
+    # ── untyped API: delegated ─────────────────────────────────────────────
+    def dumps(self, obj: Any) -> bytes:
+        return self.inner.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self.inner.loads(data)
+
+    # ── typed API ──────────────────────────────────────────────────────────
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        shared = [0]
+        if isinstance(obj, (MessageView, MessageList)) or (
+            isinstance(obj, list) and obj and all(map(_is_message_type, set(map(type, obj))))
+        ):
+            # channel values: just the digests
+            data = ARENA_TYPE, " ".join(self._intern(m, shared) for m in obj).encode()
+        else:
+            swapped = self._swap(obj, shared)
+            if swapped is obj:
+                return self.inner.dumps_typed(obj)
+            type_, payload = self.inner.dumps_typed(swapped)
+            data = f"{ARENA_TYPE}+{type_}", payload
+        if shared[0]:
+            metrics.inc("arena_messages_shared_total", shared[0])
+        return data
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_ == ARENA_TYPE:
+            return [self._load(d.decode()) for d in payload.split()]
+        if type_.startswith(f"{ARENA_TYPE}+"):
+            return self._resolve(self.inner.loads_typed((type_[len(ARENA_TYPE) + 1:], payload)))
+        return self.inner.loads_typed(data)
+
+    def _load(self, digest: str) -> BaseMessage:
+        return self.inner.loads_typed(self.arena.get(digest))
+
+    def _swap(self, obj: Any, shared: list[int]) -> Any:
+        """`obj` with every nested message replaced by a `MessageRef`; `obj` itself if none."""
+        cls = type(obj)
+        if cls in _SCALARS:
+            return obj
+        if _is_message_type(cls):
+            return MessageRef(self._intern(obj, shared))
+        if isinstance(obj, dict):
+            items = {k: self._swap(v, shared) for k, v in obj.items()}
+            return obj if all(items[k] is v for k, v in obj.items()) else items
+        if isinstance(obj, (list, tuple, MessageView, MessageList)):
+            items = [self._swap(v, shared) for v in obj]
+            if isinstance(obj, (MessageView, MessageList)) or any(a is not b for a, b in zip(items, obj)):
+                return tuple(items) if isinstance(obj, tuple) else items
+            return obj
+        if isinstance(obj, Send):
+            arg = self._swap(obj.arg, shared)
+            return obj if arg is obj.arg else Send(obj.node, arg)
+        if isinstance(obj, BaseModel):
+            names = list(cls.model_fields)
+        elif dataclasses.is_dataclass(cls):
+            names = [f.name for f in dataclasses.fields(obj)]
+        else:
+            return obj
+        fields = {name: getattr(obj, name) for name in names}
+        swapped = self._swap(fields, shared)
+        return obj if swapped is fields else ModelRef(cls.__module__, cls.__name__, swapped)
+
+    def _resolve(self, obj: Any) -> Any:
+        if isinstance(obj, MessageRef):
+            return self._load(obj.digest)
+        if isinstance(obj, ModelRef):
+            cls = getattr(importlib.import_module(obj.module), obj.name)
+            return cls(**self._resolve(obj.fields))
+        if isinstance(obj, dict):
+            return {k: self._resolve(v) for k, v in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return type(obj)(self._resolve(v) for v in obj)
+        if isinstance(obj, Send):
+            return Send(obj.node, self._resolve(obj.arg))
+        return obj
+
+    def _intern(self, message: BaseMessage, shared: list[int]) -> str:
+        """Digest of `message`; counts it in `shared` unless its body is new."""
+        key = id(message)
+        memo = self._digests.get(key)
+        if memo is not None and memo[0]() is message and memo[1] == message.id:
+            shared[0] += 1
+            return memo[2]
+
+        body = self.inner.dumps_typed(message)
+        digest = hashlib.blake2b(body[0].encode() + b"\0" + body[1], digest_size=16).hexdigest()
+        if not self.arena.put(digest, body):
+            shared[0] += 1
+        with self._lock:
+            self._digests[key] = (
+                weakref.ref(message, lambda _, key=key: self._digests.pop(key, None)),
+                message.id,
+                digest,
+            )
+        return digest
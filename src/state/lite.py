@@ -0,0 +1,152 @@
+# src\state\lite.py
+
+"""
+Lightweight mirror of a Pydantic state schema.
+
+LangGraph rebuilds the state object on every node entry – including the
+one-line routers – and for a Pydantic schema that means validating every
+field, message lists included. `lite_schema` generates a `__slots__`
+dataclass with the same fields, reducers and defaults; building it is a
+plain `__init__` call.
+
+In lite mode validation moves to the boundaries:
+
+• graph input / output – `validate_state` nodes around the parent graph,
+  and `LiteStateGraph`, which rejects input keys the schema forbids before
+  LangGraph drops them;
+• `set_state` writes and structured extractions – they validate against
+  the full Pydantic schema, exactly as before.
+
+Enabled with `LITE_STATE=1`.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+from typing import Any, get_type_hints
+
+from pydantic import BaseModel, ValidationError
+from langgraph.graph import StateGraph
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.utils.runnable import RunnableCallable
+
+from state.messages import elided
+
+LITE_STATE = os.environ.get("LITE_STATE", "").strip().lower() in ("1", "true", "yes")
+
+
+def lite_schema(model: type[BaseModel]) -> type:
+    """Slots dataclass with the fields, annotations and defaults of `model`.
+
+    `Annotated` reducers are kept, so LangGraph builds the same channels.
+    The generated class points back to `model` via `__validation_schema__`.
+    """
+    hints = get_type_hints(model, include_extras=True)
+    fields = []
+    for name, info in model.model_fields.items():
+        if info.default_factory is not None:
+            default = dataclasses.field(default_factory=info.default_factory)
+        elif info.is_required():
+            default = dataclasses.field()
+        else:
+            default = dataclasses.field(default=info.default)
+        fields.append((name, hints[name], default))
+
+    def __repr__(self) -> str:
+        # same elision as the Pydantic model – tools repr their injected state
+        args = ", ".join(f"{f.name}={elided(getattr(self, f.name))!r}" for f in dataclasses.fields(self))
+        return f"{type(self).__name__}({args})"
+
+    # LangGraph's prebuilt agents treat every non-Pydantic state as a dict
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        setattr(self, key, value)
+
+    cls = dataclasses.make_dataclass(
+        f"{model.__name__}Lite",
+        fields,
+        namespace={
+            "__repr__": __repr__,
+            "__getitem__": __getitem__,
+            "__setitem__": __setitem__,
+            "__validation_schema__": model,
+        },
+        slots=True,
+        repr=False,
+    )
+    # importable next to `model` (checkpoint serde records module + name)
+    cls.__module__ = model.__module__
+    return cls
+
+
+def as_dict(state: Any) -> dict:
+    """Shallow `field → value` dict of a lite (dataclass) state."""
+    return {f.name: getattr(state, f.name) for f in dataclasses.fields(state)}
+
+
+def validate_state(schema: type, where: str) -> RunnableCallable:
+    """Node that validates the whole state against the full schema behind `schema`.
+
+    A no-op update on success; raises `pydantic.ValidationError` otherwise.
+    `where` only names the node ("input" / "output").
+    """
+    model = schema.__validation_schema__
+
+    def _validate(state: Any) -> dict:
+        model.model_validate(as_dict(state))
+        return {}
+
+    async def _avalidate(state: Any) -> dict:
+        return _validate(state)
+
+    return RunnableCallable(_validate, _avalidate, name=f"validate_{where}")
+
+
+def _check_input_keys(model: type[BaseModel], input: Any) -> None:
+    """Raise the model's own `extra_forbidden` errors for unknown keys of a dict input."""
+    if not isinstance(input, dict) or model.model_config.get("extra") != "forbid":
+        return
+    if unknown := [key for key in input if key not in model.model_fields]:
+        raise ValidationError.from_exception_data(
+            model.__name__,
+            [{"type": "extra_forbidden", "loc": (key,), "input": input[key]} for key in unknown],
+        )
+
+
+class _LiteCompiledGraph(CompiledStateGraph):
+    """Compiled lite graph that checks dict input keys against the full schema.
+
+    LangGraph drops input keys that are not channels before any node runs,
+    so `validate_state` never sees a misspelt one. `invoke` / `ainvoke` go
+    through `stream` / `astream`.
+    """
+
+    def stream(self, input: Any, config: Any = None, **kwargs: Any) -> Any:
+        _check_input_keys(self.builder.input.__validation_schema__, input)
+        return super().stream(input, config, **kwargs)
+
+    def astream(self, input: Any, config: Any = None, **kwargs: Any) -> Any:
+        _check_input_keys(self.builder.input.__validation_schema__, input)
+        return super().astream(input, config, **kwargs)
+
+
+class LiteStateGraph(StateGraph):
+    """`StateGraph` over a `lite_schema` class whose compiled graph rejects unknown input keys.
+
+    Applies the validation schema's own ``extra`` setting, so a Pydantic
+    schema with ``extra="forbid"`` raises `ValidationError` as it does when
+    it is built from the same dict.
+    """
+
+    def compile(self, *args: Any, **kwargs: Any) -> CompiledStateGraph:
+        compiled = super().compile(*args, **kwargs)
+        if not hasattr(self.input, "__validation_schema__"):
+            return compiled
+        # the same rebuild `Pregel.copy` does, into the checking subclass
+        return _LiteCompiledGraph(**compiled.__dict__)
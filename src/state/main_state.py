@@ -11,11 +11,14 @@ Switching from a TypedDict to a Pydantic model gives us
 
 from __future__ import annotations
 
-from typing import Annotated, List, Optional
+from typing import Annotated, Any, Dict, Iterator, List, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
 from langchain_core.messages import AnyMessage                # AnyMessage ⇢ serialises cleanly
-from langgraph.graph.message import add_messages
+
+from state.answers import merge_answers
+from state.lite import lite_schema
+from state.messages import elided, merge_messages
 
 
 class SharedState(BaseModel):
@@ -23,9 +26,9 @@ class SharedState(BaseModel):
     model_config = ConfigDict(extra="forbid")                  # reject unknown keys
 
     # ── conversation buffers ───────────────────────────────────────────────
-    messages: Annotated[List[AnyMessage], add_messages] = Field(default_factory=list)
-    messagesColor: Annotated[List[AnyMessage], add_messages] = Field(default_factory=list)
-    messagesSpeed: Annotated[List[AnyMessage], add_messages] = Field(default_factory=list)
+    messages: Annotated[List[AnyMessage], merge_messages] = Field(default_factory=list)
+    messagesColor: Annotated[List[AnyMessage], merge_messages] = Field(default_factory=list)
+    messagesSpeed: Annotated[List[AnyMessage], merge_messages] = Field(default_factory=list)
 
     # ── working memory ─────────────────────────────────────────────────────
     halfSentence: Optional[str] = None
@@ -33,5 +36,22 @@ class SharedState(BaseModel):
     speed:        Optional[str] = None
     fullSentence: Optional[str] = None
 
+    # ── batched questions ──────────────────────────────────────────────────
+    # question key → reply, from one combined interrupt (`helpers.questions`)
+    pending_answers: Annotated[Dict[str, str], merge_answers] = Field(default_factory=dict)
+
     # ── ReAct bookkeeping ──────────────────────────────────────────────────
     remaining_steps: int = 0
+
+    # Tools that inject the state get `str(tool_input)` called on every
+    # invocation (LangChain's on_tool_start), so a full repr would make each
+    # handoff / get_state / set_state O(total messages). Long buffers are
+    # shown as a count plus the newest message instead.
+    def __repr_args__(self) -> Iterator[tuple[str | None, Any]]:
+        for name, value in super().__repr_args__():
+            yield name, elided(value)
+
+
+# Same fields as a `__slots__` dataclass: no validation on node entry, see
+# `state.lite`. Used instead of `SharedState` when `LITE_STATE` is set.
+SharedStateLite = lite_schema(SharedState)
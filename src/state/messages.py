@@ -0,0 +1,280 @@
+# src\state\messages.py
+
+"""
+Message-list building blocks for the graph state.
+
+• `MessageView` – an immutable, structurally shared "prefix of an existing
+  history + a few extra messages". Fanning a supervisor turn out to N agents
+  used to slice and copy the whole history once per agent; a view costs O(1)
+  to build and shares the parent's list.
+• `elided` – short reprs for long buffers (state reprs end up in tool logs).
+• `MessageList` / `merge_messages` – the reducer for every message buffer.
+  Same semantics as LangGraph's `add_messages`, which converts and scans
+  the whole history on every merge (quadratic over a thread); the indexed
+  list keeps an id → position map and shares an append-only backing list
+  with the value it was merged from, so a merge only touches the new
+  messages.
+"""
+
+from __future__ import annotations
+
+import functools
+import operator
+import threading
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import chain, islice
+from typing import Any, Iterator
+
+from langchain_core.messages import (
+    BaseMessage,
+    BaseMessageChunk,
+    RemoveMessage,
+    convert_to_messages,
+    message_chunk_to_message,
+)
+from langgraph.graph.message import REMOVE_ALL_MESSAGES
+
+
+# lists longer than this are shown as a count plus the newest message
+_REPR_MESSAGES = 4
+
+
+class _ElidedMessages:
+    __slots__ = ("messages",)
+
+    def __init__(self, messages: Sequence):
+        self.messages = messages
+
+    def __repr__(self) -> str:
+        return f"[<{len(self.messages) - 1} earlier messages>, {self.messages[-1]!r}]"
+
+
+def elided(value: Any) -> Any:
+    """`value`, or a short stand-in for its repr if it is a long list."""
+    if isinstance(value, (list, MessageList)) and len(value) > _REPR_MESSAGES:
+        return _ElidedMessages(value)
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class MessageView(Sequence):
+    """Read-only `base[:stop] + tail` that never copies `base`.
+
+    `base` must not be mutated while the view is alive – LangGraph never
+    mutates channel values in place, it replaces them.
+    """
+
+    base: Sequence[BaseMessage]
+    stop: int
+    tail: tuple[BaseMessage, ...] = field(default=())
+
+    @classmethod
+    def of(cls, base: Sequence[BaseMessage], stop: int | None = None,
+           tail: Sequence[BaseMessage] = ()) -> "MessageView":
+        """View of `base[:stop] + tail`; nested views are flattened."""
+        stop = len(base) if stop is None else (stop if stop >= 0 else len(base) + stop)
+        if isinstance(base, MessageView) and stop <= base.stop:
+            base = base.base
+        elif isinstance(base, MessageView):
+            base = list(base)
+        return cls(base, max(0, min(stop, len(base))), tuple(tail))
+
+    def __len__(self) -> int:
+        return self.stop + len(self.tail)
+
+    def __iter__(self) -> Iterator[BaseMessage]:
+        return chain(islice(self.base, self.stop), self.tail)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("MessageView index out of range")
+        return self.base[index] if index < self.stop else self.tail[index - self.stop]
+
+    def __add__(self, other: Sequence[BaseMessage]) -> "MessageView":
+        return MessageView(self.base, self.stop, self.tail + tuple(other))
+
+    def __repr__(self) -> str:
+        return f"MessageView(<{self.stop} shared>, tail={list(self.tail)!r})"
+
+
+@functools.cache
+def _is_message_type(cls: type) -> bool:
+    # isinstance against the ABC-based message classes is slow; types are few
+    return issubclass(cls, BaseMessage) and not issubclass(cls, BaseMessageChunk)
+
+
+@functools.cache
+def _is_remove_type(cls: type) -> bool:
+    return issubclass(cls, RemoveMessage)
+
+
+class _Store:
+    """Append-only backing list shared by every `MessageList` grown from it."""
+
+    __slots__ = ("messages", "index", "lock")
+
+    def __init__(self, messages: list[BaseMessage]):
+        self.messages = messages
+        self.index = dict(zip((m.id for m in messages), range(len(messages))))
+        self.lock = threading.Lock()
+
+
+class MessageList(Sequence):
+    """An immutable message list that knows where each message id lives.
+
+    A list is a length over a shared, append-only `_Store`: appending to
+    the newest list derived from a store extends the store in place and
+    returns a longer list over it, so neither the messages nor the id →
+    position index are copied. Older lists keep their length and never see
+    the new messages. Appending to an older list (a fork) copies its prefix
+    into a store of its own; replacements and removals always build a new
+    store, so a store never changes below any list's length.
+    """
+
+    __slots__ = ("_store", "_len")
+
+    def __init__(self, messages: Sequence[BaseMessage] = ()):
+        self._store = _Store(list(messages))
+        self._len = len(self._store.messages)
+
+    @classmethod
+    def _over(cls, store: _Store, length: int) -> "MessageList":
+        merged = cls.__new__(cls)
+        merged._store, merged._len = store, length
+        return merged
+
+    def position(self, message_id: str) -> int | None:
+        """Index of the message with `message_id`, or None."""
+        pos = self._store.index.get(message_id)
+        if pos is not None and pos < self._len and self._store.messages[pos].id == message_id:
+            return pos
+        return None
+
+    def extended(self, messages: list[BaseMessage], ids: list[str]) -> "MessageList":
+        """This list plus `messages`, whose `ids` are new to it and unique."""
+        store = self._store
+        with store.lock:
+            if self._len == len(store.messages):
+                store.index.update(zip(ids, range(self._len, self._len + len(ids))))
+                store.messages.extend(messages)
+                return self._over(store, len(store.messages))
+        # a fork: later messages of the store belong to another list
+        return MessageList([*self, *messages])
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[BaseMessage]:
+        return islice(self._store.messages, self._len)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("MessageList index out of range")
+        return self._store.messages[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, MessageList, MessageView)):
+            return len(self) == len(other) and all(map(operator.eq, self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __add__(self, other: Sequence[BaseMessage]) -> list[BaseMessage]:
+        return [*self, *other]
+
+    def __radd__(self, other: Sequence[BaseMessage]) -> list[BaseMessage]:
+        return [*other, *self]
+
+    def __repr__(self) -> str:
+        return f"MessageList({list(self)!r})"
+
+    def _asdict(self) -> dict[str, list[BaseMessage]]:
+        # checkpoint serializers rebuild the list from this (the namedtuple
+        # protocol of LangGraph's JsonPlusSerializer); the store stays private
+        return {"messages": list(self)}
+
+    def __reduce__(self) -> Any:
+        return MessageList, (list(self),)
+
+
+def _as_messages(value: Any) -> tuple[list[BaseMessage], list[str], bool]:
+    """Coerce a reducer operand to identified messages, as `add_messages` does.
+
+    Returns the messages, their ids and whether any is a `RemoveMessage`.
+    """
+    if isinstance(value, (MessageView, MessageList)):
+        value = list(value)
+    elif not isinstance(value, list):
+        value = [value]
+    types = set(map(type, value))
+    if not all(map(_is_message_type, types)):
+        value = [message_chunk_to_message(m) for m in convert_to_messages(value)]
+        types = set(map(type, value))
+    ids = [m.id for m in value]
+    if None in ids:
+        for pos, message in enumerate(value):
+            if message.id is None:
+                message.id = ids[pos] = str(uuid.uuid4())
+    return value, ids, any(map(_is_remove_type, types))
+
+
+def merge_messages(left: Any, right: Any) -> MessageList:
+    """`add_messages` with an id index instead of per-merge conversion and scans.
+
+    Same semantics – append new ids, replace known ids in place, honour
+    `RemoveMessage` / `REMOVE_ALL_MESSAGES` – but `left` is a previous result
+    of this reducer, so it is neither re-converted nor re-indexed, and an
+    append extends its store: O(len(right)) per merge. Replacements and
+    removals copy `left` into a new list (channel values are never mutated
+    in place, `MessageView`s rely on that).
+    """
+    if not isinstance(left, MessageList):
+        left = MessageList(_as_messages(left)[0])
+    right, ids, removals = _as_messages(right)
+    if left and len(right) >= len(left) and all(map(operator.is_, left, right)):
+        # `right` re-sends the current value plus new messages (a subgraph
+        # returning its whole buffer) – only the tail needs merging
+        right, ids = right[len(left):], ids[len(left):]
+        removals = removals and any(map(_is_remove_type, map(type, right)))
+        if not right:
+            return left
+    if removals and REMOVE_ALL_MESSAGES in ids:
+        last = len(ids) - 1 - ids[::-1].index(REMOVE_ALL_MESSAGES)
+        return MessageList(right[last + 1:])
+
+    if not removals and len(set(ids)) == len(ids) and all(left.position(i) is None for i in ids):
+        # only new messages (the common case) – append in bulk
+        return left.extended(right, ids) if left else MessageList(right)
+
+    merged = list(left)
+    positions = {}
+    removed: set[str] = set()
+    for message in right:
+        pos = positions.get(message.id)
+        if pos is None:
+            pos = left.position(message.id)
+        if pos is None:
+            if isinstance(message, RemoveMessage):
+                raise ValueError(
+                    f"Attempting to delete a message with an ID that doesn't exist ('{message.id}')"
+                )
+            positions[message.id] = len(merged)
+            merged.append(message)
+        elif isinstance(message, RemoveMessage):
+            removed.add(message.id)
+        else:
+            removed.discard(message.id)
+            merged[pos] = message
+    if removed:
+        merged = [m for m in merged if m.id not in removed]
+    return MessageList(merged)
@@ -1,16 +1,42 @@
 # src\subgraph_speed.py
 import logging
 import pprint
+from functools import partial
+from typing import Literal
 from langgraph.graph import StateGraph, START, END
 from langgraph.prebuilt import ToolNode, tools_condition
-from langchain_openai import ChatOpenAI
+from langgraph.utils.runnable import RunnableCallable
+from langchain_core.caches import BaseCache
 from langchain_core.messages import SystemMessage, AIMessage
 
-from state.main_state import SharedState
+from helpers.collector import (
+    make_scripted_preamble,
+    make_structured_extractor,
+    route_after_extract,
+)
+from helpers import answer_memory, llm_cache
+from helpers.answer_memory import AnswerMemory
+from helpers.compaction import compact_history
+from helpers.models import DEFAULT_MODEL, get_bound_model
+from state.lite import LITE_STATE
+from state.main_state import SharedState, SharedStateLite
 from tools import make_set_state, make_ask_user, make_get_state
 
 logging.getLogger(__name__).setLevel(logging.DEBUG)
 
+# state fields this specialist is responsible for – the supervisor skips the
+# handoff entirely when they are already filled in
+OWNED_FIELDS = ("speed",)
+
+# prompt budget of one collector LLM call, see `helpers.compaction`
+HISTORY_TOKEN_BUDGET = 2000
+
+_QUESTION = "What speed should the car be?"
+
+# asked up front, together with the other specialists' questions, when
+# `BATCH_QUESTIONS` is on – see `helpers.questions`
+QUESTIONS = {"speed": _QUESTION}
+
 _SYSTEM_PROMPT = (
     "You are a car-speed expert.\n"
     "First call the `get_state` tool with {\"key\": \"speed\"} to see if a "
@@ -22,21 +48,61 @@ _SYSTEM_PROMPT = (
     "  {\"key\": \"speed\", \"value\": \"<their answer>\"}"
 )
 
-ask_user_speed = make_ask_user("messagesSpeed")
+ask_user_speed = make_ask_user(
+    "messagesSpeed", answer_key="speed", memory=answer_memory.from_env(),
+)
 set_speed_state = make_set_state("messagesSpeed", state_schema=SharedState)
 get_state_speed = make_get_state(state_schema=SharedState)
 
-def ask_for_speed(state: SharedState):
+def ask_for_speed(
+    state: SharedState,
+    *,
+    cache: BaseCache | None = None,
+    history_token_budget: int | None = None,
+    model: str = DEFAULT_MODEL,
+):
     """LLM node that asks the speed specialist to pick a word and call the tool."""
     logging.debug("[speed_agent.ask_for_speed] entry state: %r", state)
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0).bind_tools([set_speed_state, ask_user_speed, get_state_speed])
-    messages = [SystemMessage(content=_SYSTEM_PROMPT)] + state.messagesSpeed
+    llm = get_bound_model(
+        [set_speed_state, ask_user_speed, get_state_speed],
+        model, temperature=0, cache=cache, single_flight=True,
+    )
+    messages = compact_history(
+        state.messagesSpeed,
+        history_token_budget,
+        prefix=[SystemMessage(content=_SYSTEM_PROMPT)],
+        agent="speed_agent",
+    )
 
     ai: AIMessage = llm.invoke(messages)
     ai.name = "speed_agent"
     logging.debug("[speed_agent.ask_for_speed] LLM returned: %r", ai)
     return {"messagesSpeed": [ai]}
 
+async def aask_for_speed(
+    state: SharedState,
+    *,
+    cache: BaseCache | None = None,
+    history_token_budget: int | None = None,
+    model: str = DEFAULT_MODEL,
+):
+    """Async twin of `ask_for_speed` – awaits the model instead of blocking the loop."""
+    logging.debug("[speed_agent.aask_for_speed] entry state: %r", state)
+    llm = get_bound_model(
+        [set_speed_state, ask_user_speed, get_state_speed],
+        model, temperature=0, cache=cache, single_flight=True,
+    )
+    messages = compact_history(
+        state.messagesSpeed,
+        history_token_budget,
+        prefix=[SystemMessage(content=_SYSTEM_PROMPT)],
+        agent="speed_agent",
+    )
+    ai: AIMessage = await llm.ainvoke(messages)
+    ai.name = "speed_agent"
+    logging.debug("[speed_agent.aask_for_speed] LLM returned: %r", ai)
+    return {"messagesSpeed": [ai]}
+
 
 def return_msg(state: SharedState):
     """Once the adjective has been stored, inform the supervisor thread."""
@@ -68,21 +134,107 @@ def make_tools_router(messages_key: str = "messages"):
                                  messages_key = messages_key)
         logging.debug("[router:%s] tools_condition → %s", messages_key, branch)
         return branch
-    return _router
+
+    async def _arouter(state: SharedState):
+        # pure in-memory check – the async twin only keeps the loop path explicit
+        return _router(state)
+
+    return RunnableCallable(_router, _arouter)
 
 
 # ── build the mini‑graph ─────────────────────────────────────────
-builder = StateGraph(SharedState)
-builder.add_node("llm", ask_for_speed)
-builder.add_node("tools", ToolNode([get_state_speed, set_speed_state, ask_user_speed], messages_key="messagesSpeed"))
-builder.add_node("returnMsg", return_msg)
-
-builder.add_edge(START, "llm")
-builder.add_edge("tools", "llm")
-builder.add_conditional_edges("llm",
-    make_tools_router("messagesSpeed"),
-    {"tools": "tools", END: "returnMsg"},
+def build_speed_agent(
+    *,
+    scripted_preamble: bool = False,
+    mode: Literal["tools", "structured"] = "tools",
+    cache: BaseCache | None = None,
+    history_token_budget: int | None = None,
+    lite_state: bool = False,
+    memory: AnswerMemory | None = None,
+    model: str = DEFAULT_MODEL,
+):
+    """Compile the speed collector.
+
+    Parameters
+    ----------
+    scripted_preamble : bool
+        Replay the prompt's mandatory first `get_state` call (and its real
+        result) into `messagesSpeed` instead of asking the LLM for it. Tools mode only.
+    mode : "tools" | "structured"
+        ``"tools"`` runs the get → ask → set loop through the ToolNode.
+        ``"structured"`` asks the user once and extracts the speed with a
+        single structured-output call; the tool loop only runs when that
+        answer does not validate.
+    cache : BaseCache | None
+        Response cache for this collector's LLM calls (see
+        `helpers.llm_cache`); ``None`` always calls the model.
+    history_token_budget : int | None
+        Compact `messagesSpeed` to about this many tokens before each LLM call
+        (see `helpers.compaction`); ``None`` sends the full thread.
+    lite_state : bool
+        Run on `SharedStateLite` – no validation on node entry; `set_state`
+        and the structured extractor still validate against `SharedState`.
+    memory : AnswerMemory | None
+        Cross-thread answer memory for the structured extractor (see
+        `helpers.answer_memory`); the `ask_user` tool uses the process-wide one.
+    model : str
+        Registry name of the chat model for every LLM call of this collector
+        (see `helpers.models.register_chat_model` – e.g. a `FakeChatModel`).
+    """
+    if mode not in ("tools", "structured"):
+        raise ValueError(f"Unknown mode '{mode}', expected 'tools' or 'structured'.")
+    if mode == "structured" and scripted_preamble:
+        raise ValueError("scripted_preamble only applies to mode='tools'; the structured extractor starts the graph.")
+    builder = StateGraph(SharedStateLite if lite_state else SharedState)
+    builder.add_node(
+        "llm",
+        RunnableCallable(
+            partial(ask_for_speed, cache=cache, history_token_budget=history_token_budget, model=model),
+            partial(aask_for_speed, cache=cache, history_token_budget=history_token_budget, model=model),
+            name="ask_for_speed",
+        ),
+    )
+    builder.add_node("tools", ToolNode([get_state_speed, set_speed_state, ask_user_speed], messages_key="messagesSpeed"))
+    builder.add_node("returnMsg", return_msg)
+
+    if mode == "structured":
+        builder.add_node(
+            "extract",
+            make_structured_extractor(
+                "speed", _QUESTION, "messagesSpeed", "speed_agent", SharedState,
+                answer_key="speed", memory=memory,
+                model=model, temperature=0, cache=cache, single_flight=True,
+            ),
+        )
+        builder.add_edge(START, "extract")
+        builder.add_conditional_edges(
+            "extract",
+            route_after_extract("speed", done="returnMsg", fallback="llm"),
+            ["returnMsg", "llm"],
+        )
+    elif scripted_preamble:
+        builder.add_node(
+            "preamble",
+            make_scripted_preamble(get_state_speed, "speed", "messagesSpeed", "speed_agent"),
+        )
+        builder.add_edge(START, "preamble")
+        builder.add_edge("preamble", "llm")
+    else:
+        builder.add_edge(START, "llm")
+    builder.add_edge("tools", "llm")
+    builder.add_conditional_edges("llm",
+        make_tools_router("messagesSpeed"),
+        {"tools": "tools", END: "returnMsg"},
+    )
+    builder.add_edge("returnMsg", END)
+
+    return builder.compile(name="speed_agent")
+
+
+speed_agent = build_speed_agent(
+    scripted_preamble=True,
+    cache=llm_cache.from_env(),
+    history_token_budget=HISTORY_TOKEN_BUDGET,
+    lite_state=LITE_STATE,
+    memory=answer_memory.from_env(),
 )
-builder.add_edge("returnMsg", END)
-
-speed_agent = builder.compile(name="speed_agent")
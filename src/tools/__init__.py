@@ -1,10 +1,12 @@
 # graph\src\tools\__init__.py
-from .get_state import make_get_state
-from .set_state import make_set_state
+from .get_state import make_get_state, make_get_state_batch
+from .set_state import make_set_state, make_set_state_batch
 from .ask_user import make_ask_user
 
 __all__ = [
     "make_get_state",
+    "make_get_state_batch",
     "make_ask_user",
     "make_set_state",
+    "make_set_state_batch",
 ]
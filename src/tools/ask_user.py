@@ -1,17 +1,25 @@
 # graph\src\tools\ask_user.py
-from typing import Annotated, Any
+from typing import Annotated, Any, Optional
 
 from langchain_core.messages import ToolMessage, AIMessage
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool, InjectedToolCallId
+from langgraph.prebuilt import InjectedState
 from langgraph.types import Command, interrupt
 
 from src.logger.logger import getLogger
 
+from helpers import answer_memory
+from helpers.answer_memory import AnswerMemory
+
 logger = getLogger(__name__)
 
+
 def make_ask_user(
     msg_key: str | None = None,
     name: str | None = None,
+    answer_key: str | None = None,
+    memory: AnswerMemory | None = None,
 ):
     """
     Create a pause-and-ask tool.
@@ -23,12 +31,21 @@ def make_ask_user(
         (e.g. ``"messagesColor"``).
     name : str, optional
         Public name shown to the LLM.
+    answer_key : str, optional
+        Key of this agent's question in ``state.pending_answers`` (see
+        `helpers.questions`). When a batched answer is waiting there, the
+        tool returns it – and removes it – instead of interrupting. The
+        state schema must then have a ``pending_answers`` field.
+    memory : AnswerMemory, optional
+        Cross-thread answer store (see `helpers.answer_memory`). A fresh
+        answer the same user (``configurable.user_id``) gave before is
+        returned without interrupting; new replies are remembered. Keyed on
+        ``answer_key``, or on the question text without one. Only checked
+        before interrupting – on resume the human's reply is used.
 
     """
     tool_name = name or "ask_user"
-    @tool(
-        tool_name,
-        description=(
+    description = (
         """Ask the human user a specific question and return their response.
 
         Use this tool whenever you need to collect new information from the user.
@@ -40,11 +57,13 @@ def make_ask_user(
         Returns:
             The user's answer as raw text.
         """
-        ),
     )
+
+    @tool(tool_name, description=description)
     def _ask_user_impl(
         prompt: str,
         tool_call_id: Annotated[str, InjectedToolCallId],
+        config: RunnableConfig,
         state: Any | None = None,          # injected automatically
     ) -> Command:
         # 1️ Guard/validate
@@ -73,10 +92,21 @@ def make_ask_user(
                 thread = getattr(state, actual_msg_key)
             thread.append(AIMessage(content=prompt, name="assistant"))
 
-        logger.info("[ask_user] prompt=%r  msg_key=%s", prompt, actual_msg_key)
-        user_reply = interrupt(prompt)
+        # 3️  Answered before, in another thread? Otherwise ask the human
+        user = answer_memory.user_of(config) if memory is not None else None
+        key = answer_key or answer_memory.question_key(prompt)
+        user_reply = memory.get(user, key) if user is not None and not answer_memory.resuming(config) else None
+        if user_reply is not None:
+            logger.info("[ask_user] prompt=%r  remembered answer for %r", prompt, key)
+            answer_memory.record(key, hit=True)
+        else:
+            logger.info("[ask_user] prompt=%r  msg_key=%s", prompt, actual_msg_key)
+            user_reply = interrupt(prompt)
+            if user is not None and isinstance(user_reply, str):
+                answer_memory.record(key, hit=False)
+                memory.put(user, key, user_reply)
 
-        # 3️  Return a ToolMessage
+        # 4️  Return a ToolMessage
         return Command(
             update={
                 actual_msg_key: [
@@ -89,4 +119,34 @@ def make_ask_user(
             }
         )
 
-    return _ask_user_impl
\ No newline at end of file
+    if answer_key is None:
+        return _ask_user_impl
+
+    @tool(tool_name, description=description)
+    def _ask_user_batched(
+        prompt: str,
+        tool_call_id: Annotated[str, InjectedToolCallId],
+        config: RunnableConfig,
+        pending_answers: Annotated[Optional[dict], InjectedState("pending_answers")] = None,
+    ) -> Command:
+        answer = (pending_answers or {}).get(answer_key)
+        if answer is None or not isinstance(prompt, str):
+            return _ask_user_impl.func(prompt, tool_call_id, config)
+
+        # answered up front through the combined form – no interrupt
+        actual_msg_key = msg_key or "messages"
+        logger.info("[ask_user] prompt=%r  batched answer for %r", prompt, answer_key)
+        return Command(
+            update={
+                actual_msg_key: [
+                    ToolMessage(
+                        name=tool_name,
+                        tool_call_id=tool_call_id,
+                        content=answer,
+                    )
+                ],
+                "pending_answers": {answer_key: None},
+            }
+        )
+
+    return _ask_user_batched
\ No newline at end of file
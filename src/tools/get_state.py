@@ -1,11 +1,15 @@
 # graph\src\tools\get_state.py
-from typing import Annotated, Any, Type
+import json
+from typing import Annotated, Any, Mapping, Sequence, Type
 from pydantic import BaseModel
 
+from langchain_core.messages import BaseMessage
 from langchain_core.tools import tool
 from langgraph.prebuilt     import InjectedState
 from src.logger.logger import getLogger
 
+from helpers.handoff import SKIP_DUMP
+
 logger = getLogger(__name__)
 
 def make_get_state(
@@ -57,7 +61,7 @@ def make_get_state(
     )
     def _get_state(
         key: str,
-        state: Annotated[Any, InjectedState],    # concrete class injected at run time
+        state: Annotated[Any, InjectedState, SKIP_DUMP],    # concrete class injected at run time
     ) -> str:
         # ---- runtime validation -------------------------------------------
         if not isinstance(key, str):
@@ -68,4 +72,125 @@ def make_get_state(
         logger.info("[get_state] key=%r  value=%r", key, value)
         return value
 
-    return _get_state
\ No newline at end of file
+    return _get_state
+
+
+def _clip(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}… (+{len(text) - max_chars} chars)"
+
+
+def _project(value: Any, max_chars: int, max_messages: int) -> Any:
+    """JSON-ready, size-bounded stand-in for one state value."""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return _clip(value, max_chars)
+    if isinstance(value, Sequence) and value and isinstance(value[-1], BaseMessage):
+        # message buffers: a count plus the newest few, contents clipped
+        last = [value[i] for i in range(max(0, len(value) - max_messages), len(value))]
+        return {
+            "count": len(value),
+            "last": [
+                {"type": m.type, **({"name": m.name} if m.name else {}),
+                 "content": _clip(m.text(), max_chars)}
+                for m in last
+            ],
+        }
+    if isinstance(value, BaseModel):
+        value = dict(value)
+    if isinstance(value, Mapping):
+        return {str(k): _project(v, max_chars, max_messages) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_project(v, max_chars, max_messages) for v in value]
+    return _clip(str(value), max_chars)
+
+
+def make_get_state_batch(
+    state_schema: Type[BaseModel] | None = None,
+    name: str | None = None,
+    max_chars: int = 500,
+    max_messages: int = 3,
+):
+    """
+    Batch twin of `make_get_state`: several keys in one call, as compact JSON.
+
+    Opt-in: meant for agents that read several fields per turn. The car
+    specialists read one field each and keep `make_get_state`.
+
+    Parameters
+    ----------
+    state_schema : pydantic.BaseModel **required**
+        Schema used for field existence checks.
+    name : str, optional
+        Public name of the tool. Defaults to **"get_state_batch"**.
+    max_chars : int, optional
+        Longer strings (and message contents) are clipped to this many
+        characters. Defaults to 500.
+    max_messages : int, optional
+        Message lists are returned as their length plus the newest
+        `max_messages` messages. Defaults to 3.
+    """
+
+    # ---- build-time guard --------------------------------------------------
+    if state_schema is None:
+        logger.critical(
+            "[get_state_batch] No state_schema provided – aborting build."
+        )
+        raise ValueError(
+            "make_get_state_batch(...) requires a `state_schema` argument."
+        )
+
+    tool_name = name or "get_state_batch"
+    fields = frozenset(state_schema.model_fields)
+
+    @tool(
+        tool_name,
+        description=(
+            f"""Read several values from the state (short-term memory) in one call.
+
+            Arguments
+            ---------
+            keys : list[str]
+                The entries you want to inspect (e.g. ``["color", "speed"]``).
+
+            Returns
+            -------
+            str  – a JSON object ``{{key: value}}``. Absent values are ``null``;
+            strings longer than {max_chars} characters are clipped, also inside
+            lists and objects; message lists are shown as
+            ``{{"count": n, "last": [...]}}`` with the newest {max_messages}
+            messages. Unknown keys are listed under ``"unknown_keys"``.
+
+            Notes
+            -----
+            • **Read-only** – this tool never mutates state.
+            • Prefer this over repeated `get_state` calls when you need several fields.
+            """
+        ),
+    )
+    def _get_state_batch(
+        keys: list[str],
+        state: Annotated[Any, InjectedState, SKIP_DUMP],    # concrete class injected at run time
+    ) -> str:
+        # ---- runtime validation -------------------------------------------
+        if not isinstance(keys, list) or not all(isinstance(k, str) for k in keys):
+            logger.error("[get_state_batch] keys must be a list of str, got %r", keys)
+            return "ERROR: ‘keys’ argument must be a list of strings."
+
+        projection: dict[str, Any] = {}
+        unknown = []
+        for key in dict.fromkeys(keys):
+            if key in fields:
+                projection[key] = _project(getattr(state, key, None), max_chars, max_messages)
+            else:
+                unknown.append(key)
+        if unknown:
+            projection["unknown_keys"] = unknown
+
+        result = json.dumps(projection, ensure_ascii=False, separators=(",", ":"), default=str)
+        logger.info("[get_state_batch] keys=%r  %d chars", keys, len(result))
+        return result
+
+    return _get_state_batch
@@ -1,8 +1,8 @@
 # src\tools\set_state.py
 from __future__ import annotations
 
-from typing import Annotated, Type, get_type_hints
-from pydantic import BaseModel, ValidationError
+from typing import Annotated, Any, Callable, Type, get_type_hints
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from langchain_core.messages import ToolMessage
 from langchain_core.tools import tool, InjectedToolCallId
@@ -13,6 +13,42 @@ from src.logger.logger import getLogger
 logger = getLogger(__name__)
 
 
+def _field_validators(state_schema: Type[BaseModel]) -> dict[str, Callable[[Any], Any]]:
+    """
+    ``field -> validate(value)`` for every field of `state_schema`, built once.
+
+    Each field gets its own ``TypeAdapter``, so one write validates one value
+    instead of the whole model. Fields with ``@field_validator``s – or all of
+    them, if the schema has model-level validators – keep validating through
+    ``state_schema.model_validate`` so those hooks still run.
+    """
+    hints = get_type_hints(state_schema, include_extras=True)
+    decorators = state_schema.__pydantic_decorators__
+    hooked = {
+        field
+        for dec in decorators.field_validators.values()
+        for field in dec.info.fields
+    }
+    if decorators.model_validators or "*" in hooked:
+        hooked = set(state_schema.model_fields)
+
+    def _via_model(key: str) -> Callable[[Any], Any]:
+        def _validate(value: Any) -> Any:
+            return getattr(state_schema.model_validate({key: value}), key)
+        return _validate
+
+    return {
+        key: _via_model(key) if key in hooked else TypeAdapter(hints[key]).validate_python
+        for key in state_schema.model_fields
+    }
+
+
+def _tool_message(content: str, name: str, tool_call_id: str, msg_key: str) -> Command:
+    return Command(
+        update={msg_key: [ToolMessage(content=content, name=name, tool_call_id=tool_call_id)]}
+    )
+
+
 def make_set_state(
     msg_key: str | None = None,
     name: str | None = None,
@@ -30,10 +66,6 @@ def make_set_state(
         during build so runtime never crashes.
     """
 
-    def _validated_kv(key: str, value: str) -> dict[str, str]:
-        state_schema.model_validate({key: value})
-        return {key: value}
-
     # ---- build-time guard --------------------------------------------------
     if state_schema is None:
         logger.critical("[set_state] No state_schema provided – aborting build.")
@@ -41,6 +73,11 @@ def make_set_state(
             "make_set_state(...) requires a `state_schema` argument."
         )
 
+    validators = _field_validators(state_schema)
+
+    def _validated_kv(key: str, value: str) -> dict[str, Any]:
+        return {key: validators[key](value)}
+
     tool_name      = name or "set_state"
     target_msg_key = msg_key or "messages"
 
@@ -103,7 +140,7 @@ def make_set_state(
                 }
             )
 
-        if key not in get_type_hints(state_schema):
+        if key not in validators:
             logger.error("[set_state] Unknown state field: %s", key)
             return Command(
                 update={
@@ -155,4 +192,114 @@ def make_set_state(
                 }
             )
 
-    return _set_state
\ No newline at end of file
+    return _set_state
+
+def make_set_state_batch(
+    msg_key: str | None = None,
+    name: str | None = None,
+    state_schema: Type[BaseModel] | None = None,
+):
+    """
+    Batch twin of `make_set_state`: several keys in one tool call.
+
+    Every ``(key, value)`` pair is validated before anything is written – the
+    update is all-or-nothing, and a rejected batch reports every bad key at
+    once so the agent can fix them in a single retry. Opt-in: meant for
+    agents that collect several fields; the car specialists write one field
+    each and keep `make_set_state`.
+
+    Parameters
+    ----------
+    msg_key : str, optional
+        Where the resulting ToolMessage should be appended. Defaults to "messages".
+    name : str, optional
+        Public name exposed to the LLM. Defaults to **"set_state_batch"**.
+    state_schema : pydantic.BaseModel **required**
+        Schema used for validation.  **Must** be provided; absence raises
+        during build so runtime never crashes.
+    """
+
+    # ---- build-time guard --------------------------------------------------
+    if state_schema is None:
+        logger.critical("[set_state_batch] No state_schema provided – aborting build.")
+        raise ValueError(
+            "make_set_state_batch(...) requires a `state_schema` argument."
+        )
+
+    validators = _field_validators(state_schema)
+    tool_name      = name or "set_state_batch"
+    target_msg_key = msg_key or "messages"
+
+    @tool(
+        tool_name,
+        description=(
+            """Write several values in the shared state in one call.
+
+            Arguments
+            ---------
+            values : dict[str, str]
+                Field → value pairs (e.g. ``{"color": "red", "speed": "fast"}``).
+                **Existing values at these keys are replaced.**
+
+            Returns
+            -------
+            • On success: one confirmation message listing the updated keys.
+            • On any error: an *ERROR* message per bad key and **nothing is
+              written** – fix the listed keys and resend the whole batch.
+
+            Notes
+            -----
+            • **Destructive** – prior values at the given keys are lost.
+            • Prefer this over repeated `set_state` calls when several fields are known.
+            """
+        ),
+    )
+    def _set_state_batch(
+        values: dict[str, str],
+        tool_call_id: Annotated[str, InjectedToolCallId],
+    ) -> Command:
+
+        # ---- runtime validation -------------------------------------------
+        if not isinstance(values, dict) or not values:
+            logger.error("[set_state_batch] values must be a non-empty dict, got %r", values)
+            return _tool_message(
+                "ERROR: ‘values’ must be a non-empty object of key → value.",
+                tool_name, tool_call_id, target_msg_key,
+            )
+
+        update: dict[str, Any] = {}
+        errors: list[str] = []
+        for key, value in values.items():
+            if key not in validators:
+                errors.append(f"'{key}' is not a valid field in the state.")
+            elif not isinstance(value, str):
+                errors.append(f"'{key}': value must be a string.")
+            else:
+                try:
+                    update[key] = validators[key](value)
+                except ValidationError as err:
+                    errors.append(f"'{key}': {err.errors()[0]['msg']}")
+
+        if errors:
+            # all-or-nothing: a partial write would leave the agent guessing
+            logger.warning("[set_state_batch] rejected %s: %s", list(values), errors)
+            return _tool_message(
+                "ERROR: nothing was written.\n" + "\n".join(f"• {e}" for e in errors),
+                tool_name, tool_call_id, target_msg_key,
+            )
+
+        logger.info(
+            "[set_state_batch] SUCCESS  %s  (msg_key=%s)",
+            ", ".join(f"{k} ← {v}" for k, v in update.items()),
+            target_msg_key,
+        )
+        update[target_msg_key] = [
+            ToolMessage(
+                content=f"{', '.join(values)} updated.",
+                name=tool_name,
+                tool_call_id=tool_call_id,
+            )
+        ]
+        return Command(update=update)
+
+    return _set_state_batch